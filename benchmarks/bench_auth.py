@@ -0,0 +1,90 @@
+"""
+Benchmark: custo da autenticação por requisição (valid_access_token).
+
+Compara, num banco sqlite em memória com N clientes:
+- db: UUID consultado em CustomerAuth a cada chamada (cache desativado)
+- db + cache: UUID resolvido pelo AccessTokenCache
+- signed: token HMAC verificado em CPU, usuário carregado do banco
+- signed + cache: token HMAC verificado em CPU, usuário do UserCache
+
+Uso:
+    poetry run python benchmarks/bench_auth.py [--users 1000] [--requests 20000]
+"""
+import sys
+import os
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tortoise import Tortoise
+from src import authentication
+from src.auth_cache import AccessTokenCache, UserCache
+from src.invalidation import InvalidationBus
+from src.models import Customer, CustomerAuth, Seller, Store
+from src.tokens import TokenSigner
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Custo da autenticação por requisição")
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--requests', type=int, default=20000)
+    return parser.parse_args()
+
+
+async def setup(users: int, signer: TokenSigner):
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["src.models"]})
+    await Tortoise.generate_schemas()
+    seller = await Seller.create(name="Vendedor", email="bench@magic.com", password="x")
+    store = await Store.create(name="Loja", seller=seller, credential=uuid.uuid4().hex)
+    await Customer.bulk_create([
+        Customer(store=store, name=f"Cliente {i}", email=f"cliente{i}@magic.com", password="x")
+        for i in range(users)
+    ])
+    customers = await Customer.all()
+    uuid_tokens = [str(uuid.uuid4()) for _ in customers]
+    await CustomerAuth.bulk_create([
+        CustomerAuth(customer=customer, access_token=token)
+        for customer, token in zip(customers, uuid_tokens)
+    ])
+    signed_tokens = [signer.issue('customer', customer.id, store.id, customer.token_epoch) for customer in customers]
+    return uuid_tokens, signed_tokens
+
+
+async def measure(tokens: list, requests: int) -> float:
+    rng = random.Random(42)
+    headers = [f"Bearer {rng.choice(tokens)}" for _ in range(requests)]
+    started = time.perf_counter()
+    for header in headers:
+        await authentication.valid_access_token(header, CustomerAuth)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def main():
+    args = parse_args()
+    signer = TokenSigner("segredo-do-benchmark")
+    uuid_tokens, signed_tokens = await setup(args.users, signer)
+    authentication.token_signer = signer
+
+    scenarios = (
+        ("db", uuid_tokens, 0),
+        ("db + cache", uuid_tokens, 60),
+        ("signed", signed_tokens, 0),
+        ("signed + cache", signed_tokens, 60),
+    )
+    print(f"{args.users} clientes, {args.requests} requisições\n")
+    print(f"{'modo':<16} {'µs/req':>10}")
+    for name, tokens, ttl in scenarios:
+        bus = InvalidationBus()
+        authentication.access_token_cache = AccessTokenCache(ttl=ttl, bus=bus)
+        authentication.user_cache = UserCache(ttl=ttl, bus=bus)
+        print(f"{name:<16} {await measure(tokens, args.requests):>10.1f}")
+
+    await Tortoise.close_connections()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""
+Benchmark: vazão de login (POST /sellers/auth) sob concorrência por custo do
+scrypt, para escolher PASSWORD_SCRYPT_N e PASSWORD_HASH_WORKERS.
+
+Mede logins/s, latência p50/p95 e o maior atraso do event loop durante a carga
+(o hashing roda no pool de threads, então o atraso deve ficar perto de zero).
+App em processo (httpx.ASGITransport) com sqlite em memória.
+
+Uso:
+    poetry run python benchmarks/bench_login.py [--costs 12,14,15] [--logins 200] [--concurrency 32] [--workers 4]
+"""
+import sys
+import os
+import argparse
+import asyncio
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from asgi_lifespan import LifespanManager
+from src import utils
+from src.application import create_application
+from src.models import Seller
+from src.passwords import PASSWORD_HASH_WORKERS, PasswordHasher
+
+EMAIL = "bench@magic.com"
+PASSWORD = "123456"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Vazão de login por custo do scrypt")
+    parser.add_argument('--costs', default='12,14,15', help="expoentes de N (N = 2**custo)")
+    parser.add_argument('--logins', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--workers', type=int, default=PASSWORD_HASH_WORKERS)
+    return parser.parse_args()
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def run(client: httpx.AsyncClient, logins: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    max_lag = 0.0
+    running = True
+
+    async def monitor():
+        nonlocal max_lag
+        while running:
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            max_lag = max(max_lag, time.perf_counter() - started - 0.005)
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post("/sellers/auth", json={"email": EMAIL, "password": PASSWORD})
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    monitor_task = asyncio.create_task(monitor())
+    started = time.perf_counter()
+    await asyncio.gather(*[one() for _ in range(logins)])
+    elapsed = time.perf_counter() - started
+    running = False
+    await monitor_task
+    return {
+        'throughput': logins / elapsed,
+        'p50': percentile(latencies, 0.50) * 1000,
+        'p95': percentile(latencies, 0.95) * 1000,
+        'max_lag': max_lag * 1000,
+    }
+
+
+async def main():
+    args = parse_args()
+    app = create_application(fake_db=True)
+    async with LifespanManager(app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            await client.post("/sellers/", json={"name": "Bench", "email": EMAIL, "password": PASSWORD})
+
+            print(f"{args.logins} logins, concorrência {args.concurrency}, {args.workers} workers de hash\n")
+            print(f"{'N':>8} {'logins/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'lag máx ms':>11}")
+            for cost in (int(value) for value in args.costs.split(',')):
+                hasher = PasswordHasher(n=2 ** cost, workers=args.workers)
+                utils.password_hasher = hasher
+                await Seller.filter(email=EMAIL).update(password=await hasher.hash(PASSWORD))
+                result = await run(client, args.logins, args.concurrency)
+                hasher.shutdown()
+                print(f"{2 ** cost:>8} {result['throughput']:>10.1f} {result['p50']:>9.1f} "
+                      f"{result['p95']:>9.1f} {result['max_lag']:>11.1f}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""
+Teste de carga do MariaApi contra o stand-in da Maria API.
+
+Dispara N requisições concorrentes de /parks/{code}/products para um conjunto
+de datas (as mais próximas são as mais pedidas) e compara, com e sem o
+MariaResponseCache, quantas chamadas chegam ao upstream e a latência
+p50/p95/p99 vista pelo cliente.
+
+Por padrão o stand-in roda no mesmo processo (httpx.ASGITransport). Para medir
+também o pool de conexões/HTTP2, suba o stand-in em outro processo e passe a URL:
+
+    poetry run python scripts/maria_standin.py --latency lognormal:4:0.5 --error-rate 0.01
+    poetry run python benchmarks/bench_maria_load.py --endpoint http://127.0.0.1:8100
+
+Uso:
+    poetry run python benchmarks/bench_maria_load.py [--requests 2000] [--concurrency 200]
+"""
+import sys
+import os
+import argparse
+import asyncio
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from scripts.maria_standin import FaultProfile, StandinCatalog, create_standin_app
+from src.integrations.maria_api.cache import MariaResponseCache
+from src.integrations.maria_api.maria import MariaApi
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Carga no MariaApi contra o stand-in")
+    parser.add_argument('--endpoint', help="URL de um stand-in já em execução")
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--dates', type=int, default=30)
+    parser.add_argument('--products', type=int, default=200)
+    parser.add_argument('--latency', default='lognormal:4:0.5')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    return parser.parse_args()
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def run(maria_client: MariaApi, park_code: str, args) -> dict:
+    rng = random.Random(42)
+    # Distribuição enviesada: datas próximas concentram a maior parte da procura
+    weights = [1 / (i + 1) for i in range(args.dates)]
+    dates = rng.choices([f"2026-12-{(i % 28) + 1:02d}" for i in range(args.dates)], weights, k=args.requests)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+    errors = 0
+
+    async def one(for_date):
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await maria_client.get_park_products_payload(park_code, for_date=for_date, num_adults=2)
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[one(for_date) for for_date in dates])
+    elapsed = time.perf_counter() - started
+    return {
+        'elapsed': elapsed,
+        'errors': errors,
+        'p50': percentile(latencies, 0.50),
+        'p95': percentile(latencies, 0.95),
+        'p99': percentile(latencies, 0.99),
+        'shared': maria_client.inflight.stats()['shared'],
+    }
+
+
+async def main():
+    args = parse_args()
+    app = None
+    if args.endpoint:
+        endpoint = args.endpoint
+        async with httpx.AsyncClient(base_url=endpoint) as client:
+            park_code = (await client.get('/parks/')).json()[0]['code']
+    else:
+        endpoint = 'http://maria.standin'
+        catalog = StandinCatalog.synthetic(parks=1, products_per_park=args.products)
+        app = create_standin_app(catalog, FaultProfile(latency=args.latency, error_rate=args.error_rate, seed=42))
+        park_code = catalog.parks[0]['code']
+
+    def make_transport():
+        return httpx.ASGITransport(app=app) if app is not None else None
+
+    print(f"{'cenário':>14} {'upstream':>9} {'coalesc.':>9} {'erros':>6} {'p50 (ms)':>9} "
+          f"{'p95 (ms)':>9} {'p99 (ms)':>9} {'req/s':>8}")
+    async with httpx.AsyncClient(base_url=endpoint, transport=make_transport()) as admin:
+        for name, cache in (('sem cache', None), ('com cache', MariaResponseCache())):
+            await admin.post('/_standin/stats/reset')
+            async with MariaApi(base_endpoint=endpoint, cache=cache, transport=make_transport()) as maria_client:
+                result = await run(maria_client, park_code, args)
+            upstream = (await admin.get('/_standin/stats')).json()['requests']
+            print(f"{name:>14} {upstream:>9} {result['shared']:>9} {result['errors']:>6} "
+                  f"{result['p50'] * 1000:>9.1f} {result['p95'] * 1000:>9.1f} {result['p99'] * 1000:>9.1f} "
+                  f"{args.requests / result['elapsed']:>8.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+"""
+Benchmark: parsing de um payload grande de /parks/{code}/products.
+
+- atual: r.json() -> ParkProduct(**item) por elemento
+- bytes: TypeAdapter(List[ParkProduct]).validate_json(bytes), um passo só
+- bytes + idioma: idem, seguido da cópia só com as traduções em 'pt'
+  (dto.select_language), como o MariaApi faz depois do cache
+
+Mede tempo de CPU (melhor de N) e memória (pico durante o parsing e tamanho
+retido pelo resultado) com tracemalloc.
+
+Uso:
+    poetry run python benchmarks/bench_maria_parsing.py [n_produtos]
+"""
+import sys
+import os
+import gc
+import json
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.maria_standin import make_park_products
+from src.integrations.maria_api.dto import ParkProduct, select_language
+from src.integrations.maria_api.maria import PRODUCTS_ADAPTER
+
+REPEAT = 5
+
+
+def parse_current(content: bytes):
+    return [ParkProduct(**item) for item in json.loads(content)]
+
+
+def parse_bytes(content: bytes):
+    return PRODUCTS_ADAPTER.validate_json(content)
+
+
+def parse_bytes_language(content: bytes):
+    return select_language(PRODUCTS_ADAPTER.validate_json(content), 'pt')
+
+
+def cpu_time(fn, content: bytes) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        started = time.process_time()
+        fn(content)
+        timings.append(time.process_time() - started)
+    return min(timings)
+
+
+def memory(fn, content: bytes):
+    gc.collect()
+    tracemalloc.start()
+    result = fn(content)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak, retained
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    content = json.dumps(make_park_products(size)).encode()
+    print(f"payload: {size} produtos, {len(content) / 1024 / 1024:.1f} MB\n")
+    print(f"{'modo':<16} {'cpu (ms)':>10} {'pico (MB)':>11} {'retido (MB)':>12}")
+    for label, fn in (("atual", parse_current), ("bytes", parse_bytes), ("bytes + idioma", parse_bytes_language)):
+        cpu = cpu_time(fn, content)
+        peak, retained = memory(fn, content)
+        print(f"{label:<16} {cpu * 1000:>10.1f} {peak / 1024 / 1024:>11.1f} {retained / 1024 / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
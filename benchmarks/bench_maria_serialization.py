@@ -0,0 +1,74 @@
+"""
+Benchmark: serialização de /maria/parks/{code}/products com cache quente.
+
+- atual: modelos do cache -> model_dump -> comissões -> jsonable_encoder -> json
+- rápido: dicts do cache -> comissões numa cópia rasa -> orjson
+
+Uso:
+    poetry run python benchmarks/bench_maria_serialization.py
+"""
+import sys
+import os
+import json
+import time
+from decimal import Decimal
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from starlette.responses import JSONResponse
+
+from scripts.maria_standin import make_park_products
+from src.integrations.maria_api.dto import ParkProduct
+from src.integrations.maria_api.maria import PRODUCTS_ADAPTER
+from src.pricing import CommissionPricer
+
+SIZES = (100, 1_000, 5_000)
+REPEAT = 5
+SELLER_COMMISSION = Decimal('10.00')
+
+
+def current_path(models: List[ParkProduct]) -> bytes:
+    pricer = CommissionPricer(SELLER_COMMISSION)
+    content = pricer.reprice_products([product.model_dump(by_alias=False) for product in models])
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def fast_path(payload: List[dict]) -> bytes:
+    pricer = CommissionPricer(SELLER_COMMISSION)
+    return ORJSONResponse(pricer.reprice_products(payload, copy=True)).body
+
+
+def best_of(fn, *args) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    print(f"{'produtos':>10} {'atual (ms)':>12} {'rápido (ms)':>13} {'speedup':>9} {'fill atual':>12} {'fill rápido':>12}")
+    for size in SIZES:
+        raw = make_park_products(size)
+
+        # Custo de preencher o cache (uma vez por TTL)
+        fill_current = best_of(lambda: [ParkProduct(**item) for item in raw])
+        fill_fast = best_of(lambda: PRODUCTS_ADAPTER.dump_python(PRODUCTS_ADAPTER.validate_python(raw)))
+
+        models = [ParkProduct(**item) for item in raw]
+        payload = PRODUCTS_ADAPTER.dump_python(PRODUCTS_ADAPTER.validate_python(raw))
+        assert json.loads(current_path(models)) == orjson.loads(fast_path(payload))
+
+        current = best_of(current_path, models)
+        fast = best_of(fast_path, payload)
+        print(f"{size:>10} {current * 1000:>12.2f} {fast * 1000:>13.2f} {current / fast:>8.1f}x "
+              f"{fill_current * 1000:>11.2f} {fill_fast * 1000:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark: latência do checkout (POST /orders/) por tamanho do carrinho.
+
+Com a validação dos produtos numa única consulta e os itens gravados num único
+bulk insert, o número de idas ao banco não depende do número de linhas; o tempo
+restante cresce só com o tamanho do insert e da resposta.
+App em processo (httpx.ASGITransport) com sqlite em memória.
+
+Uso:
+    poetry run python benchmarks/bench_order.py [--sizes 1,10,100] [--orders 50]
+"""
+import sys
+import os
+import argparse
+import asyncio
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from asgi_lifespan import LifespanManager
+from src.application import create_application
+from src.cart_cache import cart_cache
+from src.models import Cart, CartItem, Product, Seller, Store
+
+ORDER_BODY = {
+    "customer_name": "Cliente",
+    "customer_email": "cliente@magic.com",
+    "customer_document": "12345678900",
+    "customer_phone": "11999999999",
+    "address_street": "Rua A",
+    "address_number": "1",
+    "address_city": "São Paulo",
+    "address_state": "SP",
+    "address_zip": "01000-000",
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Latência do checkout por tamanho do carrinho")
+    parser.add_argument('--sizes', default='1,10,100', help="linhas por carrinho")
+    parser.add_argument('--orders', type=int, default=50, help="pedidos por tamanho")
+    return parser.parse_args()
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def setup(client: httpx.AsyncClient, products: int):
+    seller = await Seller.create(name="Vendedor", email="bench@magic.com", password="x")
+    store = await Store.create(name="Loja", seller=seller, credential=uuid.uuid4().hex)
+    request = await client.post(
+        "/customers/",
+        headers={"Store-Credential": store.credential},
+        json={"name": "Cliente", "email": "cliente@magic.com", "password": "123456"},
+    )
+    response = request.json()
+    headers = {
+        "Customer-Authorization": f"Bearer {response['access_token']}",
+        "Store-Credential": store.credential,
+    }
+    await Product.bulk_create([
+        Product(store=store, name=f"Ingresso {i}", description="", price=1000 + i,
+                product_code=f"bench-{i}", park_code="bench-park")
+        for i in range(products)
+    ])
+    return store, response['customer_id'], headers, await Product.filter(store=store).order_by('id')
+
+
+async def run(client: httpx.AsyncClient, store: Store, customer_id: int, headers: dict,
+              products: list, size: int, orders: int) -> dict:
+    latencies = []
+    for _ in range(orders):
+        cart = await Cart.create(store=store, customer_id=customer_id)
+        await CartItem.bulk_create([
+            CartItem(cart=cart, product=product, amount=1, price=product.price, attributes={"adults": 1})
+            for product in products[:size]
+        ])
+        cart_cache.cache.clear()
+
+        started = time.perf_counter()
+        request = await client.post("/orders/", headers=headers, json=ORDER_BODY)
+        latencies.append(time.perf_counter() - started)
+        request.raise_for_status()
+    return {
+        'mean': sum(latencies) / len(latencies) * 1000,
+        'p50': percentile(latencies, 0.50) * 1000,
+        'p95': percentile(latencies, 0.95) * 1000,
+    }
+
+
+async def main():
+    args = parse_args()
+    sizes = [int(value) for value in args.sizes.split(',')]
+    app = create_application(fake_db=True)
+    async with LifespanManager(app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            store, customer_id, headers, products = await setup(client, max(sizes))
+
+            print(f"{args.orders} pedidos por tamanho\n")
+            print(f"{'linhas':>7} {'média ms':>9} {'p50 ms':>9} {'p95 ms':>9}")
+            for size in sizes:
+                result = await run(client, store, customer_id, headers, products, size, args.orders)
+                print(f"{size:>7} {result['mean']:>9.2f} {result['p50']:>9.2f} {result['p95']:>9.2f}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+"""
+Benchmark: precificação de listagens (Decimal por produto vs CommissionPricer em lote).
+
+Uso:
+    poetry run python benchmarks/bench_pricing.py
+"""
+import sys
+import os
+import copy
+import random
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.constants import PLATFORM_COMMISSION_PERCENTAGE
+from src.pricing import CommissionPricer
+
+SIZES = (1_000, 5_000, 10_000)
+REPEAT = 5
+SELLER_COMMISSION = Decimal('12.50')
+
+
+def make_products(size: int, price_points: int = None, seed: int = 42) -> list:
+    """
+    price_points=None: todos os preços distintos (pior caso).
+    price_points=N: preços sorteados entre N valores, como num catálogo real.
+    """
+    rng = random.Random(seed)
+    points = [rng.randint(30000, 250000) for _ in range(price_points or 0)]
+    products = []
+    for i in range(size):
+        adult = rng.choice(points) if points else rng.randint(30000, 250000)
+        child = adult - (5000 if points else rng.randint(1000, 20000))
+        products.append({
+            'code': f"product-{i}",
+            'prices': {
+                price_type: {
+                    'original': {'amount': f"{cents / 500:.2f}", 'currency': 'USD', 'symbol': '$'},
+                    'usdbrl': {'amount': f"{cents // 100}.{cents % 100:02d}", 'currency': 'BRL', 'symbol': 'R$'},
+                }
+                for price_type, cents in (('adult', adult), ('child', child), ('total', adult + child))
+            },
+        })
+    return products
+
+
+def legacy_reprice(products: list, commission_percentage) -> list:
+    """Cópia do laço original de routes/maria.py::get_park_products."""
+    for product_dict in products:
+        if product_dict.get('prices'):
+            seller_commission = Decimal(str(commission_percentage))
+            for price_type in ['adult', 'child', 'total']:
+                if price_type in product_dict['prices'] and product_dict['prices'][price_type].get('usdbrl'):
+                    base_price = Decimal(str(product_dict['prices'][price_type]['usdbrl']['amount']))
+                    price_with_platform = base_price * (1 + PLATFORM_COMMISSION_PERCENTAGE / 100)
+                    final_price = price_with_platform * (1 + seller_commission / 100)
+                    product_dict['prices'][price_type]['usdbrl']['amount'] = str(final_price.quantize(Decimal('0.01')))
+            product_dict['platform_commission'] = str(PLATFORM_COMMISSION_PERCENTAGE)
+            product_dict['seller_commission'] = str(seller_commission)
+    return products
+
+
+def batch_reprice(products: list, commission_percentage) -> list:
+    return CommissionPricer(commission_percentage).reprice_products(products)
+
+
+def best_of(fn, products: list) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        data = copy.deepcopy(products)
+        started = time.perf_counter()
+        fn(data, SELLER_COMMISSION)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    for label, price_points in (("preços distintos", None), ("200 faixas de preço", 200)):
+        print(f"\n{label}")
+        print(f"{'produtos':>10} {'decimal (ms)':>14} {'lote (ms)':>12} {'speedup':>9}")
+        for size in SIZES:
+            products = make_products(size, price_points)
+            assert legacy_reprice(copy.deepcopy(products), SELLER_COMMISSION) == batch_reprice(copy.deepcopy(products), SELLER_COMMISSION)
+            legacy = best_of(legacy_reprice, products)
+            batch = best_of(batch_reprice, products)
+            print(f"{size:>10} {legacy * 1000:>14.2f} {batch * 1000:>12.2f} {legacy / batch:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # SQLite não aceita default não constante em ADD COLUMN: adiciona com um
+    # default fixo e preenche com created_at (a app sempre grava updated_at)
+    script = """
+        ALTER TABLE "cart" ADD "updated_at" TIMESTAMP NOT NULL DEFAULT '1970-01-01 00:00:00';
+        UPDATE "cart" SET "updated_at" = "created_at";"""
+    if db.capabilities.dialect == 'postgres':
+        script += """
+        ALTER TABLE "cart" ALTER COLUMN "updated_at" SET DEFAULT CURRENT_TIMESTAMP;"""
+    return script + """
+        CREATE INDEX "idx_cart_status_10bfe2" ON "cart" ("status", "updated_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_cart_status_10bfe2";
+        ALTER TABLE "cart" DROP COLUMN "updated_at";"""
+
+
+MODELS_STATE = (
+    "eJztXVtzmzgU/isMT+msN5Nm08vsm5um22ybyzTe3U4zHUYBxWbCbUEk9Xby31fijhDYss"
+    "EG+zzFEToCfejyfUfS4adquwa2gsNT5BP1d+Wn6iAb0x+l9JGiIs/LU1kCQXdWlFFPc9wF"
+    "xEc6K+UeWQGmSQYOdN/0iOk6NNUJLYslujrNaDrTPCl0zH9DrBF3iskM+/TC7XeabDoG/o"
+    "ED9u+tGhDXx+w+ekh/2jQX/R0QRMJApZlv09+sOM9ABBsaIup3Vo73oN2b2DJK9TMNljVK"
+    "18jci9LOHfIhysge807TXSu0nTyzNycz18lym05U7yl2sM/uR9OIH7J6s2ol8KRQxFXMs8"
+    "R1K9gY+B6FFingtCR4uusw4OnTBFEFp+wuvx6/PHlz8va31ydvaZboSbKUN89x9fK6x4YR"
+    "ApcT9Tm6jgiKc0T457jlMJexO50hXwxebsEBSB+bBzCFqwnBNCGHMG9vKYYqbYjmY9ReVs"
+    "XRRj80CztTMmPgvXrVgNrf4y+nH8dfDmiuF+yWLu0Hcee4TC4dx9cYtDmUj9gP2FMt3w4L"
+    "FosbY1tYHm27MeaI6T5Oe3YFtPf0CjFtLEaubMmBZySmh+mPrqBcs2vTOhhXjjVPRo0G6C"
+    "bnF2c3k/HFNauJHQT/WhFE48kZu3Icpc651IPXXOPNClH+OZ98VNi/yrery7MIQTcgUz+6"
+    "Y55v8k1lz4RC4mqO+6QhozDApakpMKUXWxiyJV9s2RJe7FZfbPLwhQ6bTNaa1HTLWW1uqO"
+    "vD1FucainlkUOuaLJPsDGad/9QQ1gS4liG8ANNNafOJzyPkDynj4QcHQuAS5jwTVpO/xB8"
+    "TptBmpp3Th89ZeS31DpoBWm1MInJ2/jmdPz+TBX23RawOy0UNVz4uGFJjCBriXdIf3hCvq"
+    "HVNEkmmUyCbS3VTmV43yXmHz59wRYiYsJX0GfntKhhIRuh5B67BXRKuFUv2cc2n4IcNI2e"
+    "mt2b3YmHpEbOpnA1S1ozzdWqrL3N5LLnu0aox8qZUMO7kOBAe8DzWLMWtC9I2JXm0XoJi2"
+    "w3dAT9rha73GBzc+rLbeOX4+X5pi6YQWvhyvLvpUbNe3MVsj9vri5rmljJigPuL4fW6dYw"
+    "dTJSLDMg3ztzm/x8XsNl0gATq3hJsaSOkYOL8VfeZ3L6+eodL0VYAe/AG7CLorHqDeAmxM"
+    "rLrfc1Vi036HNszdv4+mQJZ+Prk1pfI7vEdRXKOiQ1eG6xT0KyPO9FFE0Ot7LRPkHXoMHF"
+    "OkdeRibF9A+/pSVk3qsWC/CCRFgTuOu8pOFiV+5Zsuq7W8VJkOVOr5H/oApFZ3551Kw7o4"
+    "xemnGR9FTPAg9bM1exXB1ZioGV0FaoNX1zioGUC+SbSBlfnysHHppbLjIU1zenpkPzYlth"
+    "lOrFocq9o7bKXLymC7p2pfmpXtfqtEXJkKU0fzsUqXP0ul+Qjf5KAJjm3xzH7D2EyaBQRX"
+    "GCf9QxptxkKEA2aa2zr5NmpZtJrc9Xl3+k2Xn5y9H3GdYfgtCW6t0Fm6Hg2rUMCuaUJq3i"
+    "MCgZgr+gZ4vM4Afahfca+4EqKnK7lD4RTg2svrCOs5DYF/Kuxu1ZAcTliDhbqmJJzDVMa2"
+    "Mrv9Ds9IYzvCy9X6lY4fIW0y5aSiyjv7Cc1THtL0G+LDsoGXVFD4anALYroUABDAZIUADD"
+    "VABsBjMtmcaZW6yEYTIG7nDTjAHSVmmhAtOBgAxKFRQNKNU9fa/9Uqrp3lqRRi3su21Qp8"
+    "VcXZ7iA+k3alf6wYLF2nIF20I+WI9hZgDLZpniC4In1xf04Sb/Q24DrTGDkrgP2NGw5+oz"
+    "iRGRs9rLbbdArXaIWsEpODgFt8VTcMue4dLqj8jJnuEaFqTiM760GwtmLSkkkqLGSUkDRY"
+    "TyGgpHO43jipU1MCw2IXejJtIgedMmtFj2ps224wA2org1IIhXYn2Dj07ziKz4pfVXiSBd"
+    "x0GgRdJCBk/eDtaWQaGou61QIMhJezoFgk60G3SiSyoWU1MBB8s4az35crMssODQs965A/"
+    "wqmTD7zbBgr9n6EKaDo+xCWMVwkNtOusVUemWsagmoVlClTxPaWBR+Zglgi8aAbQVbjwKy"
+    "2jCQWQKqmQPAMHym5OltMZZqrlVLQJVH1QntO5HKWYxqbgmo8qjqJpELF8PZAaLV3k8rvl"
+    "rnTwwBUx7T/0xvFUQTM8ATHKoqOFTBoQpRo2G/TD/2y0DU6E1EjY5c5lHY6Mx5vua2Eggc"
+    "XV3PqIscXQJswbpGN7GjYW2j27WNAYQ57gOAEEcbIkP3PTJ0vAFTaiAsmuxrh4aAt23Jhx"
+    "qGJk2BB7j7l+e/xY4FMW93JuZtQ2SspUJiycTCkqLJhU+FloMcJVBCUKr2po7BbxQawmdC"
+    "4ZD32hAWn6yCZFPon5LZUABtWgnoIgAQCOcVebZ4B2BDnDTODhpkTYOsj4jYFIRuAxERh4"
+    "4sLLnu6JIrrBrCqqHMiLOhU/bZjFf4Iufqi14D/ViqiDqU1plgGbBNz8YNtizxuabkyqjJ"
+    "rxHkeWD1r2cj96jBYQEqe22VDaHU1oYQQqm1BiWEUoNQaiDyZKLUFnRMRGJaCOgUM6aBh3"
+    "NK0HCfnHV33Q1Q122AateFcio3nkWUe0NhnHJ+D0Gc9nvtEII4QRAn4EZD5kaCSV7OA160"
+    "ARc45/9a1weeFdQ/DJd2ghcbSJ92b8VEVMS5UobaQLeyLODg7Fm/bGJV4OBsY/I3sENMJB"
+    "cWp2QFVCqPf2XbZhDQB9M87OsUIjpWCVgV1k0bWTXY1pXB86u4kMOksB468RrwfX92en4x"
+    "/nzwanQc4UtZkxnPIinyJ0fAU4GnAk8FnroFnspvItKTzxmst09jWIAK9lK19G2IQZ6BF8"
+    "DR1pn1wQNRe8JJBopBHm7qdClhjH1TFy4jJFdGTZoW5XlA1PZsEh81iNpH7AfCQx31cqxg"
+    "AtI2Xynw5GKSeavHIts6gC+PjpYAkOaqBTC6xqtZhwjDutaf7C+YbOtYfysDvQjF1o71S+"
+    "xfaH96ef4fbx9dKw=="
+)
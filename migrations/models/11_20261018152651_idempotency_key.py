@@ -0,0 +1,76 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "idempotencykey" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "scope" VARCHAR(255) NOT NULL,
+    "key" VARCHAR(255) NOT NULL,
+    "fingerprint" VARCHAR(64) NOT NULL,
+    "status_code" INT,
+    "response" JSON,
+    "expires_at" TIMESTAMP NOT NULL,
+    "created_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT "uid_idempotency_scope_f13433" UNIQUE ("scope", "key")
+) /* Resultado de uma requisição com Idempotency-Key (ver src\/idempotency.py). */;
+CREATE INDEX IF NOT EXISTS "idx_idempotency_expires_7a2be9" ON "idempotencykey" ("expires_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "idempotencykey";"""
+
+
+MODELS_STATE = (
+    "eJztXVtzmzgU/isMT+msm03TNO3sm5um2+w2l2m8u51mO4wCiq0Jt4JI4u3kv6/E/SKwwW"
+    "CDfV5aR+gI+JDQ950jHX7KhqVh3d0/QQ6Vf5N+yiYyMPuRKR9JMrLtpJQXUHSr+xXVqMat"
+    "Sx2k8lbukO5iVqRhV3WITYllslLT03VeaKmsIjGnSZFnkh8eVqg1xXSGHXbg5jsrJqaGn7"
+    "DL/7yRXWo5mJ9H9dhPg9Viv12KqOfKrPJN9Js3Z2uIYk1BVP7O27HvlTuCdS1zf0TjVf1y"
+    "hc5tv+zMpB/9ivwybxXV0j3DTCrbczqzzLg2Mf37nmITO/x8rIw6Hr9vflshPBEUwS0mVY"
+    "J7S9lo+A55Ok3htCR4qmVy4NnVuP4NTvlZXh6+Onp79O718dE7VsW/krjk7XNwe8m9B4Y+"
+    "AhcT+dk/jigKavj4J7glMGexO5khRwxeYpEDkF12HsAIrioEo4IEwqS/RRjKrCOSB7+/NM"
+    "XRQE+Kjs0pnXHw3rypQO3v8ZeTT+Mve6zWC35Ki42DYHBchIcOg2Mc2gTKB+y4/KqW74cp"
+    "i8WdsS0sDzbdGRPEVAdHI7sA2gd2hBIDi5HLWubA00LT/ehHV1CuOLTZPWiXpj4P3xoV0E"
+    "3Ozk+vJ+PzK34nhuv+0H2IxpNTfuTQL53nSveOc503bkT652zySeJ/St8uL059BC2XTh3/"
+    "jEm9yTeZXxPyqKWY1qOCtNQLLiqNgMk82NQru+aDzVrCg93ogw0vPjVgw8laqTXd5qzW96"
+    "rrw9SbnmoZ5amHXNpkl2DjNO/uvoSwhMQxC+FHVkqm5p947iN5xi4JmSoWABcy4euonf4h"
+    "+Bx1g6g0GZwOeozJb6Z3sBtkt4VpQN7G1yfjD6eycOy2gN1Jqqnhwpd7LYkR5D3xFqn3j8"
+    "jRlJIuySUTodhQIu2Uhfd9aP7xzy9YR1RM+FL67Iw1NSxkfZSsQyuFTga34iHj0MiXIBNN"
+    "/avm5+ZnykNSImcjuKolLYlqtSprb2K5bDuW5qmBcqbM8Naj2FXu8TzQrCntCxK20TxaLm"
+    "GRYXmmYNyVYpcYrG9OfbVp/BK8bIeoghm0FK64/k5q1GQ0FyH74/ryoqSLZaxywP1lsnu6"
+    "0YhKR5JOXPq9M7fJz+cVXCYVMPEbzyiWyDGydz7+mveZnHy+fJ+XIryB9+AN2EbRWPQG5C"
+    "bEwsMt9zUWLdfoc2zN23h8tISz8fio1NfID+WGCmMdNTV4YrFLQjI77/kUrR5uWaNdgq5C"
+    "g4t1Tn0ZGTbTP/yWlpDJqFoswFMSYUXgrpKWhotddmTVVd/dKk6KdGt6hZx7WSg6k8Ojat"
+    "3pV7Sjioukp3zq2lifWZJuqUiXNCx5hsSs2ZOTNCSdI4cgaXx1Ju3ZaK5bSJMsh0yJyepi"
+    "Q+KU6sW+nHtGbbW5OKYLurbR/FSua1XWo+qQpah+OxSpc/S6D8j6/9cAMKq/Po7ZewjDl0"
+    "IRxQl+KmNMiclQgKzSWqdfJ9VKN5Zany8vfo+q5+Vvjr7PsHrvekat0Z2yGQquXcsgd85o"
+    "UhOHQcYQ/AU9CzKDH2gbnmvgByqoyM1S+lA4VbD6VBxnIbFP1W3G7XkD1MoRcR6q4kXcNc"
+    "zuxpB+YdXZCWd4WXrfqFlheItrFyUilv7/EM7qmPZnIF+WHWSMuqIHw1MAm5VQoAAGAyQo"
+    "gGEqAD6DEb1O50wsGmEYvgO3uGsGAClNeqjAdCAgg1IFRQNKdUefa7+UarS2VqRRU+tuK9"
+    "RpulaXu/hA+o3alX4QsFhZrmBDyAfLMYwNIGwWKz7XfbQcwRiu8j8kNtAbYyipdY9NBduW"
+    "OqvxRsxZ7eSyW6BWW0StYBcc7ILb4C64ZfdwKeVb5Oru4RoWpOI9vmwYC2atWkiETY3Dlg"
+    "aKCOM1DI52Osclb2tgWKxD7vpdpELyRl1oseyNum3HCWxEeWtAEDdifYPPTvOA9OCh9VeJ"
+    "IFXFrqv40qIOnnk7iC2DQpG3W6FAkpP2dAoknWg36USXVOxMw4ZtUWyqc/ZURGQsV6OSjp"
+    "Gkbrh1c/EauS/YZc8CaVawkA1JDv7hEZf86x0c4Lf+v68tSbUMKXUlL9mlSHsP2JFcR/01"
+    "ddp9ey5YMNfROYSr51zVsv0eDXkg1kEWI7SX5oqRAXisYxBrbtBe+67s3gN4x86PHdshop"
+    "Qk5UDmzIYJaAfrZnw5V7IctsJhnLFqxMU2sAap5RAKY8Q2O4MAuPK8JWmbFrKW9Gq1XCdJ"
+    "S/CTTdjhBiowa7keFdjyjD4Q0RfhUK36QM5vj5zvyVquwNkvEFJxFKBcP1lxFVjC1btJdv"
+    "Ae6/Cd1W+fNezeWR3CyN1Ud2lhwXCQC/m7xbT2WsOiJaBaQJVdjWfgeupZaAzYFrC1GSDN"
+    "XgOxJaAah1Q1zeGxUXZajGt116IloJpH1fSMW1HcaDGqiSWgmkdVJbReAs6cHSBaHP3sxp"
+    "sN/tAQMM1j+h+xmyAamgGe4NOSt8+nBUtU4Ds864YNdiDAd3g6h6+17/D4LnP/Qzyx83zF"
+    "hfrwKZ5iPKPsWzwZwBbENbr5Gg/ENrqNbQzgwzF9ABC+TATf2un7spVgS1utF2HaZFcHNH"
+    "xCpC35UMLQalPgAe6nzPPf9MCCr4hszVdEKnINL5VkuE524Vo0+SbR7tm0sSGUkOa3valj"
+    "8AuFWK8jD3gFZgPf+Vi9K3YPYfrKCkhWJVPNmA0F0KpIQBcpVUE4N+TZ4hWAFZmnc3bQIU"
+    "s6ZHmO+aq03mvIMT90ZCHkuqUhV4gaQtSwzhtnTXnL4hkPOTSKqjQPevHUZQOMeYmoQybO"
+    "BGHANj0b11jXxfuawiOjKr+Gm9SB6F/P3tyjCocFqOyVVTYkp14ZQkhO3RqUkJwaklODyK"
+    "uzVzylY3wS00KK3IAxDTxBboiG9WiuuupugLpuDVS7LDlutvMsotxrSoyb8HtIi7vbsUNI"
+    "i9u3hD2w5wi4UWMHeDDJ1/OAp23ABZ7zf63qA48b6h+GSzvB0x2kT6u3AiIq4lwRQ62gW3"
+    "EVcHD2bFxWsSpwcLYx+WvYpATVS4uTsQIqleS/MgziuuzCFBs7KoOIvasErAqrxEB6CbZl"
+    "beT5VdDIfthYD514Ffh+OD05Ox9/3nszOvTxZayJBLNIhPzRAfBU4KnAU4GnboCn5hcRqe"
+    "EH4lZbpzEsQAVrqVr62t4g98AL4Ghrz/rggSjd4VQHikFubuo0lDDGDlGFYYTwyKhK06Kk"
+    "Dojank3iowpR+4AdV7ipo1yOpUxA2iaRArteTjK7eS6yjQP46uBgCQBZrVIA/WN5NWtSYV"
+    "rX8p39KZNNbetv5UUvQrG1bf011i+0P708/w/7aqNl"
+)
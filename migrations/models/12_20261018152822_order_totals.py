@@ -0,0 +1,110 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+BATCH_SIZE = 1000
+
+
+def marks(db: BaseDBAsyncClient, count: int) -> list:
+    if db.capabilities.dialect == 'postgres':
+        return [f"${i}" for i in range(1, count + 1)]
+    return ['?'] * count
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    await db.execute_script("""
+        ALTER TABLE "order" ADD "items_summary" TEXT NOT NULL DEFAULT '';
+        ALTER TABLE "order" ADD "item_count" INT NOT NULL DEFAULT 0;
+        ALTER TABLE "order" ADD "total_cents" INT NOT NULL DEFAULT 0;""")
+
+    # Preenche os totais dos pedidos existentes em lotes (mesmo cálculo de
+    # src/utils.py::order_totals)
+    total_mark, count_mark, summary_mark, id_mark = marks(db, 4)
+    last_id = 0
+    while True:
+        orders = await db.execute_query_dict(
+            f"""SELECT "id" FROM "order" WHERE "id" > {last_id} ORDER BY "id" LIMIT {BATCH_SIZE}"""
+        )
+        if not orders:
+            break
+        ids = [row['id'] for row in orders]
+        last_id = ids[-1]
+        items = await db.execute_query_dict(f"""
+            SELECT "orderitem"."order_id", "orderitem"."price", "orderitem"."amount", "product"."name"
+            FROM "orderitem" JOIN "product" ON "product"."id" = "orderitem"."product_id"
+            WHERE "orderitem"."order_id" IN ({", ".join(marks(db, len(ids)))})
+            ORDER BY "orderitem"."id"
+        """, ids)
+        totals = {order_id: [0, 0, []] for order_id in ids}
+        for item in items:
+            total = totals[item['order_id']]
+            total[0] += item['price'] * item['amount']
+            total[1] += item['amount']
+            total[2].append(f"{item['amount']}x {item['name']}")
+        await db.execute_many(
+            f"""UPDATE "order" SET "total_cents" = {total_mark}, "item_count" = {count_mark},
+                "items_summary" = {summary_mark} WHERE "id" = {id_mark}""",
+            [[total, count, ", ".join(summary), order_id] for order_id, (total, count, summary) in totals.items()],
+        )
+
+    return ""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "order" DROP COLUMN "items_summary";
+        ALTER TABLE "order" DROP COLUMN "item_count";
+        ALTER TABLE "order" DROP COLUMN "total_cents";"""
+
+
+MODELS_STATE = (
+    "eJztXVtz27YS/iscPblT1cdxnaRz3hTHad3Gdib2OadTN8OBSVjGmLeQoB014/9+AN7AC0"
+    "gJFCmR0r4kMrgLEh8BYr9dYPF9YrsmtoLDU+TTyb+17xMH2Zj9KJRPtQnyPFHKCyi6syJB"
+    "I5W4C6iPDF7LPbICzIpMHBg+8ShxHVbqhJbFC12DCRJnLopCh3wNsU7dOaYP2GcXbr+wYu"
+    "KY+BsO+J+3k4C6Pub3MUL202ZS7HdAEQ2DCRO+TX/z6jwTUWzqiE6+8Hq8R/2eYMsstI+Y"
+    "XDQq1+nCi8rOHfohEuSPeacbrhXajhD2FvTBdTJp4kTtnmMH+/x+rIz6IW83b1YCTwpF3E"
+    "QhErctp2PiexRaNIfTiuAZrsOBZ08TRA2c87v8dPzq5O3JLz+/OfmFiURPkpW8fYmbJ9oe"
+    "K0YIXN5MXqLriKJYIsJf4CZgLmJ3+oB8OXhCowQge+wygClcTQimBQJC0d9SDCesI5KnqL"
+    "+0xdFG33QLO3P6wMF7/boBtf/OPp/+Nvt8wKR+4Ld02TiIB8dlcuk4vsahFVA+YT/gT7V6"
+    "P8xpLO+MXWF5tO3OKBAzfJyO7Apo79kVSmwsR66oWQLPTFQP0x99Qbnm0GZtMK8ca5F8NR"
+    "qguzm/OLu+mV184i2xg+CrFUE0uznjV46j0kWp9OBNqfNmlWj/O7/5TeN/an9dXZ5FCLoB"
+    "nfvRHYXczV8T/kwopK7uuM86MnMfuLQ0BabwYnOfbMUXW9SEF7vVF5s8fG7AJpO1rjTdlr"
+    "Q296kbwtSbn2qZyaOGXF5ln2DjZt79Y43BkhiORQg/sFIyd/7AiwjJc/ZIyDGwBLjEEr5O"
+    "6xkegi9pN0hLxeD00XNm/BZ6B2sgaxamsfE2uz6dvT+bSMduB9id5qoaL3ylz5IcQd4T75"
+    "Dx+Ix8U6/pkpwyEYptPeVORXjfJeof/viMLUTlBl+On52zqsaFbISSe+zm0CngVr1kH9vl"
+    "EuSgefTU/N78TmVIauhsClczpSWpVKe09jajy57vmqERM2fKFO9CigP9ES9izprjvkBhW8"
+    "2j9RQW2W7oSMZdLXZCYXNz6qtt4yfw8nxiSGbQWrgy+b3kqGI0VyH7/frqsqaLFbRKwP3H"
+    "YW26NYlBp5pFAvqlN7fJ95c1XCYNMPGGFxhL6hg5uJj9WfaZnH68elemIryCd+AN2EXSWP"
+    "UGlCbEysut9zVWNTfoc+zM2/jmZAVn45uTWl8jv1QaKszqUOTgQmOfiGRx3otMNDXcikr7"
+    "BF0DB5fzHHUamVQzPPxWppBiVC0n4DmKsCZwn0RN48WuOLJU2Xe/jJMiy51/Qv7jREo6xe"
+    "VpM++MBL1UcBn1nJwFHrYeXM1yDWRpJtZCW2Pa7M1pJtIukE+QNvt0rh14aGG5yNRcn8yJ"
+    "w2SxrXGT6ofDSekddVXn8pgu8NpW81M9rzVYj1IxllL5bkyk3tHrPyAb/a8AYCq/ORtz8B"
+    "AmH4Uqijf4W53FJFTGAmQT1zr786aZ6WZU6+PV5a+peJn+lsz3B2w8BqGtNLpzOmPBtW8a"
+    "FCyYmdTGYVBQBH/BwILM4Afahfca+4EqLHK7Jn1CnBqs+lwcZ6lhn5NtZ9vzCqhbMsR5qI"
+    "oXcdcwa42t/cjE2Q0f8KrmfatqpeEtzl301LCM/odwVs9mfwHyVa2DglJf5sH4GMB2KRQw"
+    "gNEACQxgnAyAz2DEUumcQqMVhsk3cIe7ZgyQ3qaHSlRHAjIwVWA0wFT39L0Oi6mma2tlHD"
+    "W37raBneal+tzFB9Rv2i31g4DF2nQF21J7sB7DTAHCZhnjC4Jn15eM4Sb/g9CB3phBSd1H"
+    "7OjYc40HhS9iSWsvl92CabVDphXsgoNdcFvcBbfqHi69fouc6h6ucUEq3+PLhrFk1lJCIq"
+    "lqltQ0UkSYXcPg6KZzXPG6RobFJuhu1EUaKG/ahZbT3rTb9pzARpa3BghxK6tv9NlpnpAV"
+    "v7ThMhFkGDgI9IhaqOBZ1oPYMjCUyW4zFEhy0h1PgaQT3Sad6NMUOzex7bkUO8aCvRWZMV"
+    "aSaDTHiJBNtm4uXyP3GQfsXSDTjReyIc3HX0MSkL/DoyP8Nvr3Z1czXFvLPclP7FG0gyfs"
+    "a4Fv/Ct320NvIVkw19M9pKvnAsP1oh4NeSA2YSymaK9sK6YK4LHOQFTcoL3xXdmDB/Ce3R"
+    "/7nk9kKUnqgSypjRPQHtbNRHSuZjlsg8O4oNXKFtvCGqSOQyjMIvbYHSTA1ectyet0kLVk"
+    "UKvleklagr95hF1uwQKLmpthgR3P6CMhfSkOzawP6Pzu0PmBrOWKnf0SIpVFAer5k5uJwB"
+    "KuwU2yo/dYJ9+sYfusYffO+hCm7ibVpYUVxVEu5O8XU+W1hlVNQLWCKnua0MZq7FmqDNhW"
+    "sPUYIO0+A5kmoJqFVE3T57FRdluMlbprVRNQLaPqhPadLG60HFWhCaiWUTUIVUvAWdIDRK"
+    "ujnzW83eBPFAHTMqb/EK8Nooka4Cm2H1Bk6Qbmd6zg2bD9oKC1l9sP4uMcFPPKF5X2Fjf2"
+    "aQttG/mSiaZ+W35FcRyJnjeeNwK81LvjpYZFZ3Cy1qZhgz1F3ewpgpO1NnGyVhQEi8yqLB"
+    "y25tYbOFyrGqGsO12rANiSSGU/52tBtLKLibIh1+Dwj4IaAoBw1hicnjX0hWjxJlWlD2Fe"
+    "ZV8HNBwK1BV9qLHQlE3gEe6QLtu/+YEF5wLtzLlADdnDV0obrpIvXMlMvhXcvZgIOoESEn"
+    "d3N3WMfukf63XkCa9h2cDJPet3xf4hzD9ZBcmm9MgFtbEAuuk4DBDnlna2fE1vQy75kh50"
+    "yJoOWX9qRFOi/g2cGjF2ZCHkuqMhV4gaQtRQ5YuzoUyE2YyHfJpGVdoHvXgywhHGvGSmQy"
+    "HOBGHALj0b19iy5DsVkyvTJr9GIGQg+jewL/e0wWEBLHttlg3p5teGENLNd7jeG9LNQ7r5"
+    "vSd5CtkfcjwmMmI6SHodW0wjT3mdoOE+O+uuuhshr9uAqV2X7rrYeZaZ3BtKdS3se0h0vd"
+    "+xQ0h0PbQUXJDoGmyj1g7weJJX84DndcAFXvJ/resDzyoaHoYrO8HzHWRIq7diQ1Rmc6UW"
+    "aoO5lYmAg3Ng47LJqgIHZxeTv4kdSpBaoquCFphSIqOdbZMgYA+me9jnKRbYt0piVWGD2M"
+    "iqwbaujrJ9FVdymFQ2QCdeA77vz07PL2YfD15PjyN8mdVE4lkkRf7kCOxUsFPBTgU7dQt2"
+    "ankRkZEc+bjeOo1xASpZS9XR+Zmj3AMvgaOrPeujB6J2h5MKFKPc3NRrKGGGfWJIwwjJlW"
+    "kTp0VCBkjtwCbxaQOpfcJ+IN3UUU/HcipAbUWkwFPLMui1zy64dQBfHR2tACCTqgUwulZm"
+    "sw6VJmqu39mfU9nWtv5OPvQyFDvb1q+wfqH76eXl/wK02Nk="
+)
@@ -0,0 +1,69 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "idempotencykey" ADD "owner" VARCHAR(32);
+        ALTER TABLE "idempotencykey" ADD "locked_until" TIMESTAMP;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "idempotencykey" DROP COLUMN "owner";
+        ALTER TABLE "idempotencykey" DROP COLUMN "locked_until";"""
+
+
+MODELS_STATE = (
+    "eJztXV1z2zYW/SscPbmzqtdxnKSzb4rjbL2N7UzsbTv1ZjgwCcsY8yskaEfN+L8vwG+CIC"
+    "VQpERK9yWRQVyQOASIcy6Aix8T2zWxFRyeIp9O/qX9mDjIxuxHKX2qTZDn5ak8gaI7K8po"
+    "pDnuAuojg5dyj6wAsyQTB4ZPPEpch6U6oWXxRNdgGYkzz5NCh3wLsU7dOaYP2GcXbr+yZO"
+    "KY+DsO+J+3k4C6Pub3MUL202a52O+AIhoGE5b5Nv3Ni/NMRLGpIzr5ysvxHvV7gi2zVD9i"
+    "8qxRuk4XXpR27tCPUUb+mHe64Vqh7eSZvQV9cJ0sN3Gies+xg31+P5ZG/ZDXm1crgSeFIq"
+    "5iniWuW8HGxPcotGgBpxXBM1yHA8+eJogqOOd3+fn41cm7k19evz35hWWJniRLefcSVy+v"
+    "e2wYIXB5M3mJriOK4hwR/jluOcxl7E4fkC8HL7cQAGSPLQKYwtWEYJqQQ5i3txTDCWuI5C"
+    "lqL21xtNF33cLOnD5w8N68aUDt99mX019nXw5Yrp/4LV3WD+LOcZlcOo6vcWhzKJ+wH/Cn"
+    "Wr0dFiyWN8ausDzadmPMETN8nPbsCmgf2BVKbCxHrmwpgGcmpofpj76gXLNrszqYV461SL"
+    "4aDdDdnF+cXd/MLj7zmthB8M2KIJrdnPErx1HqQkg9eCs03qwQ7Y/zm181/qf219XlWYSg"
+    "G9C5H90xz3fz14Q/Ewqpqzvus47MwgcuTU2BKb3Ywidb8cWWLeHFbvXFJg9f6LDJYK0rDb"
+    "eC1eY+dUMYeotDLaM8asgVTfYJNk7z7h9rCEtCHMsQfmSpZO78hhcRkufskZBjYAlwCRO+"
+    "TssZHoIvaTNIU/PO6aPnjPyWWgerIKsWpjF5m12fzj6cTaR9twPsTgtFjRc+4bMkR5C3xD"
+    "tkPD4j39RrmiSXTIRiW0+1Uxne94n5x9++YAtROeEr6LNzVtS4kI1Qco/dAjol3KqX7GNb"
+    "TEEOmkdPze/N7yRCUiNnU7iaJS1Jc3Uqa28zuez5rhkasXKmzPAupDjQH/Ei1qwF7QsStt"
+    "U4Wi9hke2GjqTf1WKXG2xuTH21bfxyvDyfGJIRtBauLP9eatS8N1ch+8/11WVNEytZCcD9"
+    "12F1ujWJQaeaRQL6tTe3yY+XNVwmDTDxipcUS+oYObiY/Sn6TE4/Xb0XpQgv4D14A3ZRNF"
+    "a9AcKAWHm59b7GquUGfY6deRvfnqzgbHx7Uutr5JeErsJYh6IGzy32SUiWx72IoqnhVjba"
+    "J+gaNLhc56jLyKSY4eG3soTMe9VyAV6QCGsC9zkvabzYlXuWqvruV3FSZLnzz8h/nEhFZ3"
+    "552qw7o4xemnGZ9JycBR62HlzNcg1kaSbWQltj1uzNaSbSLpBPkDb7fK4deGhhucjUXJ/M"
+    "icPyYlvjlOqnw4nwjroqc/mcLujaVuNTva41WItSIUtp/m4oUu/o9T8hG/2vAGCaf3Mcc/"
+    "AQJh+FKoo3+HsdY8pNxgJkk9Y6+/OmWelmUuvT1eW/0+yi/BXo+wM2HoPQVurdBZux4Nq3"
+    "DAoWjCa1cRiUDMFfMLBJZvAD7cJ7jf1AFRW5XUqfCKcGVl+Yx1lK7At523F7XgB1BSLOp6"
+    "p4EncNs9rY2j9YdnbDB7wqvW9VrHR6i2sXPSWW0f8wndUz7S9Bvio7KBn1RQ/GpwC2K6FA"
+    "AYwGSFAA41QAfAQjlkrjzC1aYZh8A3e4acYA6W1aqMR0JCCDUgVFA0p1T9/rsJRqurZWpl"
+    "EL624b1GkxV5+7+ED6TbuVfjBhsbZcwbaUD9ZjmBnAtFmm+ILg2fUlfbjJ/5DbQGvMoKTu"
+    "I3Z07LnGg8IXUbDay2W3QK12iFrBLjjYBbfFXXCr7uHS67fIqe7hGhek8j2+rBtLRi0lJJ"
+    "KiZklJI0WE8RoGRzeN44qXNTIsNiF3oybSIHnTJrRc9qbNtucANrK4NSCIW7G+0UeneUJW"
+    "/NKGq0SQYeAg0CNpoYKnaAdzy6BQJrutUCDISXc6BYJOdBt0ok8qdm5i23MpdowFeysyMi"
+    "bkaKRjJM+bbN1cvkbuCw7Yu0CmGy9kQ5qPv4UkIP8Lj47wu+jf165muLZWeJKf2aNoB0/Y"
+    "1wLf+GfhtofeQrJgrqd7SFfPBYbrRS0a4kBsgiymaK/MFVMD8FhnICpu0N74ruzBA3jP7o"
+    "99zyeykCT1QApm4wS0h3UzkZyrWQ7b4DAuWbXiYltYg9TxFApjxB67gwS4+rglRZsOopYM"
+    "arVcL0FL3GdHxm7rO3pmMMqVca+PV+jhr49rezi/VAbQco1HpoVDh8rm7ZuFtGjbgZQeVI"
+    "sdknJOq90onfF3j7DiWvhEypab8Yl0zG936UWCc2uHnFsDWdkYT31J3ArZnFi9N8HNssCC"
+    "xsFRztHP3yTfrGHP4MBetvUhTJ2vqgttK4ajJO/9Yqq88rZqCahWUGVPE9pYzZckNQZsK9"
+    "h6DJB2n4HMElDNFhiYps9XCrDbYqzUXKuWgKqIqhPad2p+pqoloCqiahCqFo5WsANEq72f"
+    "Vbxd508MAVMR07+J1wbRxAzwzDfjUGTpBuZ3rODZsBmnZLWXm3Hiw00UT1koG+0tbuzTFt"
+    "o28iUDTX2QiorhOMKebzpUBXipd8hLDUsw4Zy5TcMGO+y62WEH58xt4py5aBIsolXZdFgZ"
+    "YOWNaHDUXHWGsu6suRJgS2Yq+zltDmYruxgoGyJvDv9gtCEACCfvwVlyg1+WGW3ZVvoQFk"
+    "32tUPDEVldyYcahqZMgUcYL0Dkv8WOBadk7cwpWQ2x9FcKoq8SPV+JJt/m2r0cFj2BEsLY"
+    "dzd0jH7pH2t15AmvwWzgHKv1m2L/EBafrIJkU7DwktlYAN30PAwI55Y8W76mt+FkBcEOGm"
+    "RNg6w/Q6Xp2IoNnKEydmRhynVHp1xh1hBmDVW+OBuKy5mNeMin6axK+0kvHppzhHNeMupQ"
+    "mmeCacAuPRvX2LLkOxWTK9Mmv0aQ54HZv4F9uacNDgtQ2WurbDh8YW0I4fCFDtd7w+ELcP"
+    "jC3os8hegPBR0TkZgOQsDHjGnkAeATNGpiPSnBMT5dtwGqXRf8vdx4llHuDQV+z/k9hH3f"
+    "77lDCPs+tBBcEPYduFFrB3g8yKt5wIs24AIX/F/r+sCzgoaH4cpO8GIDGdLqrZiIyjhXyl"
+    "Ab6FaWBRycA+uXTawKHJxdDP4mdihBaoGuSlZApfKIdrZNgoA9mO5hn4dYYN8qCavCBrGR"
+    "VYNtXRkiv4oLOUwKG6ATrwHfD2en5xezTwdvpnFkZcaaSDyKpMifHAFPBZ4KPBV46hZ4qr"
+    "iIyEgOQF1vnca4AJWsperoNNlR7oGXwNHVnvXRA1G7w0kFilFubup1KmGGfWJIpxGSK9Mm"
+    "TYvyPCBqBzaITxtE7RP2A+mmjno5VjABaZvPFHhqUQa99tEFtw7gq6OjFQBkuWoBjK6Jat"
+    "ah0kDN9Tv7Cybb2tbfyYdehmJn2/oV1i90P7y8/B+kgNKj"
+)
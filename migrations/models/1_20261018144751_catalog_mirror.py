@@ -0,0 +1,80 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "catalogpark" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "code" VARCHAR(255) NOT NULL UNIQUE,
+    "name" VARCHAR(255) NOT NULL,
+    "payload" TEXT NOT NULL,
+    "checksum" VARCHAR(64) NOT NULL,
+    "synced_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "created_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+) /* Espelho local de um parque da Maria API (payload original em JSON). */;
+        CREATE TABLE IF NOT EXISTS "catalogproduct" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "park_code" VARCHAR(255) NOT NULL,
+    "code" VARCHAR(255) NOT NULL,
+    "payload" TEXT NOT NULL,
+    "checksum" VARCHAR(64) NOT NULL,
+    "detail" TEXT,
+    "detail_checksum" VARCHAR(64),
+    "synced_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "created_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT "uid_catalogprod_park_co_4bbe34" UNIQUE ("park_code", "code")
+) /* Espelho local de um produto da Maria API (item da listagem + detalhe). */;
+CREATE INDEX IF NOT EXISTS "idx_catalogprod_park_co_f49672" ON "catalogproduct" ("park_code");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "catalogpark";
+        DROP TABLE IF EXISTS "catalogproduct";"""
+
+
+MODELS_STATE = (
+    "eJztXVtzmzgU/iuMn9JZbybNpmln31zX3XrbXKbx7nba6TAKKDYTbgXR1O3kv68EiKvAxm"
+    "AbOecpidAR0seR9H26nPwaWI6OTf94jDwy+FP5NbCRhekvufShMkCum6ayBIJuzTCjxnPc"
+    "+sRDGivlDpk+pkk69jXPcInh2DTVDkyTJToazWjY8zQpsI1vAVaJM8dkgT364MtXmmzYOv"
+    "6Bff6ne6/eGdjUc9U0dPbuMF0lSzdMm9rkbZiRve1W1RwzsOw0s7skC8dOcht2WP05trGH"
+    "CGbFEy9g1We1i1vJWxTVNM0SVTFjo+M7FJgk09w1MdAcm+FHa+OHDZyzt/x++vzs5dmrP8"
+    "7PXtEsYU2SlJePUfPStkeGIQKXs8Fj+BwRFOUIYUxx8wkigV/GbrxAnhi81KIAIK12EUAO"
+    "Vx2CPCGFMHUbjuGA+pPxHQ9a4GihH6qJ7TlZMPBevKhB7d/Rx/G70ccjmusZe6VD3Tny8c"
+    "v40Wn0jEGbQql5mDVbRaQM5xv6hBgWFkOatyzAqsemx/yXbYHc0lFpG/Qr21zGfaAG39n0"
+    "YnIzG11cs5ZYvv/NDCEazSbsyWmYuiykHp0XPkVSiPLfdPZOYX8qn68uJyGCjk/mXvjGNN"
+    "/s84DVCQXEUW3nQUV6prvyVA5M/sMGPnEs7KmNBpmC1erRpiffsZMBJzvAOB5uhlzW5CnB"
+    "xia3u/uKYZpCUobwLU015vZ7vAyRnNIqIVvDAuDiafyGl9M/BB+5G/DUtHd66CGZ8nPeQR"
+    "tIm4VJNGWNbsajN5OBsO92gN04U5S88BWGJTGCzBNvkXb/gDxdrXBJxvcMgi2VE788vK9j"
+    "87fvP2ITha2pRpaWMKVFyYVsiJJz6mTQyeFWfmSdWsUUZKN5WGv2bvamIiQVXJzDVc/HDZ"
+    "4LOHnPxvo6To4sJ7AFXaoSu9Rgd9Pl833jl+LleoYmmBwr4Ury7w6tk/6ghQh9321AsED1"
+    "/X1zdVnhYjmrAnD/2LRNX3RDI0PFNHzydWs68NdjCw1YAxNreE6NcKV3dDH6VBSB4w9Xr4"
+    "sygxXwGgThExGEdGptKAZTi6ekaPKjtKMHWkPc8kZPCboaMSgm3M31TFxM//BbW8ukvWq1"
+    "EoxdqQPgrtOS5MUu37OaysDtSh+CTGd+jbz7gVD9pI+H9QIozOjyjKs00GDiu9hcOIrpaM"
+    "hUdKwElkKt6ZdTdKRcIM9Ayuh6qhy5aGk6SFccz5gbNs2LLYURgGfHg8I36qpMUGE7V2Ea"
+    "9agm+yI8fze7IltHb/v7IeHPBgDy/LvbVuo9hPGgUEZxhn9UMabURBYg65TB5NOsXpclwu"
+    "DD1eVfPHtRrBV02QJr935gNerdGRtZcM076PnZGv55flbpnuxRYWtnSWnSJvI2Zwjqdq/q"
+    "Nq48rFoc2HeNVi1KKnK/lD4WTjWsPpVWq4l9Ju9m3J4VQJwCEWd7JiyJLWTS1ljKbzQ7fe"
+    "ECr0vvNypWwPC/DJh2UTmxDH9+Bdq/Xdqfg3xddpAz2hY9kE8B7FdCgQKQBkhQAHIqADaD"
+    "GWYT50wtNsIwHgMP2DUjgNRNPFRgKgnIoFRB0YBSfaLftV9KlR/yFGnUzAHQGnWazQXn7r"
+    "r0+C1LP9iwaC1XsCXkg9UYJgawbZYoPt9/cDxBH65bf0htwBuBIBwiQYBLRXCpaI+Xita9"
+    "EqNW3zhqeiVGLkjFVyZpN160RCIuahSXJCkidHamcHTjHFesLMmw2IVoC12kRrhxF1ot3r"
+    "jbgoDr23w2rBFwkgQz+I7M6KP1lzkjTcO+T533HttN8CzagRgBMXLoYgTCQ3QnSeC6frfX"
+    "9bfJuiIWKqBbCT2t5llOkgUIVs965wEQrHjC7DfFgsNR7SHkg2PTnZuSoZTnJLaLaeOtnL"
+    "IloFpCldYmsLAouscawGaNAdsSti4FZLNhILEEVJMVAF33mJSnr8W4kbuWLQHVIqp2YN2K"
+    "VM5qVFNLQLWIqmaQ5SaYcjtAtNz7acM36/yxIWBaxPSn4W6CaGwGeMKC6gAWVGFBFeLtwt"
+    "GYfhyNgXi7u4i3Gy6ZhwF3k8XzlidIIORueT+jKuZuDrAV+xoQdVfGvQ0Josj2AUAIUwyB"
+    "d/seeDc6a9loIMyaPNUODRFau5IPFQytMQWW8KBvkf9mOxYEaT2YIK01oZzWiuHUJHgT0O"
+    "Qe0WRJjgDJ8A/j4L5xawizNSshWReFJmcmC6B1a/zbiEUDknhDBi0+21cTsqtgBw5Z4ZDV"
+    "wfnq4qHtIDif7MjCZuqBbqbCfiDsBzYZcXZ0VT6Z8TL/pXDz7SxJ/4GkiDrkdpBgg6/LNY"
+    "sbbJriG0vxk2HdioWf5oEFi56N3MOaBQtQ2a1VNkT1ag0hRPWCc58gVVqF/cyw8XAq7iC2"
+    "UDTvSx5ZKEbDebDbngqTUJ3sgDBWRRXKO88q4ggRhWQkj5LsdkFEod4NWECEgAhtvGYbze"
+    "jNFm2zNrBqW1iyabtsmxTUPwzXXrfNOkifjhJFrFNEsDgdreFWSRagVT3rl3W0Ctbkupj8"
+    "dWwTAzWL0ZKzAjgz0Zgsy/B9WjHVxZ5GMaKDlYBWYc2wkFkBblUZRYIVFXIcF7YtzE9azy"
+    "kifN9MxtOL0YejF8PTEF9Km4xoGuHIn50AUQWiCkQViOoeiGrx4IsWx9Fvd7ZALkAF5386"
+    "+qcEUt7IFsDR1Q1q6YGovG/TBAopr9psdeNghD1DE24axE+GdaIWpXlA1fZsEh/WqNrv2P"
+    "OFFxGq9VjGBMRYulfgNouQ5W4eGWvvAD4/OVkDQJqrEsDwWVHN2kQYZLT6nnnGZF+XzDsZ"
+    "6EUodnbJvMFphe6nl8f/AUMf+bY="
+)
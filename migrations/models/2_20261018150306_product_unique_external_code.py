@@ -0,0 +1,75 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # Antes do índice único: aponta itens de carrinho/pedido de produtos
+    # duplicados para o mais antigo e remove as duplicatas
+    return """
+        UPDATE "cartitem" SET "product_id" = (
+            SELECT MIN(p2."id") FROM "product" p1
+            JOIN "product" p2 ON p2."store_id" = p1."store_id"
+                AND p2."park_code" = p1."park_code" AND p2."product_code" = p1."product_code"
+            WHERE p1."id" = "cartitem"."product_id"
+        );
+        UPDATE "orderitem" SET "product_id" = (
+            SELECT MIN(p2."id") FROM "product" p1
+            JOIN "product" p2 ON p2."store_id" = p1."store_id"
+                AND p2."park_code" = p1."park_code" AND p2."product_code" = p1."product_code"
+            WHERE p1."id" = "orderitem"."product_id"
+        );
+        DELETE FROM "product" WHERE "id" NOT IN (
+            SELECT MIN("id") FROM "product" GROUP BY "store_id", "park_code", "product_code"
+        );
+        CREATE UNIQUE INDEX "uid_product_store_i_79f492" ON "product" ("store_id", "park_code", "product_code");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "uid_product_store_i_79f492";"""
+
+
+MODELS_STATE = (
+    "eJztXVtv2zYU/iuCnlLMC9IsTYu9ua67em0uaLytaFAIjMTYQnSbRDX1ivz3kZKomynZsm"
+    "RbdM5TEoqHIj8dkt/Hy8lP1XYNbAXHI+QT9Xflp+ogG9NfCukDRUWel6WyBILurCijznPc"
+    "BcRHOivlHlkBpkkGDnTf9IjpOjTVCS2LJbo6zWg6sywpdMx/Q6wRd4bJHPv0we03mmw6Bv"
+    "6BA/6n96Ddm9gyCtU0DfbuKF0jCy9KmzjkfZSRve1O010rtJ0ss7cgc9dJc5tOVP0ZdrCP"
+    "CGbFEz9k1We1S1rJWxTXNMsSVzFnY+B7FFok19w1MdBdh+FHaxNEDZyxt/x6+vLs9dmb38"
+    "7P3tAsUU3SlNdPcfOytseGEQKXU/Upeo4IinNEMGa4BQSRMFjGbjRHvhi8zKIEIK12GUAO"
+    "Vx2CPCGDMHMbjqFK/cn8jtUWONroh2ZhZ0bmDLxXr2pQ+3v4efRh+PmI5nrBXulSd459/D"
+    "J5dBo/Y9BmUOo+Zs3WEFmG8x19QkwbiyEtWpZgNRLTY/7LtkBu6ai0DcaVYy2SPlCD73Ry"
+    "Mb6ZDi+uWUvsIPjXiiAaTsfsyWmUuiilHp2XPkVaiPLPZPpBYX8qX68uxxGCbkBmfvTGLN"
+    "/0q8rqhELiao77qCEj1115Kgem+GHDgLg29rVGg0zJavVo05Pv2MmAkx9gXB83Qy5v8pxg"
+    "Y5Pb/UPFME0hWYbwPU01Z85HvIiQnNAqIUfHAuCSafyGl9M/BJ+4G/DUrHf66DGd8gveQR"
+    "tIm4VJPGUNb0bDd2NV2Hc7wG6UK0pe+ErDkhhB5ol3SH94RL6hVbgk43smwbbGiV8R3reJ"
+    "+fuPn7GFotZUI0tLmNCi5EI2Qsk9dXPoFHBbfmSf2uUU5KBZVGv2bvamMiQVXJzDVc/HTZ"
+    "4LOHnPxvo6To5sN3QEXaoSu8xgd9Ply33jl+Hl+aYumBwr4Urz7w6tk/6ghQh9311IsED1"
+    "/XlzdVnhYgWrEnB/ObRNt4apk4FimQH5tjUd+POphQasgYk1vKBGuNI7uhh+KYvA0aert2"
+    "WZwQp4C4LwmQhCOrU2FIOZxXNSNMVR2jVCvSFuRaPnBF2NGBQT7uZ6Jimmf/itrWWyXrVa"
+    "CSau1AFw11lJ8mJX7FlNZeB2pQ9Blju7Rv6DKlQ/2eNBvQCKMno84yoNpI4DD1tzV7FcHV"
+    "mKgZXQVqg1/XKKgZQL5JtIGV5PlCMPLSwXGYrrmzPToXmxrTAC8OJYLX2jrsoEFbZzFaZT"
+    "j2qyL8Lzd7MrsnX0tr8fEv1sACDPv7ttpd5DmAwKyyhO8Y8qxpSZyAJknTIYf5nW67JUGH"
+    "y6uvyDZy+LtZIum2P9IQjtRr07ZyMLrkUHPT9bwz/Pzyrdkz0qbe0sKE3aRN4WDEHd7lXd"
+    "JpWHVYsD+67xqsWSitwvpU+EUw2rz6TVamKfy7sZt2cFELdExNmeCUtiC5m0NbbyC81OXz"
+    "jH69L7jYoVMPxblWkXjRPL6Oc3oP3bpf0FyNdlBwWjbdED+RTAfiUUKABpgAQFIKcCYDOY"
+    "aTVxzsxiIwyTMfCAXTMGSNvEQwWmkoAMShUUDSjVZ/pd+6VU+SFPkUbNHQCtUaf5XHDurk"
+    "uP37L0gw2L1nIF20I+WI1hagDbZqniC4JH1xf04br1h8wGvBEIwiESBLhUBJeK9nipaN0r"
+    "MVr1jaOmV2LkglR8ZZJ243lLJJKihklJkiJCZ2cKRzfOccXKkgyLXYi2yEVqhBt3odXijb"
+    "stCLi+zWeDGgEnSTCD78iKP1p/mTPSdRwE1HkfsNMEz7IdiBEQI4cuRiA8RHeSBK7rd3td"
+    "f5usK2ahArqV0tNqnuWmWYBg9ax3HgDBSibMflMsOBzVHkI+ODbduVkylPKcxHYxbbyVs2"
+    "wJqC6hSmsT2lgU3WMNYPPGgO0Sth4FZLNhILUEVNMVAMPwmZSnr8W4kbsuWwKqZVSd0L4T"
+    "qZzVqGaWgGoZVd0ki00w5XaA6HLvpw3frPMnhoBpGdP/TG8TRBMzwBMWVFVYUIUFVYi3C0"
+    "dj+nE0BuLt7iLebrRkHgXcTRfPW54ggZC7y/sZVTF3C4Ct2NeAqLsy7m1IEEW2DwBCmGII"
+    "vNv3wLvxWctGA2He5Ll2aIjQ2pV8qGBojSmwhAd9y/w337EgSOvBBGmtCeW0VgynJsGbGt"
+    "Hk20y7F6PyJFBCFKXupg7pDwrJ8G/l4FZyawjzNVtCsi5WTcFMFkDrdgK2EbEGhPOGPFt8"
+    "ArAmsFfJDhyywiGrQ/jVRU3bQQg/2ZGFLdcD3XKFXUPYNWwy4uzoQn064+X+l+Hmm16S/p"
+    "tJEXUo7DPBNmCXKxs32LLE95qSJ4O6dY0gywO7fz0buQc1CxagslurbIj91RpCiP0Fp0NB"
+    "qrQKDppj49FU3EEEonjelzz+UIKG++i0PTsmoTrZAWGsij1UdJ5VxBHiDslIHiXZ7YK4Q7"
+    "0bsIAIARHaeM02ntGbLdrmbWDVtrRk03bZNi2ofxiuvW6bd5A+HTiKWaeIYHE6WsOt0ixA"
+    "q3rWL+toFazJdTH5G9ghJmoWyaVgBXDmYjbZthkEtGKah32dYkQHKwGtwrppI6sC3Koyyg"
+    "QrLuQ4KWxbmJ+0nlNE+L4bjyYXw09HrwanEb6UNpnxNMKRPzsBogpEFYgqENU9ENXywRc9"
+    "ibbf7myBXIAKzv909K8LpLy3LYCjq3vW0gNReSunCRRSXsjZ6sbBEPumLtw0SJ4M6kQtyv"
+    "KAqu3ZJD6oUbXfsR8ILyJU67GcCYixbK/AaxZHy9s8ftbeAXx5crIGgDRXJYDRs7KadYgw"
+    "FGn1bfScyb6uoncy0ItQ7OwqeoPTCt1PL0//A0ubBrE="
+)
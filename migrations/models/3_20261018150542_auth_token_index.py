@@ -0,0 +1,60 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX "idx_customeraut_access__2a71ff" ON "customerauth" ("access_token");
+        CREATE INDEX "idx_sellerauth_access__4474e0" ON "sellerauth" ("access_token");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_sellerauth_access__4474e0";
+        DROP INDEX IF EXISTS "idx_customeraut_access__2a71ff";"""
+
+
+MODELS_STATE = (
+    "eJztXVtv2zYU/iuCnlLMC9IsTYu9ua67em0uaLytaFAIjMTYQnSbRDX1ivz3kZKomynZsm"
+    "RbdM5TEoqHIj8dkt/Hy8lP1XYNbAXHI+QT9Xflp+ogG9NfCukDRUWel6WyBILurCijznPc"
+    "BcRHOivlHlkBpkkGDnTf9IjpOjTVCS2LJbo6zWg6sywpdMx/Q6wRd4bJHPv0we03mmw6Bv"
+    "6BA/6n96Ddm9gyCtU0DfbuKF0jCy9KmzjkfZSRve1O010rtJ0ss7cgc9dJc5tOVP0ZdrCP"
+    "CGbFEz9k1We1S1rJWxTXNMsSVzFnY+B7FFok19w1MdBdh+FHaxNEDZyxt/x6+vLs9dmb38"
+    "7P3tAsUU3SlNdPcfOytseGEQKXU/Upeo4IinNEMGa4BQSRMFjGbjRHvhi8zKIEIK12GUAO"
+    "Vx2CPCGDMHMbjqFK/cn8jtUWONroh2ZhZ0bmDLxXr2pQ+3v4efRh+PmI5nrBXulSd459/D"
+    "J5dBo/Y9BmUOo+Zs3WEFmG8x19QkwbiyEtWpZgNRLTY/7LtkBu6ai0DcaVYy2SPlCD73Ry"
+    "Mb6ZDi+uWUvsIPjXiiAaTsfsyWmUuiilHp2XPkVaiPLPZPpBYX8qX68uxxGCbkBmfvTGLN"
+    "/0q8rqhELiao77qCEj1115Kgem+GHDgLg29rVGg0zJavVo05Pv2MmAkx9gXB83Qy5v8pxg"
+    "Y5Pb/UPFME0hWYbwPU01Z85HvIiQnNAqIUfHAuCSafyGl9M/BJ+4G/DUrHf66DGd8gveQR"
+    "tIm4VJPGUNb0bDd2NV2Hc7wG6UK0pe+ErDkhhB5ol3SH94RL6hVbgk43smwbbGiV8R3reJ"
+    "+fuPn7GFotZUI0tLmNCi5EI2Qsk9dXPoFHBbfmSf2uUU5KBZVGv2bvamMiQVXJzDVc/HTZ"
+    "4LOHnPxvo6To5sN3QEXaoSu8xgd9Ply33jl+Hl+aYumBwr4Urz7w6tk/6ghQh9311IsED1"
+    "/XlzdVnhYgWrEnB/ObRNt4apk4FimQH5tjUd+POphQasgYk1vKBGuNI7uhh+KYvA0aert2"
+    "WZwQp4C4LwmQhCOrU2FIOZxXNSNMVR2jVCvSFuRaPnBF2NGBQT7uZ6Jimmf/itrWWyXrVa"
+    "CSau1AFw11lJ8mJX7FlNZeB2pQ9Blju7Rv6DKlQ/2eNBvQCKMno84yoNpI4DD1tzV7FcHV"
+    "mKgZXQVqg1/XKKgZQL5JtIGV5PlCMPLSwXGYrrmzPToXmxrTAC8OJYLX2jrsoEFbZzFaZT"
+    "j2qyL8Lzd7MrsnX0tr8fEv1sACDPv7ttpd5DmAwKyyhO8Y8qxpSZyAJknTIYf5nW67JUGH"
+    "y6uvyDZy+LtZIum2P9IQjtRr07ZyMLrkUHPT9bwz/Pzyrdkz0qbe0sKE3aRN4WDEHd7lXd"
+    "JpWHVYsD+67xqsWSitwvpU+EUw2rz6TVamKfy7sZt2cFELdExNmeCUtiC5m0NbbyC81OXz"
+    "jH69L7jYoVMPxblWkXjRPL6Oc3oP3bpf0FyNdlBwWjbdED+RTAfiUUKABpgAQFIKcCYDOY"
+    "aTVxzsxiIwyTMfCAXTMGSNvEQwWmkoAMShUUDSjVZ/pd+6VU+SFPkUbNHQCtUaf5XHDurk"
+    "uP37L0gw2L1nIF20I+WI1hagDbZqniC4JH1xf04br1h8wGvBEIwiESBLhUBJeK9nipaN0r"
+    "MVr1jaOmV2LkglR8ZZJ243lLJJKihklJkiJCZ2cKRzfOccXKkgyLXYi2yEVqhBt3odXijb"
+    "stCLi+zWeDGgEnSTCD78iKP1p/mTPSdRwE1HkfsNMEz7Id7IWCFlEPW4tAdIjuFAnc1u/2"
+    "tv42SVdMQgVsK2Wn1TTLTbMAv+pZ7zwAfpVMmP1mWHA2qj2EfHBsunGzZCjlMYntYtp4J2"
+    "fZElBdQpXWJrSxKLjHGsDmjQHbJWw9Cshmw0BqCaimCwCG4TMlT1+LcSN3XbYEVMuoOqF9"
+    "J1I5q1HNLAHVMqq6SRabYMrtANHl3k8bvlnnTwwB0zKm/5neJogmZoAnLKiqsKAKC6oQbh"
+    "dOxvTjZAyE291FuN1oyTyKt5sunrc8QAIRd5f3M6pC7hYAW7GvAUF3ZdzbkCCIbB8AhCjF"
+    "EHe373F346OWjQbCvMlz7dAQoLUr+VDB0BpTYAnP+Zb5b75jQYzWg4nRWhPJaa0QTk1iNz"
+    "WiybeZdi8G5UmghCBK3U0d0h8UkuG/ysGl5NYQ5mu2hGRdqJqCmSyA1u0EbCNgDQjnDXm2"
+    "+ARgTVyvkh04ZIVDVkfwqwuatoMIfrIjC1uuB7rlCruGsGvYZMTZ0X36dMbL/SvDzTe9JP"
+    "0vkyLqUNhngm3ALlc2brBlie81JU8GdesaQZYHdv96NnIPahYsQGW3VtkQ+qs1hBD6C06H"
+    "glRpFRs0x8ajqbiDAETxvC95+KEEDffRaXt2TEJ1sgPCWBV6qOg8q4gjhB2SkTxKstsFYY"
+    "cg7BDwIJl5kGBCb7Zmm7eBRdvSik3bVdu0oP5huPaybd5B+nTeKCadIn7F2WgNtUqzAKvq"
+    "Wb+sY1WwJNfF5G9gh5ioWSCXghXAmQvZZNtmENCKaR72dYoRHawEtArrpo2sCnCryigTrL"
+    "iQ46SwbWF+0npOEeH7bjyaXAw/Hb0anEb4UtpkxtMIR/7sBIgqEFUgqkBU90BUy+de9CTW"
+    "frujBXIBKjj+09E/LpDy2rYAjq6uWUsPROWlnCZQSHkfZ6v7BkPsm7pwzyB5MqgTtSjLA6"
+    "q2Z5P4oEbVfsd+ILyHUK3HciYgxrKtAq9ZGC1v8/BZewfw5cnJGgDSXJUARs/KatYhwkik"
+    "1ZfRcyb7uoneyUAvQrGzm+gNDit0P708/Q/1dgYb"
+)
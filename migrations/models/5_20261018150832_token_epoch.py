@@ -0,0 +1,60 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "customer" ADD "token_epoch" INT NOT NULL DEFAULT 0;
+        ALTER TABLE "seller" ADD "token_epoch" INT NOT NULL DEFAULT 0;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "customer" DROP COLUMN "token_epoch";
+        ALTER TABLE "seller" DROP COLUMN "token_epoch";"""
+
+
+MODELS_STATE = (
+    "eJztXVtv2zYU/iuCnlLMC9IsTYu9ua67Zm0uaLytaFAIjMTYQiRRk6imXpH/PlL3CyVbtm"
+    "yL9nlqSvFQ5KdD8vt4Of6p2sTAln88Qh5Vf1d+qg6yMfujkD5QVOS6WSpPoOjeCjPqSY57"
+    "n3pI56U8IMvHLMnAvu6ZLjWJw1KdwLJ4ItFZRtOZZkmBY/4bYI2SKaYz7LEHd99YsukY+A"
+    "f2k/+6j9qDiS2jUE3T4O8O0zU6d8O0C4e+DzPyt91rOrEC28kyu3M6I06a23TC6k+xgz1E"
+    "MS+eegGvPq9d3MqkRVFNsyxRFXM2Bn5AgUVzzV0SA504HD9WGz9s4JS/5dfTl2evz978dn"
+    "72hmUJa5KmvH6Ompe1PTIMEbiaqM/hc0RRlCOEMcPNp4gGfhW70Qx5YvAyixKArNplABO4"
+    "mhBMEjIIM7dJMFSZP5nfsboGjjb6oVnYmdIZB+/VqwbU/h5+Hn0Yfj5iuV7wVxLmzpGPX8"
+    "WPTqNnHNoMSt3DvNkaolU437En1LSxGNKiZQlWIzY9Tv7YFMhrOiprg3HtWPO4DzTgO7m4"
+    "HN9Ohpc3vCW27/9rhRANJ2P+5DRMnZdSj85LnyItRPnnYvJB4f9Vvl5fjUMEiU+nXvjGLN"
+    "/kq8rrhAJKNIc8acjIddckNQGm+GEDnxIbe1qrQaZktXi06cl37GTAyQ8wxMPtkMubHBJs"
+    "fHJ7eKwZphkkVQjfs1Rz6nzE8xDJC1Yl5OhYAFw8jd8m5fQPwefEDZLUrHd66Cmd8gvewR"
+    "rImoVpNGUNb0fDd2NV2Hc7wG6UK0pe+ErDkhhB7on3SH98Qp6h1bgk53smxbaWEL8ivG9j"
+    "8/cfP2MLha2pR5aVcMGKkgvZECVySnLoFHCrPrJP7XIKctA0rDV/N39TGZIaLp7A1czHzS"
+    "QXcPKejfVNnBzZJHAEXaoWu8xge9Ply13jl+HleqYumBxr4Urzbw+tk/6ghSh7331AsUD1"
+    "/Xl7fVXjYgWrEnB/OaxNd4ap04FimT79tjEd+PN5DQ3YABNveEGNJErv6HL4pSwCR5+u35"
+    "ZlBi/gLQjCAxGEbGptKQYzi0NSNMVRmhiB3hK3otEhQdcgBsWEu72eiYvpH35La5msVy1W"
+    "grErdQDcTVaSvNgVe1ZbGbhZ6UORRaY3yHtUheonezxoFkBhRjfJuEgDqWPfxdaMKBbRka"
+    "UYWAlshVmzL6cYSLlEnomU4c2FcuSiuUWQoRDPnJoOy4tthROAF8dq6Rt1VSaosK2rMJ15"
+    "VJt9kSR/N7siG0dv8/sh4b8tAEzyb29bqfcQxoNCFcUJ/lHHmDITWYBsUgbjL5NmXZYKg0"
+    "/XV38k2ctiraTLZlh/9AO7Ve/O2ciCa9FBz8+W8M/zs1r35I9KWztzRpNWkbcFQ1C3O1W3"
+    "ceVh1WLPvmu0alFRkbul9LFwamD1mbRaTOxzeVfj9rwASkpEnO+Z8CS+kMlaYyu/sOzshT"
+    "O8LL1fqVgBw79TuXbREmIZ/vsNaP9maX8B8mXZQcFoU/RAPgWwWwkFCkAaIEEByKkA+Axm"
+    "Wm2cM7NYCcN4DNxj14wA0lbxUIGpJCCDUgVFA0r1QL9rv5RqcshTpFFzB0Ab1Gk+F5y769"
+    "LjNyz9YMNibbmCbSEfrMcwNYBts1Tx+f4T8QR9uGn9IbMBb0yhpOQROxp2iT5rMSKWrA7y"
+    "kChQqz2iVnAdC65j7fA61rKXibT6u1ptLxPJBan4sinrxoJZqxUScVHDuCRJEWG8hsHRjX"
+    "Nc87Ikw2Ibcjd0kQbJm7jQYtmbuC1I377NZ4MG6StJGIjvyIo+Wn81B9J17PtaKCLa4Fm2"
+    "g11k0CLqfmsRiKvRnSKBOAfdxjnYJOmKSKiAbaXstJ5mkTQL8Kue9c494FfxhNlvhgWnyt"
+    "aHMBkc2255VQylPGCyWUxb74FVLQHVCqqsNoGNRWFRlgA2bwzYVrB1GSCrDQOpJaCaLgAY"
+    "hseVPHstxq3ctWoJqJZRdQL7XqRyFqOaWQKqZVR1k85XwTSxA0SrvZ81fLXOHxsCpmVM/z"
+    "PdVRCNzQBPWFBVYUEVFlQhUDGcjOnHyRgIVLyNQMXhknkYqThdPF/zAAnEKq7uZ9QFKy4A"
+    "tmBfA8IVy7i3IUH43T4ACPGdIWJx3yMWR0ctWw2EeZND7dAQ2rYr+VDD0FpTYAnP+Zb5b7"
+    "5jQXTbvYlu2xADa6ngV22iXrWiyXeZdi+GM4qhhPBT3U0d0h8UkuH3+OA699oQ5mtWQbIp"
+    "yE/BTBZAm3YCNhHqB4TzijxbfAKwISJayQ4cssYh62MfNoWb20LsQ9mRhS3XPd1yhV1D2D"
+    "VsM+Js6T59OuPlfgRy9U0vSX+fU0QdCvtMsA3Y5crGLbYs8b2m+MmgaV3Dz/LA7l/PRu5B"
+    "w4IFqOy1VTYETVsbQgia1hmUEDQNgqaByGsTjzanY0IS00HopogxSR64KUaDPDnrnrqTUN"
+    "dtgWrXBW0qOs8iyg0Bm2Sk3ZLsE0LAJgjYBDxIZh4kmNDbrXbnbWC5u7TWte56d1pQ/zBc"
+    "esE77yB9OqkVkU4Rv0rYaAO1SrMAq+pZv2xiVbCY2cXkb2CHmqhdCJyCFVCpLNaVbZu+zy"
+    "qmudjTGURsrBKwKqybNrJqsK0ro8yvokKO48J6uGDXgO+78ejicvjp6NXgNMSXsSYzmkUS"
+    "5M9OgKcCTwWeCjx1Bzy1fGBIj3+kYL0zGXIBKjg31dEvPkh5310AR1f306UHovY2UxsopL"
+    "zItNFtgyH2TF24ZRA/GTRpWpTlAVHbs0l80CBqv2PPF17gqJdjOROQttlOgdsu/pi7etyx"
+    "nQP48uRkCQBZrloAw2dlNetQYQjX+lv8OZNdXeHvZKAXodjZFf4WZxW6n16e/wegq8uK"
+)
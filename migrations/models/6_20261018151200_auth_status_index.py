@@ -0,0 +1,61 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX "idx_customeraut_custome_f2787d" ON "customerauth" ("customer_id", "status");
+        CREATE INDEX "idx_sellerauth_seller__b7ce1d" ON "sellerauth" ("seller_id", "status");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_sellerauth_seller__b7ce1d";
+        DROP INDEX IF EXISTS "idx_customeraut_custome_f2787d";"""
+
+
+MODELS_STATE = (
+    "eJztXVtzmzgU/isMT+msN5Nm07Szb67rbr1tLtN4dzvNZBgFFJsJt4Jo6nby31fiJsACGx"
+    "vbyD5PTYWOkD6OpO/T5fiXarsGtoLjAfKJ+qfyS3WQjekfhfSeoiLP46ksgaB7K8qopznu"
+    "A+IjnZXygKwA0yQDB7pvesR0HZrqhJbFEl2dZjSdCU8KHfNbiDXiTjCZYp8+uL2jyaZj4B"
+    "84SP/rPWoPJraMQjVNg707StfIzIvSRg55H2Vkb7vXdNcKbYdn9mZk6jpZbtOJqj/BDvYR"
+    "wax44oes+qx2SSvTFsU15VniKuZsDPyAQovkmrskBrrrMPxobYKogRP2lt9PX569Pnvzx/"
+    "nZG5olqkmW8vo5bh5ve2wYIXA5Vp+j54igOEcEI8ctIIiEwTx2gynyxeBxixKAtNplAFO4"
+    "6hBMEziE3G1SDFXqT+Z3rK6Bo41+aBZ2JmTKwHv1qga1f/ufBx/6n49orhfslS5159jHL5"
+    "NHp/EzBi2HUvcxa7aGyDyc7+gTYtpYDGnRsgSrkZgep39sCuQ1HZW2wbhyrFnSB2rwHY8u"
+    "hjfj/sU1a4kdBN+sCKL+eMienEaps1Lq0XnpU2SFKP+Nxh8U9l/l69XlMELQDcjEj97I84"
+    "2/qqxOKCSu5rhPGjJy3TVNTYEpftgwIK6Nfa3RIFOyWjzadOQ7tjLg5AcY18fNkMubHBJs"
+    "bHJ7eKwYpikk8xC+p6nmxPmIZxGSI1ol5OhYAFwyjd+k5XQPwefUDdJU3jt99JRN+QXvoA"
+    "2kzcIknrL6N4P+u6Eq7LstYDfIFSUvfKVhSYwg88R7pD8+Id/QKlyS8T2TYFtLiV8R3reJ"
+    "+fuPn7GFotZUI0tLGNGi5EI2Qsk9dXPoFHCbf2Sf2uUU5KBJVGv2bvamMiQVXDyFq56Pm2"
+    "ku4OQdG+vrODmy3dARdKlK7LjB9qbLl7vGj+Pl+aYumBwr4crybw+tk+6ghQh9331IsED1"
+    "/X1zdVnhYgWrEnD/OLRNt4apk55imQG525gO/PW8hgasgYk1vKBGUqV3dNH/UhaBg09Xb8"
+    "sygxXwFgThgQhCOrU2FIPc4pAUTXGUdo1Qb4hb0eiQoKsRg2LC3VzPJMV0D7+ltQzvVYuV"
+    "YOJKLQB3zUuSF7tiz2oqAzcrfQiy3Mk18h9Vofrhj3v1AijK6KUZF2kgdRh42Jq6iuXqyF"
+    "IMrIS2Qq3pl1MMpFwg30RK/3qkHHloZrnIUFzfnJgOzYtthRGAF8dq6Ru1VSaosK2rMJ16"
+    "VJN9kTR/O7siG0dv8/sh0b8NAEzzb29bqfMQJoPCPIpj/KOKMXETWYCsUwbDL+N6XZYJg0"
+    "9Xl3+l2ctiraTLplh/DEK7Ue/O2ciCa9FBz8+W8M/zs0r3ZI9KWzszSpNWkbcFQ1C3O1W3"
+    "SeVh1WLPvmu8ajGnIndL6RPhVMPqubRaTOxzeVfj9qwA4paIONszYUlsIZO2xlZ+o9npC6"
+    "d4WXq/UrEChn+rMu2ipcQy+vcOaP9maX8B8mXZQcFoU/RAPgWwWwkFCkAaIEEByKkA2Axm"
+    "Wk2ck1ushGEyBu6xa8YAaat4qMBUEpBBqYKiAaV6oN+1W0o1PeQp0qi5A6A16jSfC87dte"
+    "nxG5Z+sGGxtlzBtpAPVmOYGcC2Wab4guDJ9QV9uG79gduAN2ZQEvcROxr2XH3aYEQsWR3k"
+    "IVGgVntEreA6FlzH2uF1rGUvE2nVd7WaXiaSC1LxZVPajQWzViMkkqL6SUmSIkJ5DYWjHe"
+    "e4YmVJhsU25G7kIjWSN3WhxbI3dduNSt/bgspOIhLcgSBeifVJHxziO7Lij9ZdJYJ0HQeB"
+    "FkmLJniW7WBvGRSKut8KBaJttKdTIPpBu9EPNknFYmoq4GAZZ60mX26WBTYcOtY794BfJR"
+    "NmtxkWnDVbH8J0cGy6ETZnKOWxk81i2nhnbN4SUJ1DldYmtLEoWMoSwOaNAds5bD0KyGrD"
+    "QGYJqGYLAIbhMyVPX4txI3edtwRUy6g6oX0vUjmLUeWWgGoZVd0ks1UwTe0A0fneTxu+Wu"
+    "dPDAHTMqY/TW8VRBMzwBMWVFVYUIUFVQhfDOdlunFeBsIXbyN8cbRkHsUvzhbP1zxWAhGM"
+    "5/czqkIYFwBbsK8BQYxl3NuQIChvFwCEqM8Qx7jrcYzjA5iNBsK8yaF2aAh425Z8qGBojS"
+    "mwhKd/y/w337Eg5u3exLytiYy1VEisJrGwGtHkW67di0GOEighKFV7U4f0B4Vk+JU+uOS9"
+    "NoT5ms0hWRf6p2AmC6B1OwGbCAAEwnlFni0+AVgTJ61kBw5Z4ZDVERHrgtBtISKi7MjClu"
+    "uebrnCriHsGjYZcbZ0yz6b8XI/Dbn6ppekv9opog6FfSbYBmxzZeMGW5b4XlPypFe3rhHw"
+    "PLD717GRu1ezYAEqe22VDaHU1oYQQqm1BiWEUoNQaiDymkSpzemYiMS0ENApZkySh3NK0H"
+    "CfnHVP3Umo67ZAtatCORWdZxHl3lIYJ87vIYjTYe8dQhAnCOIE3EhmbiSY5JutgOdtYAm8"
+    "tP617hp4VlD3MFx6ETzvIF06vRUTURHnShlqDd3KssACZ8f6ZR2rggXONiZ/AzvERM3C4h"
+    "SsgErx+Fe2bQYBrZjmYV+nENGxSsCqsG7ayKrAtqqMMr+KCzlOCuvgIl4Nvu+Gg9FF/9PR"
+    "q95phC9lTWY8i6TIn50ATwWeCjwVeOoOeGr5EJGe/JzBeuc05AJUcJaqpd+GkPIOvACOtu"
+    "6sSw9E5Q2nJlBIeblpo1sJfeybunAbIXnSq9O0iOcBUduxSbxXI2q/Yz8QXuqolmM5E5C2"
+    "fKfAaxaTzFs9FtnOAXx5crIEgDRXJYDRs7KadYgwrGv1zf6cya6u9bcy0ItQbO1af4PzC+"
+    "1PL8//A7wJ2eM="
+)
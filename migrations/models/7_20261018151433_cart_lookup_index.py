@@ -0,0 +1,59 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX "idx_cart_store_i_db29d3" ON "cart" ("store_id", "customer_id", "status");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_cart_store_i_db29d3";"""
+
+
+MODELS_STATE = (
+    "eJztXVtzmzgU/isMT+msN5Nm07Szb67rbr1tLtN4dzvNZBgFFJsJt4Jo6nby31cSdyywsb"
+    "GN7PMUR5wj0Icu36fL4Zdquwa2guMB8on6p/JLdZCN6Y9Cek9RkedlqSyBoHuLG+qJxX1A"
+    "fKSzXB6QFWCaZOBA902PmK5DU53Qsliiq1ND05lkSaFjfguxRtwJJlPs0wu3dzTZdAz8Aw"
+    "fs31s1IK6P2X30kP60qRX9HRBEwkC9Y9beo/ZgYssolMI0mBlP18jM42kjh7znhuxh7jXd"
+    "tULbyYy9GZm6TmptOrx0E+xgHxHMsid+yErHHj4GISlwVJDMJCpBzsfADyi0SA6NJSHSXY"
+    "fBS58m4AWcsLv8fvry7PXZmz/Oz95QE/4kacrr56h4WdkjR47A5Vh95tcRQZEFRznDLQZ2"
+    "DrvBFPli8DKPEoD0scsAJnDVIZgkZBBmtSrBUKXVzfzOa8WqONroh2ZhZ0KmDLxXr2pQ+7"
+    "f/efCh//mIWr1gt3RpbY+awGV86TS6xqDNoNR9zIqtITIP5zt6hZg2FkNa9CzBasSux8mP"
+    "TYG8ZkWlZTCuHGsWt4EafMeji+HNuH9xzUpiB8E3i0PUHw/ZlVOeOiulHp2XXkWaifLfaP"
+    "xBYf8qX68uhxxBNyATn98xsxt/VdkzoZC4muM+acjINdckNQGm+GLjjkhr1MmUvBb3Nh15"
+    "j610OPkOhnbnzZDLuxwSbGxwe3is6KbjQbEI4Xuaak6cj3jGkRzRR0KOjgXAxaP8TZJP9x"
+    "B8TqpBkpq1Th89pUN+oXbQAtJiYRINWf2bQf/dUBW23RawG+Sykhe+UrckRpDVxHukPz4h"
+    "39AqqiSjgybBtpbwwiK8b2P39x8/Ywvx0lQjS3MY0azkQpaj5J66OXQKuM1fsk/tcgpy0I"
+    "Q/Nbs3u1MZkgqqnsBVT9fNxGqTlB04ecucHNlu6AiaVCV2mcP2hsuXu8Yvw8vzTV0wOFbC"
+    "ldpvD62T7qCFCL3ffUiwQPX9fXN1WVHFCl4l4P5xaJluDVMnPcUyA3K3MR3463kNDVgDEy"
+    "t4QY0kSu/oov+lLAIHn67elmUGy+AtCMIDEYR0aG0oBjOPQ1I0xV7aNUK9IW5Fp0OCrkYM"
+    "igl3cz0TZ9M9/JbWMlmrWqwE46rUAnDXWU7yYldsWU1l4GalD0GWO7lG/qMqVD/Z5V69AO"
+    "KGXmK4SAOpw8DD1tRVLFdHlmJgJbQV6k3fnGIg5QL5JlL61yPlyEMzy0WG4vrmxHSoLbYV"
+    "RgBeHKuld9RWnqDCtq7CdFqjmqyLJPbtrIpsHL3Nr4fwvw0ATOy3t6zUeQjjTmEexTH+Uc"
+    "WYMhdZgKxTBsMv43pdlgqDT1eXfyXmZbFW0mVTrD8God2oded8ZMG1WEHPz5aon+dnldWT"
+    "XSot7cwoTVpF3hYcQd3uVN3GDw+zFnv2XqNZizkVuVtKHwunGlafSavFxD5nuxq3ZxkQt0"
+    "TE2ZoJS2ITmbQ0tvIbNac3nOJl6f1K2QoY/q3KtIuWEEv+9w5o/2ZpfwHyZdlBwWlT9EA+"
+    "BbBbCQUKQBogQQHIqQDYCGZaTSpn5rEShnEfuMdVMwJIW6WGClwlARmUKigaUKoH+l67pV"
+    "STTZ4ijZrbAFqjTvNWsO+uzRq/YekHCxZryxVsC/lgNYapAyybpYovCJ5cX9CG6+YfMh+o"
+    "jSmUxH3EjoY9V5826BFLXge5SRSo1R5RKziOBcexdngca9nDRFr1Wa2mh4nkglR82JQ2Y8"
+    "Go1QiJOKt+nJOkiFBeQ+Fop3Jcsbwkw2IbcpdXkRrJm1ShxbI3qbYbjhIBwSEgOERyKOg7"
+    "sqKX1l0lgnQdB4HGpUUTPMt+sLYMCkXdb4UC0Tba0ykQ/aDd6AebpGIRNRVwsJSzVpMvNz"
+    "WBBYeOtc494FfxgNlthgV7zdaHMOkcmy6EzTlKue1ks5g2Xhmb9wRU51ClTxPaWBQsZQlg"
+    "886A7Ry2HgVktW4g9QRU0wkAw/CZkqe3xbhRdZ33BFTLqDqhfS9SOYtRzTwB1TKquklmq2"
+    "Ca+AGi862fFny1xh87AqZlTH+a3iqIxm6AJ0yoqjChChOqEL4Y9st0Y78MhC/eRvhiPmXO"
+    "4xenk+drbiuBCMbz6xlVIYwLgC1Y14AgxjKubUgQlLcLAELUZ4hj3PU4xtEGzEYdYd7lUB"
+    "s0BLxtSz5UMLTGFFjC3b9l/ptvWBDzdm9i3tZExloqJFaTWFiNaHLue3zFIEcxlBCUqr2h"
+    "Q/qNQjJ8pQ8Oea8NYf7J5pCsC/1TcJMF0LqVgE0EAALhvCLPFu8ArImTVvKDCllRIasjIt"
+    "YFodtCRETZkYUl1z1dcoVVQ1g1bNLjbOmUfTri5T4Nufqil6Rf7RRRh8I6EywDtjmzcYMt"
+    "S3yuKb7Sq5vXCDIbWP3rWM/dq5mwAJW9tsqGUGprQwih1FqDEkKpQSg1EHlNotTmdAwnMS"
+    "0EdIoYk+ThnGI03Cdn3V13Euq6LVDtqlBOxcqziHJvKYxTxu8hiNNhrx1CECcI4gTcSGZu"
+    "JBjkm82A531gCrw0/7XuHHiaUfcwXHoSPF9BurR7KyKiIs6VMNQaupWawARnx9plHauCCc"
+    "42Bn8DO8REzcLiFLyASmXxr2zbDAL6YJqHfZ1CRPsqAavCumkjqwLbqjzK/CrK5DjOrIOT"
+    "eDX4vhsORhf9T0eveqccX8qazGgUSZA/OwGeCjwVeCrw1B3w1PImIj3+nMF6+zTkAlSwl6"
+    "qlb0NIeQZeAEdbZ9alB6LyhFMTKKQ83LTRpYQ+9k1duIwQX+nVaVqU2YCo7dgg3qsRtd+x"
+    "HwgPdVTLsZwLSNtspcBrFpPMWz0W2c4BfHlysgSA1KoSQH6trGYdIgzrWn2yP+eyq2P9rX"
+    "T0IhRbO9bfYP9C+8PL8//Nu+RC"
+)
@@ -0,0 +1,59 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "cart" ADD "version" INT NOT NULL DEFAULT 0;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "cart" DROP COLUMN "version";"""
+
+
+MODELS_STATE = (
+    "eJztXVtzmzgU/isMT+msN5Nm07Szb67rbr1tLtN4dzvNZBgFFJsJtwWR1NvJf1+JmwALbD"
+    "DYYJ+nOEJHSJ+PpO/T5finbNoaNrzjEXKJ/Lv0U7aQiemHTPpAkpHj8FSWQNC9EWRU4xz3"
+    "HnGRykp5QIaHaZKGPdXVHaLbFk21fMNgibZKM+rWjCf5lv6vjxVizzCZY5c+uL2jybql4R"
+    "/YY//eyh6xXczeo/r0o0lz0c8eQcT35DuW23lUHnRsaJlW6BrLFqQrZOEEaROLfAwyssrc"
+    "K6pt+KbFMzsLMretJLduBa2bYQu7iGBWPHF91jpW+QiEuMFhQ3iWsAUpGw0/IN8gKTTWhE"
+    "i1LQYvrY0XNHDG3vLr6euzt2fvfjs/e0ezBDVJUt6+hM3jbQ8NAwQup/JL8BwRFOYIUOa4"
+    "RcAuYTeaI1cMHrfIAUirnQcwhqsMwTiBQ8i9KsZQpu6mPwVeURdHE/1QDGzNyJyB9+ZNCW"
+    "p/D7+OPg2/HtFcr9grbertYRe4jB6dhs8YtBzKJ+x6rFbr+2HKYrUzNoXlya6dkSOmupg1"
+    "TkFkGbQP9AnRTSxGLmuZA0+LTI/jD21BuWHXpm3QrixjEY0aJdBNJxfjm+nw4pq1xPS8f4"
+    "0AouF0zJ6cBqmLXOrRec55k0KkfybTTxL7V/p+dTkOELQ9MnODN/J80+8yqxPyia1Y9rOC"
+    "tNQAF6fGwGS/2GjoVioNyzmr7XWJLgzR6SGZToDVkEubHBJsjA48PBZMbBGNyEL4kabqM+"
+    "szXgRITmiVkKViAXARL7qJy+kegi+xG8SpvHe66DkhSRnvoA2kzcIknOSHN6Phh7Es7LsN"
+    "YDdKFdVf+HLDkhhB5on3SH18Rq6mFLgkI9A6waYSM+ksvO8j84+fv2IDETExSLH1CS2qX8"
+    "gGKNmndgqdDG7Lj8xTM5+CLDQLas3ezd6Uh6RA3MRwlQscPc7VpsgBFVNriixWMci0fUvQ"
+    "pQqx4wbbmy5f7xo/jpfj6qpgciyEK8l/kDIFEfq+e59ggU7+8+bqssDFMlY54P6yaJtuNV"
+    "0lA8nQPXLXmnL++bKBai6BiTU8o0ZibXx0MfyWl82jL1fv8zKDFfAeBOGBCEI6tVYUg9zi"
+    "kBRNdpS2NV+tiFvW6JCgKxGDYsJdXc9ExXQPv7W1DO9Vq5Vg5EoNAHfNS+ovdtmeVVUGti"
+    "t9CDLs2TVyH2Wh+uGPB+UCKMjoxBlXaSB57DnYmNuSYavIkDQs+aZErek3J2lIukCujqTh"
+    "9UQ6ctDCsJEm2a4+0y2aF5sSIwCvjuXcd9RUmaDCtq7CVOpRVXaS4vzN7CO1jl77O0jB3w"
+    "oAxvm3txHXeQijQWEZxSn+UcSYuElfgCxTBuNv03JdlgiDL1eXf8TZ82Itp8vmWH30fLNS"
+    "707Z9AXXrIOen63hn+dnhe7JHuW2dhaUJtWRtxlDULc7VbdR5WHVYs++13DVYklF7pbSR8"
+    "KphNVzabWa2Kfy1uP2rABi54g42zNhSWwhk7bGlH6h2ekL53hdel+rWAHDv5WZdlFiYhn8"
+    "vQPa3y7tz0C+LjvIGLVFD/qnAHYroUAB9AZIUAD9VABsBtONKs7JLWphGI2Be+yaIUBKHQ"
+    "8VmPYEZFCqoGhAqR7o99otpRof8hRp1NQB0BJ1ms4F5+6a9PiWpR9sWGwsV7Ap5IPFGCYG"
+    "sG2WKD7Pe7ZdQR8uW3/gNuCNCZTEfsSWgh1bnVcYEXNWB3lIFKjVHlEruI4F17F2eB1r3c"
+    "tESvFdraqXifoFqfiyKe3GglmrEhJRUcOopJ4iQnkNhaMZ57hiZfUMi23I3cBFSiRv7EKr"
+    "ZW/sti3H1YBwGhBOI74U9ISM8EvrrhJBqoo9TwmkRRU883awtwwKRd5vhQLRNprTKRD9oN"
+    "noB21SsZCaCjhYwlmLyZedZIENh471zj3gV9GE2W2GBWfNNocwHhyrboQtGfby2Em7mFbe"
+    "GVu2BFSXUKW18U0sCpayBrBpY8B2CVuHAlJvGEgsAdVkAUDTXKbk6WsxruSuy5aAah5Vyz"
+    "fvRSpnNarcElDNo6rqZFEH09gOEF3u/bTh9Tp/ZAiY5jH9T3fqIBqZAZ6woCrDgiosqEL4"
+    "Yjgv043zMhC+eBvhi4Ml8yB+cbJ4vuGxEohgvLyfURTCOAPYin0NCGLcx72NHgTl7QKAEP"
+    "UZ4hh3PY5xeACz0kCYNjnUDg0Bb5uSDwUMrTIF7uHp3zz/TXcsiHm7NzFvSyJjrRUSq0os"
+    "rEo0OfULhtkgRxGUEJSquamj9weF+vC7hnDJe2MI0zVbQrIs9E/GrC+Alu0EtBEACIRzTZ"
+    "4tPgFYEictZwcOWeCQxRERy4LQbSEiYt+RhS3XPd1yhV1D2DWsMuJs6ZZ9MuOlfhqy/qZX"
+    "T3+1U0QdMvtMsA3Y5MrGDTYM8b2m6MmgbF3D43lg969jI/egZMECVPbGKhtCqW0MIYRSaw"
+    "xKCKUGodRA5FWJUpvSMQGJaSCgU8iYeh7OKULDfrY2PXXXQ123BapdFMop6zyrKPeWwjhx"
+    "fg9BnA577xCCOEEQJ+BGfeZGgkm+2gp42gaWwHPrX5uugScFdQ/DtRfB0w7SpdNbIREVca"
+    "6YoZbQrSQLLHB2rF+WsSpY4Gxi8tewRXRULSxOxgqoFI9/ZZq659GKKQ52VQoRHasErAqr"
+    "uomMAmyLysjzq7CQ46iwDi7ileD7YTyaXAy/HL0ZnAb4Utakh7NIjPzZCfBU4KnAU4Gn7o"
+    "Cn5g8RqdHPGWx2TqNfgArOUjX02xC9vAMvgKOpO+u9B6LwhlMVKHp5uanVrYQhdnVVuI0Q"
+    "PRmUaVrE84Co7dgkPigRtU/Y9YSXOorlWMoEpC3fKXCqxSRz6sci2zmAr09O1gCQ5ioEMH"
+    "iWV7MWEYZ1Lb7ZnzLZ1bX+RgZ6EYqNXeuvcH6h+enl5X/I0EQc"
+)
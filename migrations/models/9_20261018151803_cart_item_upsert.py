@@ -0,0 +1,117 @@
+import hashlib
+import json
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+BATCH_SIZE = 1000
+
+
+def attributes_key(attributes) -> str:
+    # Cópia de src/utils.py::attributes_key (a migração não depende do código da app)
+    if isinstance(attributes, (str, bytes)):
+        attributes = json.loads(attributes)
+    normalized = json.dumps(attributes or {}, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def marks(db: BaseDBAsyncClient, count: int) -> list:
+    if db.capabilities.dialect == 'postgres':
+        return [f"${i}" for i in range(1, count + 1)]
+    return ['?'] * count
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    await db.execute_script("""ALTER TABLE "cartitem" ADD "attributes_key" VARCHAR(64) NOT NULL DEFAULT '';""")
+
+    # Preenche attributes_key em lotes
+    key_mark, id_mark = marks(db, 2)
+    while True:
+        rows = await db.execute_query_dict(
+            f"""SELECT "id", "attributes" FROM "cartitem" WHERE "attributes_key" = '' ORDER BY "id" LIMIT {BATCH_SIZE}"""
+        )
+        if not rows:
+            break
+        await db.execute_many(
+            f"""UPDATE "cartitem" SET "attributes_key" = {key_mark} WHERE "id" = {id_mark}""",
+            [[attributes_key(row['attributes']), row['id']] for row in rows],
+        )
+
+    # Junta as linhas duplicadas (mesmo carrinho, produto e atributos) na mais
+    # antiga, somando as quantidades, também em lotes
+    amount_mark, keep_mark = marks(db, 2)
+    cart_mark, product_mark, attributes_mark, keep_id_mark = marks(db, 4)
+    while True:
+        groups = await db.execute_query_dict(f"""
+            SELECT "cart_id", "product_id", "attributes_key", MIN("id") AS "keep_id", SUM("amount") AS "total"
+            FROM "cartitem"
+            GROUP BY "cart_id", "product_id", "attributes_key"
+            HAVING COUNT(*) > 1
+            LIMIT {BATCH_SIZE}""")
+        if not groups:
+            break
+        await db.execute_many(
+            f"""UPDATE "cartitem" SET "amount" = {amount_mark} WHERE "id" = {keep_mark}""",
+            [[group['total'], group['keep_id']] for group in groups],
+        )
+        await db.execute_many(
+            f"""DELETE FROM "cartitem" WHERE "cart_id" = {cart_mark} AND "product_id" = {product_mark}
+                AND "attributes_key" = {attributes_mark} AND "id" <> {keep_id_mark}""",
+            [[group['cart_id'], group['product_id'], group['attributes_key'], group['keep_id']] for group in groups],
+        )
+
+    return """
+        CREATE UNIQUE INDEX "uid_cartitem_cart_id_74cec8" ON "cartitem" ("cart_id", "product_id", "attributes_key");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "uid_cartitem_cart_id_74cec8";
+        ALTER TABLE "cartitem" DROP COLUMN "attributes_key";"""
+
+
+MODELS_STATE = (
+    "eJztXVtzmzgU/isMT+msN5Nm07Szb26abrNtLtN4dzvNdBgFFJsJt4JI6nby31fiJhACGx"
+    "tsiM9THHGOQB+6fJ8uh1+q7RrYCvZPkE/UP5VfqoNsTH8U0keKijyPp7IEgm6tyFBPLW4D"
+    "4iOd5XKHrADTJAMHum96xHQdmuqElsUSXZ0ams6UJ4WO+T3EGnGnmMywTy/cfKPJpmPgHz"
+    "hg/96oAXF9zO6jh/SnTa3o74AgEgbqN2bt3Wt3JraMQilMg5lF6RqZe1HamUPeR4bsYW41"
+    "3bVC2+HG3pzMXCezNp2odFPsYB8RzLInfshKxx4+ASEtcFwQbhKXIOdj4DsUWiSHxpIQ6a"
+    "7D4KVPE0QFnLK7/H748uj10Zs/jo/eUJPoSbKU109x8XjZY8cIgYuJ+hRdRwTFFhHKHLcE"
+    "2BJ2JzPky8HjHgKA9LFFAFO46hBMEziEvFalGKq0upkPUa1YFUcb/dAs7EzJjIH36lUNav"
+    "+OP598GH/eo1Yv2C1dWtvjJnCRXDqMrzFoOZQP2A/YUy1fD3MeiytjW1gebLsycsR0H7PC"
+    "aYiUQXtHrxDTxnLkip4CeEbiup/+6ArKNZs2LYNx6VjzpNeogW5ydn56PRmfX7GS2EHw3Y"
+    "ogGk9O2ZXDKHUupO4dC5U3y0T572zyQWH/Kl8vL04jBN2ATP3ojtxu8lVlz4RC4mqO+6gh"
+    "I9fBpakpMMUXm3TdWqNuWfDaXJPoQxed75LpANgMubzLLsHG6MDdfcXAltCIIoTvaao5dT"
+    "7ieYTkGX0k5OhYAlzCi67TfPqH4FNaDdJU3jp99JiRpELtoAWkxcIkHuTH1yfjd6eqtO22"
+    "gN1JLqvhwid0S3IEWU28Rfr9I/INraJKMgJtEmxrKZMuwvs2cX//8TO2EJETgxxbP6NZDQ"
+    "vZCCX30M2hU8CtfMk+tMUU5KBp9NTs3uxOIiQV4iaFq17gmKlVqyLnJhNPnu8aoR7rKEId"
+    "b0OCA+0ez2Ntk1NCIHVWGkerpQ6y3dCRtLtK7LjD5sbUl9vGj+Pl+aYuGUEr4crsd1LL8N"
+    "Zchuzv68uLiipW8BKA+8ehZboxTJ2MFMsMyLfO5PWvpzWkdQ1MrOAFyZIK6L3z8RdRW598"
+    "unwrahGWwVtQjbuhGoUBsfRyq+ekyp4bnJtqbVbq+GiJSanjo8o5KXZJaCqUdTTU4Nxjl4"
+    "RkcdyLKFoz3IpOuwRdjQaX65zmMjLJpn/4LS0heataLMBzEmFN4K54TsPFrtiymqrvbhUn"
+    "QZY7vUL+vSoVnfzyqF53RoZearhIeqqngYetmatYro4sxcBKaCvUm745xUDKOfJNpIyvzp"
+    "Q9D80tFxmK65tT06G22FYYpXqxrwrvqK08F6/wga5daXyq1rU6rVFNyFJq3w5F6hy97hfu"
+    "or8NAEztN8cxew9h0imUUZzgH1WMibsMBcg6rXX6ZVKvdDOp9eny4q/UXJS/An2fYf0+CO"
+    "1GrTvnMxRcu5ZBwZzSpFUmDAqOMF+w1fmC5OFhHuiZvdd4HqikIrdL6RPhVMPqc+s4C4l9"
+    "znY1bs8yIK5AxNlSFUtiU8O0NLbyGzWnN5zhZen9StlKl7eYdtFSYhn9heWsjml/AfJl2U"
+    "HBqSt6MDwFsF0JBQpgMECCAhimAmAjmGk1qZzcYyUMkz7wGVfNGCBtlRoqcR0IyKBUQdGA"
+    "Ut3R99ovpZrurZVp1Ny+2xp1mrfq8kwXSL9Ru9IPFizWlivYlvLBagwzB1g2yxRfEDy6vq"
+    "QN180/cB+ojRmUxL3HjoY9V5816BEFr53cdgvU6hlRKzgFB6fgtngKbtkzXFr1EbmmZ7iG"
+    "Ban8jC9txpJRqxESSVbjJKeBIkJ5DYWjncpxyfIaGBabkLtRFamRvGkVWix702rbcTgTiG"
+    "ICUUzSkyIPyIpfWn+VCNJ1HARaJC2a4Cn6wdoyKBT1eSsUCHLSnk6BoBPtBp3okorF1FTC"
+    "wTLOWk2+3MwEFhx61jqfAb9KBsx+MyzYa7Y+hGnn2HQhrOQ4yG0n3WLaeGWs7AmollClTx"
+    "PaWBZ+Zglg886AbQlbjwKyWjeQeQKq2QSAYfhMydPbYtyoupY9AVURVSe0b2UqZzGq3BNQ"
+    "FVHVTdIsXIzgB4iWWz8t+GqNP3EETEVMf5reKogmboAnTKiqMKEKE6oQNRr2y/RjvwxEjd"
+    "5E1OhoyjwKG51Nnq+5rQQCR5fXM6oiRxcAW7Cu0U3saFjb6HZtYwBhjvsAIMTRhsjQfY8M"
+    "HW/AbNQR5l12tUFDwNu25EMFQ2tMgQe4+1fkv/mGBTFvn03M25rIWEuFxGoSC6sRTc59OL"
+    "IY5CiBEoJStTd0DH6j0BA+JwmHvNeGMP9kJSTrQv8U3IYCaN1KQBcBgEA4r8iz5TsAa+Kk"
+    "CX5QISsqZHVExLogdBuIiDh0ZGHJ9ZkuucKqIawaNulxNnTKPhvxcl/kXH3Ra6AfS5VRh8"
+    "I6EywDtjmzcY0tS36uKbkyqpvXCLgNrP71rOce1UxYgMpeW2VDKLW1IYRQaq1BCaHUIJQa"
+    "iLwmUWpzOiYiMS0EdIoZ08DDOSVouI/OurvuBqjrNkC1q0I5FSvPIsq9oTBOnN9DEKfdXj"
+    "uEIE4QxAm40ZC5kWSQbzYDnveBKXBh/mvdOfAso/5huPQkeL6C9Gn3VkxEZZwrZag1dCsz"
+    "gQnOnrXLOlYFE5xtDP4GdoiJmoXFKXgBleLxr2zbDAL6YJqHfZ1CRPsqCavCumkjqwLbqj"
+    "xEfhVnsp9k1sNJvBp8352enJ2PP+29Gh1G+FLWZMajSIr80QHwVOCpwFOBp26Bp4qbiPTk"
+    "cwbr7dMYFqCSvVQtfRtikGfgJXC0dWZ98EBUnnBqAsUgDzd1upQwxr6pS5cRkiujOk2LuA"
+    "2I2p4N4qMaUfuA/UB6qKNajuVcQNrylQKvWUwyb/VYZFsH8OXBwRIAUqtKAKNropp1iDSs"
+    "a/XJ/pzLto71t9LRy1Bs7Vh/g/0L7Q8vT/8Dc1K9YQ=="
+)
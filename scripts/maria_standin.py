@@ -0,0 +1,398 @@
+"""
+Servidor substituto (stand-in) da Maria API para desenvolvimento offline,
+benchmarks e testes de carga. Fica fora do pacote src: não é código de
+produção.
+
+Implementa os mesmos endpoints usados pelo MariaApi:
+
+    GET /parks/
+    GET /parks/{park_code}
+    GET /parks/{park_code}/products
+    GET /parks/{park_code}/products/{product_code}
+
+servindo um catálogo sintético (tamanho configurável) ou gravado em JSON, com
+injeção de latência, erros e timeouts. Basta apontar MARIA_API_ENDPOINT para
+ele ou usar httpx.ASGITransport nos testes.
+
+Uso:
+    poetry run python scripts/maria_standin.py --port 8100 --parks 5 --products 200 \
+        --latency lognormal:4.5:0.6 --error-rate 0.02 --timeout-rate 0.01
+
+    MARIA_API_ENDPOINT=http://127.0.0.1:8100 poetry run fastapi dev src/application.py
+
+Com --catalog caminho.json serve um catálogo gravado no formato
+{"parks": [...], "products": {"<park_code>": [...]}}.
+"""
+import argparse
+import asyncio
+import copy
+import hashlib
+import json
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+
+
+# ---------------------------------------------------------------------------
+# Catálogo sintético (formato original da Maria API, camelCase)
+# ---------------------------------------------------------------------------
+
+def make_price(amount_cents: int, rate_cents: int = 530) -> dict:
+    brl = amount_cents * rate_cents // 100
+    return {
+        'original': {'amount': f"{amount_cents // 100}.{amount_cents % 100:02d}", 'currency': 'USD', 'symbol': '$'},
+        'usdbrl': {'amount': f"{brl // 100}.{brl % 100:02d}", 'currency': 'BRL', 'symbol': 'R$'},
+    }
+
+
+def make_translations(name: str, languages=('pt', 'en', 'es')) -> list:
+    return [
+        {
+            'language_code': language,
+            'name': f"{name} ({language})",
+            'description': f"Descrição do ingresso {name} em {language}. " * 4,
+            'note': f"Observação {language}",
+            'observation': None,
+        }
+        for language in languages
+    ]
+
+
+def make_park(index: int, languages=('pt', 'en', 'es')) -> dict:
+    name = f"Parque {index}"
+    return {
+        'code': f"00000000-0000-4000-9000-{index:012d}",
+        'name': name,
+        'description': f"Descrição do {name}",
+        'images': {
+            'cover': f"https://example.com/parks/{index}/cover.jpg",
+            'thumbnail': f"https://example.com/parks/{index}/thumb.jpg",
+        },
+        'parklocation': {'city': 'Orlando', 'state': 'FL'},
+        'attraction': 'Magic Kingdom, EPCOT',
+        'status': True,
+        'translations': make_translations(name, languages),
+    }
+
+
+def make_park_product(index: int, rng: random.Random, languages=('pt', 'en', 'es')) -> dict:
+    days = rng.randint(1, 5)
+    adult = rng.randint(10000, 60000)
+    child = adult - rng.randint(500, 3000)
+    name = f"{days}-Day Ticket #{index}"
+    return {
+        'code': f"00000000-0000-4000-8000-{index:012d}",
+        'ticketName': name,
+        'parkIncluded': 'Magic Kingdom',
+        'parkLocation': {'city': 'Orlando', 'state': 'FL'},
+        'isMultiDays': days > 1,
+        'isParkToPark': rng.random() < 0.3,
+        'isDated': True,
+        'isTimed': False,
+        'availableOptions': ['park-hopper', 'water-parks'],
+        'extensions': {
+            'numberDays': days,
+            'usageWindow': days + 2,
+            'numberParks': 1,
+            'productKind': 'ticket',
+            'aboutTicket': 'Ingresso com acesso a um parque por dia.',
+            'ticketType': 'base',
+            'ticketBanner': None,
+            'observations': None,
+        },
+        'prices': {
+            'adult': make_price(adult),
+            'child': make_price(child),
+            'total': make_price(adult * 2 + child),
+            'type': 'per_person',
+        },
+        'isSpecial': False,
+        'translations': make_translations(name, languages),
+        'hasActivePromo': rng.random() < 0.1,
+    }
+
+
+def make_park_products(size: int, seed: int = 42, languages=('pt', 'en', 'es'), offset: int = 0) -> list:
+    rng = random.Random(seed)
+    return [make_park_product(offset + i, rng, languages) for i in range(size)]
+
+
+def make_product_detail(product: dict) -> dict:
+    """Detalhe no formato de /parks/{code}/products/{code} a partir de um item da listagem."""
+    extensions = product['extensions']
+    return {
+        'code': product['code'],
+        'ticketName': product['ticketName'],
+        'parkIncluded': product['parkIncluded'],
+        'parklocation': product['parkLocation'],
+        'isMultiDays': product['isMultiDays'],
+        'isParkToPark': product['isParkToPark'],
+        'isDated': product['isDated'],
+        'isTimed': product['isTimed'],
+        'availableOptions': product['availableOptions'],
+        'extensions': {
+            'days': extensions['numberDays'],
+            'parks': extensions['numberParks'],
+            'productKind': extensions['productKind'],
+            'aboutTicket': extensions.get('aboutTicket'),
+            'ticketType': extensions.get('ticketType'),
+            'ticketBanner': extensions.get('ticketBanner'),
+            'observations': extensions.get('observations'),
+            'notes': None,
+        },
+        'startingPrice': product['prices']['adult'],
+        'isSpecial': product['isSpecial'],
+        'status': True,
+        'translations': product['translations'],
+    }
+
+
+class StandinCatalog:
+    def __init__(self, parks: List[dict], products: Dict[str, List[dict]]):
+        self.parks = parks
+        self.products = products
+        self._parks_by_code = {park['code']: park for park in parks}
+        self._products_by_code = {
+            park_code: {product['code']: product for product in park_products}
+            for park_code, park_products in products.items()
+        }
+
+    @classmethod
+    def synthetic(cls, parks: int = 3, products_per_park: int = 50, seed: int = 42,
+                languages=('pt', 'en', 'es')) -> "StandinCatalog":
+        park_list = [make_park(i, languages) for i in range(parks)]
+        products = {
+            park['code']: make_park_products(products_per_park, seed=seed + i, languages=languages,
+                                             offset=i * products_per_park)
+            for i, park in enumerate(park_list)
+        }
+        return cls(park_list, products)
+
+    @classmethod
+    def from_file(cls, path: str) -> "StandinCatalog":
+        """
+        Catálogo gravado: {"parks": [...], "products": {"<park_code>": [...]}}
+        com os payloads originais da Maria API.
+        """
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data['parks'], data.get('products', {}))
+
+    def get_park(self, park_code: str) -> Optional[dict]:
+        return self._parks_by_code.get(park_code)
+
+    def get_products(self, park_code: str) -> Optional[List[dict]]:
+        return self.products.get(park_code)
+
+    def get_product(self, park_code: str, product_code: str) -> Optional[dict]:
+        return self._products_by_code.get(park_code, {}).get(product_code)
+
+
+def price_for_params(products: List[dict], params: dict) -> List[dict]:
+    """
+    Simula preços dinâmicos: para cada combinação de forDate/numAdults/...
+    os preços variam de forma determinística (até ±10%).
+    """
+    if not params:
+        return products
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).digest()
+    factor = 0.9 + (digest[0] / 255) * 0.2
+    priced = copy.deepcopy(products)
+    for product in priced:
+        for price_type in ('adult', 'child', 'total'):
+            for currency in ('original', 'usdbrl'):
+                price = product['prices'][price_type][currency]
+                cents = round(float(price['amount']) * 100 * factor)
+                price['amount'] = f"{cents // 100}.{cents % 100:02d}"
+    return priced
+
+
+# ---------------------------------------------------------------------------
+# Injeção de falhas
+# ---------------------------------------------------------------------------
+
+def parse_latency(spec: str):
+    """
+    Distribuição de latência em milissegundos:
+
+        "0" | "fixed:50" | "uniform:20:200" | "normal:100:20"
+        | "lognormal:4.0:0.5" | "exponential:80"
+
+    Retorna uma função rng -> segundos.
+    """
+    kind, _, args = spec.partition(':')
+    values = [float(value) for value in args.split(':') if value]
+    if not args:
+        value = float(kind)
+        return lambda rng: value / 1000
+    if kind == 'fixed':
+        return lambda rng: values[0] / 1000
+    if kind == 'uniform':
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if kind == 'normal':
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1])) / 1000
+    if kind == 'lognormal':
+        return lambda rng: rng.lognormvariate(values[0], values[1]) / 1000
+    if kind == 'exponential':
+        return lambda rng: rng.expovariate(1 / values[0]) / 1000 if values[0] > 0 else 0.0
+    raise ValueError(f"Unknown latency distribution: {spec!r}")
+
+
+@dataclass
+class FaultProfile:
+    latency: str = "0"
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    timeout_seconds: float = 30.0
+    error_status_codes: List[int] = field(default_factory=lambda: [500, 502, 503])
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        self.rng = random.Random(self.seed)
+        self.sample_latency = parse_latency(self.latency)
+
+
+@dataclass
+class StandinStats:
+    requests: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    by_path: Dict[str, int] = field(default_factory=dict)
+
+    def as_dict(self) -> dict:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'timeouts': self.timeouts,
+            'by_path': self.by_path,
+        }
+
+
+def create_standin_app(catalog: StandinCatalog = None, faults: FaultProfile = None) -> FastAPI:
+    app = FastAPI(title="Maria API stand-in", default_response_class=ORJSONResponse)
+    app.state.catalog = catalog or StandinCatalog.synthetic()
+    app.state.faults = faults or FaultProfile()
+    app.state.stats = StandinStats()
+
+    @app.middleware("http")
+    async def inject_faults(request: Request, call_next):
+        if request.url.path.startswith('/_standin'):
+            return await call_next(request)
+
+        stats: StandinStats = app.state.stats
+        faults: FaultProfile = app.state.faults
+        stats.requests += 1
+        stats.by_path[request.url.path] = stats.by_path.get(request.url.path, 0) + 1
+
+        delay = faults.sample_latency(faults.rng)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        roll = faults.rng.random()
+        if roll < faults.timeout_rate:
+            stats.timeouts += 1
+            await asyncio.sleep(faults.timeout_seconds)
+            return ORJSONResponse({'detail': 'Gateway Timeout'}, status_code=504)
+        if roll < faults.timeout_rate + faults.error_rate:
+            stats.errors += 1
+            status_code = faults.rng.choice(faults.error_status_codes)
+            return ORJSONResponse({'detail': 'Injected error'}, status_code=status_code)
+
+        return await call_next(request)
+
+    @app.get("/parks/")
+    async def get_parks():
+        return app.state.catalog.parks
+
+    @app.get("/parks/{park_code}")
+    async def get_park(park_code: str):
+        park = app.state.catalog.get_park(park_code)
+        if park is None:
+            raise HTTPException(status_code=404, detail="Park not found")
+        return park
+
+    @app.get("/parks/{park_code}/products")
+    async def get_park_products(request: Request, park_code: str):
+        products = app.state.catalog.get_products(park_code)
+        if products is None:
+            raise HTTPException(status_code=404, detail="Park not found")
+        return price_for_params(products, dict(request.query_params))
+
+    @app.get("/parks/{park_code}/products/{product_code}")
+    async def get_park_product_detail(park_code: str, product_code: str):
+        product = app.state.catalog.get_product(park_code, product_code)
+        if product is None:
+            raise HTTPException(status_code=404, detail="Product not found")
+        return make_product_detail(product)
+
+    @app.get("/_standin/stats")
+    async def get_stats():
+        return app.state.stats.as_dict()
+
+    @app.post("/_standin/stats/reset")
+    async def reset_stats():
+        app.state.stats = StandinStats()
+        return app.state.stats.as_dict()
+
+    @app.put("/_standin/faults")
+    async def update_faults(request: Request):
+        """Troca o perfil de falhas em tempo de execução (ex.: simular um incidente)."""
+        body = await request.json()
+        try:
+            app.state.faults = FaultProfile(**body)
+        except (TypeError, ValueError, IndexError) as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return body
+
+    return app
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Stand-in da Maria API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8100)
+    parser.add_argument('--catalog', help="Catálogo gravado (JSON)")
+    parser.add_argument('--parks', type=int, default=3)
+    parser.add_argument('--products', type=int, default=50, help="Produtos por parque")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--latency', default='0',
+                        help="fixed:MS | uniform:MIN:MAX | normal:MEAN:STD | lognormal:MU:SIGMA | exponential:MEAN")
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--timeout-rate', type=float, default=0.0)
+    parser.add_argument('--timeout-seconds', type=float, default=30.0)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.catalog:
+        catalog = StandinCatalog.from_file(args.catalog)
+    else:
+        catalog = StandinCatalog.synthetic(parks=args.parks, products_per_park=args.products, seed=args.seed)
+    faults = FaultProfile(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        timeout_seconds=args.timeout_seconds,
+        seed=args.seed,
+    )
+
+    print(f"\n🎢 Maria API stand-in em http://{args.host}:{args.port}")
+    print(f"  parques: {len(catalog.parks)}")
+    print(f"  produtos: {sum(len(products) for products in catalog.products.values())}")
+    print(f"  latência: {args.latency}  erros: {args.error_rate:.0%}  timeouts: {args.timeout_rate:.0%}\n")
+
+    uvicorn.run(create_standin_app(catalog, faults), host=args.host, port=args.port, log_level='warning')
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,36 @@
+"""
+Script CLI para remover manualmente os tokens invalidados ou expirados
+(tabelas customerauth e sellerauth).
+
+Uso:
+    poetry run python scripts/purge_auth_tokens.py
+"""
+import sys
+import os
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tortoise import Tortoise
+from src.configuration import TORTOISE_ORM
+from src.auth_purge import purge_auth_tokens
+
+
+async def main():
+    print("\n🧹 Removendo tokens invalidados/expirados...\n")
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        summary = await purge_auth_tokens()
+    finally:
+        await Tortoise.close_connections()
+
+    for key, value in summary.items():
+        print(f"  {key}: {value}")
+    print("\n✓ Concluído")
+    return 0
+
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(main())
+    exit(exit_code)
@@ -0,0 +1,36 @@
+"""
+Script CLI para marcar manualmente os carrinhos abandonados e remover seus
+itens.
+
+Uso:
+    poetry run python scripts/sweep_carts.py
+"""
+import sys
+import os
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tortoise import Tortoise
+from src.configuration import TORTOISE_ORM
+from src.cart_sweeper import sweep_abandoned_carts
+
+
+async def main():
+    print("\n🧹 Limpando carrinhos abandonados...\n")
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        summary = await sweep_abandoned_carts()
+    finally:
+        await Tortoise.close_connections()
+
+    for key, value in summary.items():
+        print(f"  {key}: {value}")
+    print("\n✓ Concluído")
+    return 0
+
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(main())
+    exit(exit_code)
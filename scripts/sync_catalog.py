@@ -0,0 +1,44 @@
+"""
+Script CLI para sincronizar manualmente o catálogo da Maria API com o
+espelho local (tabelas catalogpark e catalogproduct).
+
+Uso:
+    poetry run python scripts/sync_catalog.py
+"""
+import sys
+import os
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tortoise import Tortoise
+from src.configuration import TORTOISE_ORM
+from src.integrations.maria_api.maria import MariaApi
+from src.integrations.maria_api.sync import CatalogSyncMetrics, sync_catalog
+
+
+async def main():
+    print("\n🔄 Sincronizando catálogo da Maria API...\n")
+    
+    await Tortoise.init(config=TORTOISE_ORM)
+    await Tortoise.generate_schemas()
+    
+    metrics = CatalogSyncMetrics()
+    try:
+        async with MariaApi() as maria_client:
+            summary = await sync_catalog(maria_client, metrics)
+    except Exception as e:
+        print(f"sync error: {e}")
+        return 1
+    finally:
+        await Tortoise.close_connections()
+    
+    for key, value in summary.items():
+        print(f"  {key}: {value}")
+    print(f"\n✓ Concluído em {metrics.last_duration:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(main())
+    exit(exit_code)
@@ -1,11 +1,24 @@
+import asyncio
+import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from src.configuration import configure_db, configure_routes
+from src.configuration import configure_db, configure_routes, configure_maria_resilience
 from src.seed import seed_database
+from src.invalidation import invalidation_bus
+from src.auth_purge import PURGE_INTERVAL, run_periodic_purge
+from src.cart_sweeper import CART_SWEEP_INTERVAL, run_periodic_sweep
+from src import idempotency
+from src.integrations.maria_api.maria import MariaApi
+from src.integrations.maria_api.cache import MariaResponseCache
+from src.integrations.maria_api.mirror import CatalogMirror
+from src.integrations.maria_api.sync import CatalogSyncMetrics, run_periodic_sync, SYNC_INTERVAL
 
+# Opt-in: o espelho só é confiável com o sync em background rodando
+CATALOG_MIRROR_ENABLED = os.getenv('MARIA_CATALOG_MIRROR', 'false').lower() in ('1', 'true', 'yes')
 
-def create_lifespan(run_seed=True):
+
+def create_lifespan(run_seed=True, run_background_jobs=True):
     """
     Cria o context manager de lifespan.
     """
@@ -13,26 +26,64 @@ def create_lifespan(run_seed=True):
     async def lifespan(app: FastAPI):
         """
         Gerencia o ciclo de vida da aplicação.
-        Executa seed do banco de dados no startup.
+        Executa seed do banco de dados, cria o cliente da Maria API e inicia
+        a sincronização do catálogo no startup.
         """
+        # Cliente HTTP compartilhado (pool de conexões keep-alive + cache de respostas)
+        app.state.maria_client = MariaApi(
+            cache=MariaResponseCache(),
+            mirror=CatalogMirror() if CATALOG_MIRROR_ENABLED else None,
+        )
+        app.state.catalog_sync = CatalogSyncMetrics()
+        background_tasks = []
+
+        # Invalidação dos caches de autenticação entre workers
+        await invalidation_bus.start()
+
         # Startup: executar seed (apenas em produção/dev, não em testes)
         if run_seed:
             try:
                 await seed_database()
             except Exception as e:
                 print(f"⚠️  Erro ao executar seed: {e}")
+
+        # Sincronização periódica do catálogo (cliente próprio, sem cache nem espelho)
+        sync_client = None
+        if run_background_jobs and CATALOG_MIRROR_ENABLED and SYNC_INTERVAL > 0:
+            sync_client = MariaApi()
+            background_tasks.append(asyncio.create_task(
+                run_periodic_sync(sync_client, app.state.catalog_sync)
+            ))
+
+        # Limpeza periódica dos tokens invalidados/expirados
+        if run_background_jobs and PURGE_INTERVAL > 0:
+            background_tasks.append(asyncio.create_task(run_periodic_purge()))
+
+        # Carrinhos abandonados: marca e remove os itens
+        if run_background_jobs and CART_SWEEP_INTERVAL > 0:
+            background_tasks.append(asyncio.create_task(run_periodic_sweep()))
+
+        # Chaves de idempotência expiradas
+        if run_background_jobs and idempotency.IDEMPOTENCY_PURGE_INTERVAL > 0:
+            background_tasks.append(asyncio.create_task(idempotency.run_periodic_purge()))
         
         yield
         
-        # Shutdown: cleanup se necessário
-        pass
+        # Shutdown: parar jobs e fechar conexões com a Maria API
+        for task in background_tasks:
+            task.cancel()
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+        if sync_client is not None:
+            await sync_client.aclose()
+        await app.state.maria_client.aclose()
+        await invalidation_bus.aclose()
     
     return lifespan
 
 
 def create_application(fake_db=False):
-    # Não executar seed em testes (fake_db=True)
-    lifespan = create_lifespan(run_seed=not fake_db)
+    # Não executar seed nem jobs em background em testes (fake_db=True)
+    lifespan = create_lifespan(run_seed=not fake_db, run_background_jobs=not fake_db)
     app = FastAPI(lifespan=lifespan)
 
     # Configurar arquivos estáticos
@@ -40,6 +91,7 @@ def create_application(fake_db=False):
 
     configure_db(app, fake_db)
     configure_routes(app)
+    configure_maria_resilience(app)
 
     return app
 
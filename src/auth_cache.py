@@ -0,0 +1,227 @@
+"""
+Caches em memória da autenticação: access tokens resolvidos
+(token -> Customer/Seller), usuários dos tokens assinados ((papel, id) ->
+Customer/Seller) e credenciais de loja (credential -> Store).
+
+Evitam as consultas de autenticação em toda requisição. A revogação continua
+imediata: generate_credentials chama invalidate_user e a alteração de uma loja
+chama invalidate_store, que descartam as entradas neste processo e, via
+barramento de invalidação, nos demais.
+
+Para não recolocar no cache um valor revogado durante a consulta ao banco,
+cada resolução guarda o "relógio" lido antes da consulta; entradas com relógio
+anterior à última invalidação da chave são descartadas.
+"""
+import os
+from typing import Dict, Hashable
+from src.cache import TTLCache
+from src.invalidation import InvalidationBus, invalidation_bus
+
+AUTH_TOKEN_CACHE_TTL = float(os.getenv('AUTH_TOKEN_CACHE_TTL', '60'))
+AUTH_TOKEN_CACHE_MAX_ENTRIES = int(os.getenv('AUTH_TOKEN_CACHE_MAX_ENTRIES', '10000'))
+
+STORE_CACHE_TTL = float(os.getenv('STORE_CACHE_TTL', '300'))
+STORE_CACHE_MAX_ENTRIES = int(os.getenv('STORE_CACHE_MAX_ENTRIES', '1000'))
+# Credenciais inválidas ficam num cache próprio (e menor), para que tentativas
+# de adivinhar credenciais não despejem as lojas válidas
+STORE_NEGATIVE_CACHE_TTL = float(os.getenv('STORE_NEGATIVE_CACHE_TTL', '30'))
+STORE_NEGATIVE_CACHE_MAX_ENTRIES = int(os.getenv('STORE_NEGATIVE_CACHE_MAX_ENTRIES', '10000'))
+
+INVALIDATION_TOPIC = 'auth_user'
+STORE_INVALIDATION_TOPIC = 'store_credential'
+
+
+class RevocationClock:
+    """
+    Relógio lógico de invalidações por chave.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.clock = 0
+        # Relógio abaixo do qual toda entrada é inválida (após podar revoked)
+        self.floor = 0
+        self.revoked: Dict[Hashable, int] = {}
+        self.invalidations = 0
+
+    def snapshot(self) -> int:
+        return self.clock
+
+    def is_current(self, key: Hashable, stamp: int) -> bool:
+        return stamp >= self.floor and stamp >= self.revoked.get(key, 0)
+
+    def revoke(self, key: Hashable):
+        self.clock += 1
+        self.invalidations += 1
+        self.revoked[key] = self.clock
+        if len(self.revoked) > self.max_entries:
+            # Poda: tudo que foi resolvido até aqui passa a ser inválido
+            self.revoked.clear()
+            self.floor = self.clock
+
+
+class AccessTokenCache:
+    def __init__(self, ttl: float = AUTH_TOKEN_CACHE_TTL, max_entries: int = AUTH_TOKEN_CACHE_MAX_ENTRIES,
+                bus: InvalidationBus = invalidation_bus):
+        self.enabled = ttl > 0
+        self.cache = TTLCache(ttl=ttl, max_entries=max_entries)
+        self.revocations = RevocationClock(max_entries)
+        self.bus = bus
+        bus.subscribe(INVALIDATION_TOPIC, self._on_invalidation)
+
+    def snapshot(self) -> int:
+        """
+        Relógio a ser lido antes de consultar o banco e passado para put().
+        """
+        return self.revocations.snapshot()
+
+    def get(self, role: str, access_token: str):
+        if not self.enabled:
+            return None
+        cached = self.cache.get((role, access_token))
+        if cached is None:
+            return None
+        user, stamp = cached
+        if not self.revocations.is_current((role, user.id), stamp):
+            self.cache.delete((role, access_token))
+            return None
+        return user
+
+    def put(self, role: str, access_token: str, user, stamp: int, ttl: float = None):
+        """
+        ttl limita a permanência da entrada (ex.: tempo até o token expirar).
+        """
+        if self.enabled and self.revocations.is_current((role, user.id), stamp):
+            ttl = self.cache.ttl if ttl is None else min(ttl, self.cache.ttl)
+            self.cache.set((role, access_token), (user, stamp), ttl=ttl)
+
+    def invalidate_local(self, role: str, user_id: int):
+        self.revocations.revoke((role, user_id))
+
+    async def invalidate_user(self, role: str, user_id: int):
+        await self.bus.publish(INVALIDATION_TOPIC, f"{role}:{user_id}")
+
+    def _on_invalidation(self, key: str):
+        role, user_id = key.rsplit(':', 1)
+        self.invalidate_local(role, int(user_id))
+
+    def clear(self):
+        self.cache.clear()
+
+    def stats(self) -> dict:
+        return {
+            **self.cache.stats(),
+            'enabled': self.enabled,
+            'invalidations': self.revocations.invalidations,
+        }
+
+
+class UserCache:
+    """
+    (role, user_id) -> Customer/Seller, com a token_epoch usada na verificação
+    dos tokens assinados. Invalidado junto com os tokens do usuário.
+    """
+
+    def __init__(self, ttl: float = AUTH_TOKEN_CACHE_TTL, max_entries: int = AUTH_TOKEN_CACHE_MAX_ENTRIES,
+                bus: InvalidationBus = invalidation_bus):
+        self.enabled = ttl > 0
+        self.cache = TTLCache(ttl=ttl, max_entries=max_entries)
+        self.revocations = RevocationClock(max_entries)
+        bus.subscribe(INVALIDATION_TOPIC, self._on_invalidation)
+
+    def snapshot(self) -> int:
+        return self.revocations.snapshot()
+
+    def get(self, role: str, user_id: int):
+        if not self.enabled:
+            return None
+        cached = self.cache.get((role, user_id))
+        if cached is None:
+            return None
+        user, stamp = cached
+        if not self.revocations.is_current((role, user_id), stamp):
+            self.cache.delete((role, user_id))
+            return None
+        return user
+
+    def put(self, role: str, user, stamp: int):
+        if self.enabled and self.revocations.is_current((role, user.id), stamp):
+            self.cache.set((role, user.id), (user, stamp))
+
+    def _on_invalidation(self, key: str):
+        role, user_id = key.rsplit(':', 1)
+        self.revocations.revoke((role, int(user_id)))
+        self.cache.delete((role, int(user_id)))
+
+    def stats(self) -> dict:
+        return {**self.cache.stats(), 'enabled': self.enabled}
+
+
+class StoreCredentialCache:
+    """
+    credential -> Store, com cache negativo para credenciais inexistentes.
+    """
+
+    def __init__(self, ttl: float = STORE_CACHE_TTL, max_entries: int = STORE_CACHE_MAX_ENTRIES,
+                negative_ttl: float = STORE_NEGATIVE_CACHE_TTL,
+                negative_max_entries: int = STORE_NEGATIVE_CACHE_MAX_ENTRIES,
+                bus: InvalidationBus = invalidation_bus):
+        self.enabled = ttl > 0
+        self.negative_enabled = negative_ttl > 0
+        self.cache = TTLCache(ttl=ttl, max_entries=max_entries)
+        self.negative = TTLCache(ttl=negative_ttl, max_entries=negative_max_entries)
+        self.revocations = RevocationClock(max_entries)
+        self.bus = bus
+        bus.subscribe(STORE_INVALIDATION_TOPIC, self.invalidate_local)
+
+    def snapshot(self) -> int:
+        return self.revocations.snapshot()
+
+    def is_known_invalid(self, credential: str) -> bool:
+        return self.negative_enabled and self.negative.get(credential) is not None
+
+    def get(self, credential: str):
+        if not self.enabled:
+            return None
+        cached = self.cache.get(credential)
+        if cached is None:
+            return None
+        store, stamp = cached
+        if not self.revocations.is_current(credential, stamp):
+            self.cache.delete(credential)
+            return None
+        return store
+
+    def put(self, credential: str, store, stamp: int):
+        if not self.revocations.is_current(credential, stamp):
+            return
+        if store is None:
+            if self.negative_enabled:
+                self.negative.set(credential, True)
+        elif self.enabled:
+            self.cache.set(credential, (store, stamp))
+
+    def invalidate_local(self, credential: str):
+        self.revocations.revoke(credential)
+        self.cache.delete(credential)
+        self.negative.delete(credential)
+
+    async def invalidate_store(self, credential: str):
+        await self.bus.publish(STORE_INVALIDATION_TOPIC, credential)
+
+    def clear(self):
+        self.cache.clear()
+        self.negative.clear()
+
+    def stats(self) -> dict:
+        return {
+            **self.cache.stats(),
+            'enabled': self.enabled,
+            'invalidations': self.revocations.invalidations,
+            'negative': self.negative.stats(),
+        }
+
+
+access_token_cache = AccessTokenCache()
+user_cache = UserCache()
+store_cache = StoreCredentialCache()
@@ -0,0 +1,69 @@
+"""
+Limpeza das tabelas de tokens (customerauth e sellerauth).
+
+Tokens invalidados (substituídos por um novo login) ou expirados
+(created_at + AUTH_TOKEN_EXPIRATION) nunca mais são aceitos e são removidos em
+lotes de AUTH_TOKEN_PURGE_BATCH_SIZE, com uma pausa entre os lotes para não
+segurar locks nem disputar o banco com as requisições.
+"""
+import asyncio
+import datetime
+import logging
+import os
+from typing import Dict
+from tortoise import timezone
+from tortoise.expressions import Q
+from src.models import CustomerAuth, SellerAuth
+from src.tokens import AUTH_TOKEN_EXPIRATION
+
+logger = logging.getLogger(__name__)
+
+# 0 desativa o job em background
+PURGE_INTERVAL = float(os.getenv('AUTH_TOKEN_PURGE_INTERVAL', '3600'))
+PURGE_BATCH_SIZE = int(os.getenv('AUTH_TOKEN_PURGE_BATCH_SIZE', '1000'))
+PURGE_BATCH_PAUSE = float(os.getenv('AUTH_TOKEN_PURGE_BATCH_PAUSE', '0.05'))
+
+
+def expiration_cutoff(now: datetime.datetime = None) -> datetime.datetime:
+    """
+    Tokens criados antes deste instante estão expirados.
+    """
+    return (now or timezone.now()) - datetime.timedelta(seconds=AUTH_TOKEN_EXPIRATION)
+
+
+async def purge_model(model: CustomerAuth | SellerAuth, cutoff: datetime.datetime,
+                batch_size: int = PURGE_BATCH_SIZE, pause: float = PURGE_BATCH_PAUSE) -> int:
+    deleted = 0
+    while True:
+        ids = await model.filter(
+            Q(status='invalidated') | Q(created_at__lt=cutoff)
+        ).limit(batch_size).values_list('id', flat=True)
+        if not ids:
+            return deleted
+        deleted += await model.filter(id__in=ids).delete()
+        if len(ids) < batch_size:
+            return deleted
+        await asyncio.sleep(pause)
+
+
+async def purge_auth_tokens(batch_size: int = PURGE_BATCH_SIZE, pause: float = PURGE_BATCH_PAUSE) -> Dict[str, int]:
+    cutoff = expiration_cutoff()
+    return {
+        'customerauth': await purge_model(CustomerAuth, cutoff, batch_size, pause),
+        'sellerauth': await purge_model(SellerAuth, cutoff, batch_size, pause),
+    }
+
+
+async def run_periodic_purge(interval: float = PURGE_INTERVAL):
+    """
+    Loop de limpeza em background (iniciado no lifespan).
+    """
+    while True:
+        try:
+            summary = await purge_auth_tokens()
+            logger.info("Auth token purge finished: %s", summary)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Auth token purge failed: %s", e)
+        await asyncio.sleep(interval)
@@ -1,5 +1,8 @@
 from functools import wraps
-from src.models import CustomerAuth, SellerAuth, Store
+from src.models import Customer, CustomerAuth, Seller, SellerAuth, Store
+from src.auth_cache import access_token_cache, store_cache, user_cache
+from src.tokens import is_signed_token, token_signer
+from src.auth_purge import expiration_cutoff
 from fastapi import HTTPException, Request
 import datetime
 
@@ -8,13 +11,48 @@ async def valid_access_token(access_token: str, model: CustomerAuth | SellerAuth
     if not access_token:
         raise HTTPException(status_code=403, detail="Unauthorized")
     access_token = access_token.split(' ')[1]
-    user_auth = await model.filter(status='valid', access_token=access_token).first()
+    role = 'customer' if model == CustomerAuth else 'seller'
+    if token_signer is not None and is_signed_token(access_token):
+        return await valid_signed_token(access_token, role)
+
+    user = access_token_cache.get(role, access_token)
+    if user is not None:
+        return user
+
+    # Lido antes da consulta: uma revogação concorrente descarta o resultado
+    stamp = access_token_cache.snapshot()
+    cutoff = expiration_cutoff()
+    user_auth = await model.filter(
+        status='valid', access_token=access_token, created_at__gte=cutoff
+    ).select_related(role).first()
     if not user_auth:
         raise HTTPException(status_code=403, detail="Unauthorized")
-    if model == CustomerAuth:
-        return await user_auth.customer
-    else:
-        return await user_auth.seller
+    user = getattr(user_auth, role)
+    # Nunca mantém em cache além da expiração do token
+    access_token_cache.put(role, access_token, user, stamp, ttl=(user_auth.created_at - cutoff).total_seconds())
+    return user
+
+
+async def valid_signed_token(access_token: str, role: str):
+    """
+    Verifica a assinatura e a expiração em CPU; o banco só é consultado para
+    carregar o usuário (e sua token_epoch) quando ele não está em cache.
+    """
+    claims = token_signer.verify(access_token, role)
+    if not claims:
+        raise HTTPException(status_code=403, detail="Unauthorized")
+    user = user_cache.get(role, claims['sub'])
+    # Época mais nova que a do cache: login feito em outro worker
+    if user is None or user.token_epoch < claims['ep']:
+        stamp = user_cache.snapshot()
+        user_model = Customer if role == 'customer' else Seller
+        user = await user_model.filter(id=claims['sub']).first()
+        if not user:
+            raise HTTPException(status_code=403, detail="Unauthorized")
+        user_cache.put(role, user, stamp)
+    if user.token_epoch != claims['ep']:
+        raise HTTPException(status_code=403, detail="Unauthorized")
+    return user
 
 
 def get_request(kwargs):
@@ -47,6 +85,18 @@ def seller_required(func):
 
     return wrapper
 
+async def resolve_store(credential: str):
+    store = store_cache.get(credential)
+    if store is not None:
+        return store
+    if store_cache.is_known_invalid(credential):
+        return None
+
+    stamp = store_cache.snapshot()
+    store = await Store.filter(credential=credential).first()
+    store_cache.put(credential, store, stamp)
+    return store
+
 def store_required(func):
     @wraps(func)
     async def wrapper(*args, **kwargs):
@@ -54,7 +104,7 @@ def store_required(func):
         credential = request.headers.get("Store-Credential", False)
         if not credential:
             raise HTTPException(status_code=403, detail="Store credential is invalid")
-        store = await Store.get(credential=credential)
+        store = await resolve_store(credential)
         if not store:
             raise HTTPException(status_code=403, detail="Store credential is invalid")
         request.current_store = store
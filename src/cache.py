@@ -0,0 +1,124 @@
+"""
+Cache em memória (por processo) com TTL e despejo LRU.
+"""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    expires_at: float
+    stale_until: float
+    size: int = 0
+
+    def is_fresh(self, now: float = None) -> bool:
+        return (now or time.monotonic()) < self.expires_at
+
+    def is_usable(self, now: float = None) -> bool:
+        return (now or time.monotonic()) < self.stale_until
+
+
+class TTLCache:
+    """
+    Cache LRU limitado por número de entradas e por tamanho aproximado (bytes).
+
+    Cada entrada tem um TTL (fresca) e, opcionalmente, uma janela extra em que
+    ainda pode ser servida como "stale" (stale_ttl). Depois disso é descartada.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 1024, max_size: int = None,
+                stale_ttl: float = 0):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        entry = self._data.get(key)
+        return entry is not None and entry.is_fresh()
+
+    def get_entry(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Retorna a entrada (fresca ou stale) sem contabilizar hit/miss.
+        Entradas fora da janela stale são removidas.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if not entry.is_usable():
+            self._remove(key)
+            return None
+        self._data.move_to_end(key)
+        return entry
+
+    def peek(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Retorna a entrada mesmo que já tenha saído da janela stale, sem
+        removê-la, sem alterar a ordem LRU e sem contabilizar hit/miss.
+        """
+        return self._data.get(key)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self.get_entry(key)
+        if entry is None or not entry.is_fresh():
+            self.misses += 1
+            return default
+        self.hits += 1
+        return entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: float = None, size: int = 0):
+        now = time.monotonic()
+        ttl = self.ttl if ttl is None else ttl
+        if key in self._data:
+            self._remove(key)
+        self._data[key] = CacheEntry(
+            value=value,
+            expires_at=now + ttl,
+            stale_until=now + ttl + self.stale_ttl,
+            size=size,
+        )
+        self.size += size
+        self._evict()
+
+    def delete(self, key: Hashable):
+        if key in self._data:
+            self._remove(key)
+
+    def clear(self):
+        self._data.clear()
+        self.size = 0
+
+    def _remove(self, key: Hashable):
+        entry = self._data.pop(key)
+        self.size -= entry.size
+
+    def _evict(self):
+        while self._data and (
+            len(self._data) > self.max_entries
+            or (self.max_size is not None and self.size > self.max_size)
+        ):
+            key, entry = self._data.popitem(last=False)
+            self.size -= entry.size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        return {
+            'entries': len(self._data),
+            'size': self.size,
+            'max_entries': self.max_entries,
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
@@ -0,0 +1,102 @@
+"""
+Cache write-through dos carrinhos ativos, por (store_id, customer_id).
+
+Cada snapshot guarda a resposta de /carts/current mais o id e a versão do
+carrinho (Cart.version, incrementada a cada alteração). As rotas do carrinho
+atualizam o snapshot no lugar depois de gravar, sem reler o carrinho. Se o
+snapshot não estiver na versão esperada (alteração concorrente, outro worker),
+ele é descartado e recarregado do banco.
+
+A versão também gera o ETag de /carts/current ("<cart_id>-<version>").
+
+Com vários workers, só o barramento compartilhado (AUTH_INVALIDATION_BUS=
+postgres) avisa os demais de uma alteração. Sem ele, o TTL padrão é curto
+(5s) e limita por quanto tempo outro worker pode servir um snapshot antigo.
+"""
+import copy
+import os
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+from src.auth_cache import RevocationClock
+from src.cache import TTLCache
+from src.invalidation import INVALIDATION_BUS, InvalidationBus, invalidation_bus
+
+# Sem o barramento compartilhado, o TTL é o atraso máximo entre workers
+CART_CACHE_TTL = float(os.getenv('CART_CACHE_TTL', '300' if INVALIDATION_BUS == 'postgres' else '5'))
+CART_CACHE_MAX_ENTRIES = int(os.getenv('CART_CACHE_MAX_ENTRIES', '10000'))
+
+INVALIDATION_TOPIC = 'cart'
+
+
+@dataclass
+class CartSnapshot:
+    cart_id: int = 0
+    version: int = 0
+    items: List[dict] = field(default_factory=list)
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.cart_id}-{self.version}"'
+
+    def to_response(self) -> dict:
+        return {
+            'cart_empty': not self.items,
+            'items': copy.deepcopy(self.items),
+        }
+
+
+class CartCache:
+    def __init__(self, ttl: float = CART_CACHE_TTL, max_entries: int = CART_CACHE_MAX_ENTRIES,
+                bus: InvalidationBus = invalidation_bus):
+        self.enabled = ttl > 0
+        self.cache = TTLCache(ttl=ttl, max_entries=max_entries)
+        self.revocations = RevocationClock(max_entries)
+        self.bus = bus
+        bus.subscribe(INVALIDATION_TOPIC, self._on_invalidation)
+
+    def snapshot(self) -> int:
+        return self.revocations.snapshot()
+
+    def get(self, key: Tuple[int, int]) -> Optional[CartSnapshot]:
+        if not self.enabled:
+            return None
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        cart, stamp = cached
+        if not self.revocations.is_current(key, stamp):
+            self.cache.delete(key)
+            return None
+        return cart
+
+    def put(self, key: Tuple[int, int], cart: CartSnapshot, stamp: int):
+        """
+        Nunca substitui um snapshot por outro mais antigo (carrinho ou versão
+        anteriores), nem grava algo lido antes de uma invalidação.
+        """
+        if not self.enabled or not self.revocations.is_current(key, stamp):
+            return
+        current = self.get(key)
+        if current is not None and (current.cart_id, current.version) > (cart.cart_id, cart.version):
+            return
+        self.cache.set(key, (cart, stamp))
+
+    def _on_invalidation(self, key: str):
+        store_id, customer_id = (int(part) for part in key.split(':'))
+        self.revocations.revoke((store_id, customer_id))
+        self.cache.delete((store_id, customer_id))
+
+    async def publish(self, key: Tuple[int, int], cart: Optional[CartSnapshot]):
+        """
+        Descarta o snapshot nos demais workers e grava o novo neste (None
+        apenas descarta).
+        """
+        await self.bus.publish(INVALIDATION_TOPIC, f"{key[0]}:{key[1]}")
+        if cart is not None:
+            self.put(key, cart, self.snapshot())
+
+    def stats(self) -> dict:
+        return {**self.cache.stats(), 'enabled': self.enabled}
+
+
+cart_cache = CartCache()
@@ -0,0 +1,88 @@
+"""
+Limpeza dos carrinhos abandonados.
+
+Carrinhos ativos sem alteração há mais de CART_ABANDON_AFTER segundos
+(Cart.updated_at) são marcados como 'abandoned' e seus itens removidos, em
+lotes de CART_SWEEP_BATCH_SIZE com uma pausa entre os lotes, para não segurar
+locks nem disputar o banco com as requisições. O registro do carrinho é
+mantido (histórico); só os itens são apagados.
+"""
+import asyncio
+import datetime
+import logging
+import os
+from typing import Dict
+from tortoise import timezone
+from src.models import Cart, CartItem
+from src.cart_cache import cart_cache
+
+logger = logging.getLogger(__name__)
+
+CART_ABANDON_AFTER = float(os.getenv('CART_ABANDON_AFTER', str(7 * 24 * 60 * 60)))
+# 0 desativa o job em background
+CART_SWEEP_INTERVAL = float(os.getenv('CART_SWEEP_INTERVAL', '3600'))
+CART_SWEEP_BATCH_SIZE = int(os.getenv('CART_SWEEP_BATCH_SIZE', '500'))
+CART_SWEEP_BATCH_PAUSE = float(os.getenv('CART_SWEEP_BATCH_PAUSE', '0.05'))
+
+
+def abandon_cutoff(now: datetime.datetime = None) -> datetime.datetime:
+    """
+    Carrinhos ativos alterados pela última vez antes deste instante estão
+    abandonados.
+    """
+    return (now or timezone.now()) - datetime.timedelta(seconds=CART_ABANDON_AFTER)
+
+
+async def abandon_idle_carts(cutoff: datetime.datetime, batch_size: int = CART_SWEEP_BATCH_SIZE,
+                pause: float = CART_SWEEP_BATCH_PAUSE) -> int:
+    abandoned = 0
+    while True:
+        rows = await Cart.filter(status='active', updated_at__lt=cutoff) \
+            .limit(batch_size).values_list('id', 'store_id', 'customer_id')
+        if not rows:
+            return abandoned
+        # Repete o filtro: um carrinho alterado no meio tempo continua ativo
+        abandoned += await Cart.filter(
+            id__in=[row[0] for row in rows], status='active', updated_at__lt=cutoff,
+        ).update(status='abandoned')
+        for _, store_id, customer_id in rows:
+            await cart_cache.publish((store_id, customer_id), None)
+        if len(rows) < batch_size:
+            return abandoned
+        await asyncio.sleep(pause)
+
+
+async def purge_abandoned_items(batch_size: int = CART_SWEEP_BATCH_SIZE,
+                pause: float = CART_SWEEP_BATCH_PAUSE) -> int:
+    deleted = 0
+    while True:
+        ids = await CartItem.filter(cart__status='abandoned').limit(batch_size).values_list('id', flat=True)
+        if not ids:
+            return deleted
+        deleted += await CartItem.filter(id__in=ids).delete()
+        if len(ids) < batch_size:
+            return deleted
+        await asyncio.sleep(pause)
+
+
+async def sweep_abandoned_carts(batch_size: int = CART_SWEEP_BATCH_SIZE,
+                pause: float = CART_SWEEP_BATCH_PAUSE) -> Dict[str, int]:
+    return {
+        'abandoned_carts': await abandon_idle_carts(abandon_cutoff(), batch_size, pause),
+        'deleted_items': await purge_abandoned_items(batch_size, pause),
+    }
+
+
+async def run_periodic_sweep(interval: float = CART_SWEEP_INTERVAL):
+    """
+    Loop de limpeza em background (iniciado no lifespan).
+    """
+    while True:
+        try:
+            summary = await sweep_abandoned_carts()
+            logger.info("Cart sweep finished: %s", summary)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Cart sweep failed: %s", e)
+        await asyncio.sleep(interval)
@@ -1,7 +1,16 @@
 import os
-from fastapi import FastAPI
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from tortoise.contrib.fastapi import register_tortoise
 from src.routes import seller, customer, store, cart, order, maria, pages, product, admin_seller
+from src.integrations.maria_api.resilience import (
+    REQUEST_BUDGET,
+    CircuitOpenError,
+    MariaUnavailableError,
+    deadline,
+    maria_error_status,
+)
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -41,4 +50,25 @@ def configure_routes(application: FastAPI):
     application.include_router(order.router)
     application.include_router(maria.router)
     application.include_router(admin_seller.router)
-    application.include_router(pages.router)
\ No newline at end of file
+    application.include_router(pages.router)
+
+def configure_maria_resilience(application: FastAPI):
+    """
+    Prazo total para chamadas à Maria API em cada requisição e conversão das
+    falhas do upstream em respostas HTTP (404, 503 ou 504 em vez de 500).
+    """
+    @application.middleware("http")
+    async def maria_request_budget(request: Request, call_next):
+        with deadline(REQUEST_BUDGET):
+            return await call_next(request)
+
+    async def maria_error_handler(request: Request, exc: Exception):
+        status_code = maria_error_status(exc)
+        headers = None
+        if isinstance(exc, CircuitOpenError):
+            headers = {"Retry-After": str(max(1, round(exc.retry_after)))}
+        detail = "Not found in Maria API" if status_code == 404 else "Maria API unavailable"
+        return JSONResponse(status_code=status_code, content={"detail": detail}, headers=headers)
+
+    application.add_exception_handler(MariaUnavailableError, maria_error_handler)
+    application.add_exception_handler(httpx.HTTPError, maria_error_handler)
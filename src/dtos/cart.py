@@ -1,4 +1,6 @@
+from typing import List, Literal, Union
 from pydantic import BaseModel, Field
+from typing_extensions import Annotated
 
 class CartItemSchema(BaseModel):
     product_id: int = Field()
@@ -9,3 +11,21 @@ class CartItemSchema(BaseModel):
 class CartItemUpdateSchema(BaseModel):
     product_id: int = Field()
     amount: int = Field()
+
+class CartAddOperation(CartItemSchema):
+    op: Literal['add']
+
+class CartUpdateOperation(CartItemUpdateSchema):
+    op: Literal['update']
+
+class CartRemoveOperation(BaseModel):
+    op: Literal['remove']
+    product_id: int = Field()
+
+CartOperation = Annotated[
+    Union[CartAddOperation, CartUpdateOperation, CartRemoveOperation],
+    Field(discriminator='op'),
+]
+
+class CartBatchSchema(BaseModel):
+    operations: List[CartOperation] = Field(min_length=1, max_length=50)
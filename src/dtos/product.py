@@ -1,3 +1,4 @@
+from typing import List
 from pydantic import BaseModel, Field
 
 class ProductSchema(BaseModel):
@@ -5,3 +6,10 @@ class ProductSchema(BaseModel):
     description: str = Field()
     price: int = Field()
     external_id: str = Field()
+
+class ExternalProductRef(BaseModel):
+    park_code: str = Field(min_length=1, max_length=50)
+    product_code: str = Field(min_length=1, max_length=100)
+
+class ExternalProductBatchSchema(BaseModel):
+    products: List[ExternalProductRef] = Field(min_length=1, max_length=50)
@@ -0,0 +1,245 @@
+"""
+Idempotency-Key para endpoints que não podem ser repetidos (criar pedido,
+pagar).
+
+A primeira requisição com uma chave grava uma linha "em andamento" em
+IdempotencyKey (única por endpoint + quem chamou + chave) antes de executar e,
+ao terminar, guarda a resposta nela. Repetições com a mesma chave recebem a
+resposta guardada (header Idempotent-Replayed: true). Uma repetição que chega
+enquanto a primeira ainda executa espera por ela (evento no mesmo processo,
+consulta periódica ao banco entre workers) até IDEMPOTENCY_WAIT_TIMEOUT.
+
+A linha em andamento tem um lease (locked_until), renovado enquanto a
+execução roda. Se o worker morrer no meio, o lease vence e a próxima
+repetição assume a execução em vez de esperar até a chave expirar.
+
+Só respostas de sucesso são guardadas: se a execução falhar (HTTPException ou
+erro), a linha é removida e a mesma chave pode ser usada de novo. As chaves
+expiram em IDEMPOTENCY_TTL segundos e são removidas em lotes por um job em
+background.
+"""
+import asyncio
+import datetime
+import hashlib
+import json
+import logging
+import os
+import uuid
+from functools import wraps
+from typing import Any, Dict, Tuple
+from fastapi import HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from tortoise import timezone
+from tortoise.exceptions import IntegrityError
+from src.authentication import get_request
+from src.models import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+IDEMPOTENCY_TTL = float(os.getenv('IDEMPOTENCY_TTL', str(24 * 60 * 60)))
+IDEMPOTENCY_WAIT_TIMEOUT = float(os.getenv('IDEMPOTENCY_WAIT_TIMEOUT', '10'))
+IDEMPOTENCY_POLL_INTERVAL = float(os.getenv('IDEMPOTENCY_POLL_INTERVAL', '0.05'))
+# Validade da reserva de uma execução em andamento, renovada enquanto ela roda
+IDEMPOTENCY_LEASE = float(os.getenv('IDEMPOTENCY_LEASE', '15'))
+# 0 desativa o job em background
+IDEMPOTENCY_PURGE_INTERVAL = float(os.getenv('IDEMPOTENCY_PURGE_INTERVAL', '3600'))
+IDEMPOTENCY_PURGE_BATCH_SIZE = int(os.getenv('IDEMPOTENCY_PURGE_BATCH_SIZE', '1000'))
+IDEMPOTENCY_PURGE_BATCH_PAUSE = float(os.getenv('IDEMPOTENCY_PURGE_BATCH_PAUSE', '0.05'))
+
+MAX_KEY_LENGTH = 255
+
+# Execuções em andamento neste processo: as repetições esperam pelo evento
+_inflight: Dict[Tuple[str, str], asyncio.Event] = {}
+
+
+def request_scope(name: str, request: Request) -> str:
+    """
+    A mesma chave só colide no mesmo endpoint e para o mesmo cliente/loja.
+    """
+    scope = f"{name}:{request.url.path}"
+    user = getattr(request, 'current_user', None)
+    store = getattr(request, 'current_store', None)
+    if user is not None:
+        scope += f":{type(user).__name__.lower()}={user.id}"
+    if store is not None:
+        scope += f":store={store.id}"
+    return scope
+
+
+async def request_fingerprint(request: Request) -> str:
+    digest = hashlib.sha256(f"{request.method} {request.url.path}\n".encode())
+    digest.update(await request.body())
+    return digest.hexdigest()
+
+
+def replay(entry: IdempotencyKey) -> JSONResponse:
+    return JSONResponse(
+        content=entry.response,
+        status_code=entry.status_code,
+        headers={'Idempotent-Replayed': 'true'},
+    )
+
+
+def stored_response(request: Request, result) -> Tuple[int, Any]:
+    """
+    Status e corpo que a rota de fato respondeu: o de um Response devolvido
+    pela rota ou o status_code declarado na rota (200 por padrão).
+    """
+    if isinstance(result, Response):
+        return result.status_code, json.loads(result.body) if result.body else None
+    route = request.scope.get('route')
+    return getattr(route, 'status_code', None) or 200, jsonable_encoder(result)
+
+
+def lease_expiry(now: datetime.datetime = None) -> datetime.datetime:
+    return (now or timezone.now()) + datetime.timedelta(seconds=IDEMPOTENCY_LEASE)
+
+
+async def claim(scope: str, key: str, fingerprint: str) -> Tuple[str | None, IdempotencyKey | None]:
+    """
+    Tenta registrar a execução. Retorna (owner, None) se conseguiu; senão,
+    (None, linha existente em andamento ou concluída).
+
+    Uma execução em andamento cujo lease venceu (o worker morreu antes de
+    terminar) é assumida por quem chegar, desde que seja a mesma requisição.
+    """
+    owner = uuid.uuid4().hex
+    while True:
+        now = timezone.now()
+        # Consulta antes de inserir: quem espera uma execução em andamento só
+        # faz SELECTs, sem uma enxurrada de INSERTs com violação de unicidade
+        entry = await IdempotencyKey.filter(scope=scope, key=key).first()
+        if entry is None:
+            try:
+                await IdempotencyKey.create(
+                    scope=scope, key=key, fingerprint=fingerprint, owner=owner,
+                    locked_until=lease_expiry(now),
+                    expires_at=now + datetime.timedelta(seconds=IDEMPOTENCY_TTL),
+                )
+                return owner, None
+            except IntegrityError:
+                # Outra requisição registrou a chave no meio tempo
+                continue
+        if entry.expires_at <= now:
+            await IdempotencyKey.filter(id=entry.id, expires_at__lte=now).delete()
+            continue
+        lease_expired = entry.locked_until is None or entry.locked_until <= now
+        if entry.status_code is None and lease_expired and entry.fingerprint == fingerprint:
+            taken = await IdempotencyKey.filter(
+                id=entry.id, status_code=None, owner=entry.owner,
+            ).update(owner=owner, locked_until=lease_expiry(now))
+            if taken:
+                logger.warning("Idempotency key %s (%s) taken over after its lease expired", key, scope)
+                return owner, None
+            continue
+        return None, entry
+
+
+async def heartbeat(entry_filter: dict):
+    """
+    Renova o lease enquanto a execução está em andamento.
+    """
+    while True:
+        await asyncio.sleep(IDEMPOTENCY_LEASE / 3)
+        await IdempotencyKey.filter(**entry_filter).update(locked_until=lease_expiry())
+
+
+async def wait_for(scope: str, key: str, fingerprint: str) -> Tuple[str | None, IdempotencyKey | None]:
+    """
+    Espera a execução em andamento terminar (ou o lease dela vencer). Retorna
+    como claim(): o owner se a execução ficou com esta requisição, ou a linha
+    concluída.
+    """
+    deadline = asyncio.get_running_loop().time() + IDEMPOTENCY_WAIT_TIMEOUT
+    while True:
+        owner, entry = await claim(scope, key, fingerprint)
+        if owner is not None or entry.status_code is not None or entry.fingerprint != fingerprint:
+            return owner, entry
+        remaining = deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            raise HTTPException(status_code=409, detail="A request with this Idempotency-Key is still in progress")
+        event = _inflight.get((scope, key))
+        try:
+            if event is not None:
+                await asyncio.wait_for(event.wait(), remaining)
+            else:
+                await asyncio.sleep(min(IDEMPOTENCY_POLL_INTERVAL, remaining))
+        except asyncio.TimeoutError:
+            pass
+
+
+def idempotent(name: str):
+    """
+    Decorator de rota (depois de customer_required/store_required, se houver).
+    Sem o header Idempotency-Key a rota executa normalmente.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            request = get_request(kwargs)
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if not key:
+                return await func(*args, **kwargs)
+            if len(key) > MAX_KEY_LENGTH:
+                raise HTTPException(status_code=400, detail="Idempotency-Key too long")
+
+            scope = request_scope(name, request)
+            fingerprint = await request_fingerprint(request)
+            owner, entry = await wait_for(scope, key, fingerprint)
+            if entry is not None:
+                if entry.fingerprint != fingerprint:
+                    raise HTTPException(status_code=422, detail="Idempotency-Key already used with a different request")
+                return replay(entry)
+
+            # Só quem detém o lease grava o resultado ou libera a chave
+            mine = {'scope': scope, 'key': key, 'owner': owner, 'status_code': None}
+            event = _inflight[(scope, key)] = asyncio.Event()
+            renew = asyncio.create_task(heartbeat(mine))
+            try:
+                result = await func(*args, **kwargs)
+            except BaseException:
+                await IdempotencyKey.filter(**mine).delete()
+                raise
+            else:
+                status_code, response = stored_response(request, result)
+                await IdempotencyKey.filter(**mine).update(status_code=status_code, response=response)
+                return result
+            finally:
+                renew.cancel()
+                _inflight.pop((scope, key), None)
+                event.set()
+
+        return wrapper
+
+    return decorator
+
+
+async def purge_expired_keys(batch_size: int = IDEMPOTENCY_PURGE_BATCH_SIZE,
+                pause: float = IDEMPOTENCY_PURGE_BATCH_PAUSE) -> int:
+    deleted = 0
+    now = timezone.now()
+    while True:
+        ids = await IdempotencyKey.filter(expires_at__lte=now).limit(batch_size).values_list('id', flat=True)
+        if not ids:
+            return deleted
+        deleted += await IdempotencyKey.filter(id__in=ids).delete()
+        if len(ids) < batch_size:
+            return deleted
+        await asyncio.sleep(pause)
+
+
+async def run_periodic_purge(interval: float = IDEMPOTENCY_PURGE_INTERVAL):
+    """
+    Loop de limpeza em background (iniciado no lifespan).
+    """
+    while True:
+        try:
+            deleted = await purge_expired_keys()
+            logger.info("Idempotency key purge finished: %s", deleted)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Idempotency key purge failed: %s", e)
+        await asyncio.sleep(interval)
@@ -0,0 +1,146 @@
+"""
+Cache das respostas da Maria API (stale-while-revalidate).
+
+Cada família de endpoint (parks, park, products, product_detail) tem seu próprio
+TTL, janela stale e limite de memória. Entradas expiradas continuam sendo
+servidas enquanto um refresh roda em background.
+
+Se a Maria API estiver indisponível (circuito aberto, prazo esgotado, 5xx), o
+último valor bom conhecido é servido mesmo fora da janela stale.
+"""
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Hashable, Tuple
+
+from src.cache import TTLCache
+from .resilience import CircuitOpenError, clear_deadline, is_upstream_failure
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachePolicy:
+    ttl: float
+    stale_ttl: float
+    max_entries: int
+    max_size: int  # bytes (tamanho aproximado do payload da Maria API)
+
+
+def _policy(family: str, ttl: float, stale_ttl: float, max_entries: int, max_size_mb: float) -> CachePolicy:
+    prefix = f"MARIA_CACHE_{family.upper()}"
+    return CachePolicy(
+        ttl=float(os.getenv(f"{prefix}_TTL", ttl)),
+        stale_ttl=float(os.getenv(f"{prefix}_STALE_TTL", stale_ttl)),
+        max_entries=int(os.getenv(f"{prefix}_MAX_ENTRIES", max_entries)),
+        max_size=int(float(os.getenv(f"{prefix}_MAX_SIZE_MB", max_size_mb)) * 1024 * 1024),
+    )
+
+
+DEFAULT_POLICIES = {
+    'parks': _policy('parks', ttl=600, stale_ttl=3600, max_entries=16, max_size_mb=4),
+    'park': _policy('park', ttl=600, stale_ttl=3600, max_entries=512, max_size_mb=8),
+    'products': _policy('products', ttl=120, stale_ttl=600, max_entries=2048, max_size_mb=64),
+    'product_detail': _policy('product_detail', ttl=300, stale_ttl=1800, max_entries=4096, max_size_mb=32),
+}
+
+
+def make_cache_key(path: str, params: dict = None) -> Tuple:
+    """
+    Chave = endpoint + query params (forDate, numberDays, numAdults, ...), ordenados.
+    """
+    return (path, tuple(sorted((params or {}).items())))
+
+
+class MariaResponseCache:
+    def __init__(self, policies: Dict[str, CachePolicy] = None):
+        self.policies = policies or DEFAULT_POLICIES
+        self.caches = {
+            family: TTLCache(
+                ttl=policy.ttl,
+                stale_ttl=policy.stale_ttl,
+                max_entries=policy.max_entries,
+                max_size=policy.max_size,
+            )
+            for family, policy in self.policies.items()
+        }
+        self.stale_hits = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.fallback_hits = 0
+        self._refreshing: Dict[Tuple[str, Hashable], asyncio.Task] = {}
+
+    async def get_or_load(self, family: str, key: Hashable,
+                loader: Callable[[], Awaitable[Tuple[object, int]]]):
+        """
+        `loader` retorna (valor, tamanho_em_bytes).
+        """
+        cache = self.caches[family]
+        # Entradas fora da janela stale ficam guardadas (até o LRU despejá-las)
+        # como último valor bom conhecido
+        last_good = cache.peek(key)
+        if last_good is not None and last_good.is_usable():
+            entry = cache.get_entry(key)
+            cache.hits += 1
+            if not entry.is_fresh():
+                self.stale_hits += 1
+                self._schedule_refresh(family, key, loader)
+            return entry.value
+
+        cache.misses += 1
+        try:
+            value, size = await loader()
+        except Exception as e:
+            if last_good is None or not is_upstream_failure(e):
+                raise
+            # Upstream fora: volta a servir o último valor bom como stale; os
+            # próximos acessos disparam refreshes que fecham o circuito
+            self.fallback_hits += 1
+            logger.warning("Maria API unavailable, serving last known good %s %s: %s", family, key, e)
+            cache.set(key, last_good.value, ttl=0, size=last_good.size)
+            return last_good.value
+        cache.set(key, value, size=size)
+        return value
+
+    def _schedule_refresh(self, family: str, key: Hashable, loader):
+        refresh_key = (family, key)
+        if refresh_key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(family, key, loader))
+        self._refreshing[refresh_key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(refresh_key, None))
+
+    async def _refresh(self, family: str, key: Hashable, loader):
+        # O refresh não herda o prazo da requisição que o disparou
+        clear_deadline()
+        try:
+            value, size = await loader()
+        except Exception as e:
+            # Mantém a entrada stale; novo refresh será tentado no próximo acesso
+            self.refresh_errors += 1
+            log = logger.debug if isinstance(e, CircuitOpenError) else logger.warning
+            log("Maria cache refresh failed for %s %s: %s", family, key, e)
+            return
+        self.refreshes += 1
+        self.caches[family].set(key, value, size=size)
+
+    def invalidate(self, family: str = None):
+        for name, cache in self.caches.items():
+            if family is None or family == name:
+                cache.clear()
+
+    async def aclose(self):
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        self._refreshing.clear()
+
+    def stats(self) -> dict:
+        return {
+            'families': {family: cache.stats() for family, cache in self.caches.items()},
+            'stale_hits': self.stale_hits,
+            'refreshes': self.refreshes,
+            'refresh_errors': self.refresh_errors,
+            'fallback_hits': self.fallback_hits,
+            'refreshing': len(self._refreshing),
+        }
@@ -1,6 +1,28 @@
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Union, Optional, Any
 
+
+def select_language(value: Any, language: str = None) -> Any:
+    """
+    Cópia de um valor já validado (modelo, dict do payload ou lista deles)
+    só com as traduções do idioma. Não altera o valor original, que pode estar
+    no cache compartilhado.
+    """
+    if not language:
+        return value
+    if isinstance(value, list):
+        return [select_language(item, language) for item in value]
+    if isinstance(value, BaseModel) and hasattr(value, 'translations'):
+        return value.model_copy(update={
+            'translations': [t for t in value.translations if t.language_code == language],
+        })
+    if isinstance(value, dict) and 'translations' in value:
+        return {
+            **value,
+            'translations': [t for t in value['translations'] if t.get('language_code') == language],
+        }
+    return value
+
 class ParkLocation(BaseModel):
     city: str
     state: str
@@ -28,6 +50,7 @@ class Park(BaseModel):
     status: Union[bool, str]
     translations: List[Translation] = []
 
+
 class ParkProductExtension(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
     
@@ -73,6 +96,7 @@ class ParkProduct(BaseModel):
     translations: List[Translation] = []
     has_active_promo: bool = Field(..., alias="hasActivePromo")
 
+
 class ParkProductDetailExtension(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
     
@@ -101,4 +125,5 @@ class ParkProductDetail(BaseModel):
     starting_price: PricePair = Field(..., alias="startingPrice")
     is_special: bool = Field(..., alias="isSpecial")
     status: Union[bool, str]
-    translations: List[Translation] = []
\ No newline at end of file
+    translations: List[Translation] = []
+
@@ -1,42 +1,373 @@
+import asyncio
 import os
+import time
 import httpx
-from typing import List
-from .dto import Park, ParkProduct, ParkProductDetail
+from typing import Dict, List, Optional
+from pydantic import TypeAdapter
+from .dto import Park, ParkProduct, ParkProductDetail, select_language
+from .cache import MariaResponseCache, make_cache_key
+from .mirror import CatalogMirror
+from .resilience import (
+    CIRCUIT_TIMEOUT_FLOOR,
+    HEDGE_MIN_DELAY,
+    HEDGING_ENABLED,
+    CircuitBreaker,
+    DeadlineExceededError,
+    LatencyTracker,
+    hedged,
+    is_upstream_failure,
+    remaining_budget,
+)
+from src.singleflight import SingleFlight
+
+
+# Timeouts (segundos) e limites do pool de conexões, configuráveis via ambiente
+DEFAULT_TIMEOUT = float(os.getenv('MARIA_API_TIMEOUT', '10'))
+DEFAULT_CONNECT_TIMEOUT = float(os.getenv('MARIA_API_CONNECT_TIMEOUT', '3'))
+DEFAULT_MAX_CONNECTIONS = int(os.getenv('MARIA_API_MAX_CONNECTIONS', '100'))
+DEFAULT_MAX_KEEPALIVE = int(os.getenv('MARIA_API_MAX_KEEPALIVE', '20'))
+DEFAULT_KEEPALIVE_EXPIRY = float(os.getenv('MARIA_API_KEEPALIVE_EXPIRY', '30'))
+DEFAULT_HTTP2 = os.getenv('MARIA_API_HTTP2', 'true').lower() in ('1', 'true', 'yes')
+# Datas buscadas em paralelo por calendário de preços
+CALENDAR_CONCURRENCY = int(os.getenv('MARIA_CALENDAR_CONCURRENCY', '8'))
+
+PARKS_ADAPTER = TypeAdapter(List[Park])
+PRODUCTS_ADAPTER = TypeAdapter(List[ParkProduct])
+
+
+async def _dump_mirrored(lookup, adapter: TypeAdapter):
+    mirrored = await lookup
+    if mirrored is None:
+        return None
+    value, size = mirrored
+    return adapter.dump_python(value), size
+
+
+def build_products_params(for_date: str = None, number_days: int = None, num_adults: int = None,
+                num_children: int = None, is_special: bool = None) -> dict:
+    params = {}
+    if for_date:
+        params["forDate"] = for_date
+    if number_days:
+        params["numberDays"] = number_days
+    if num_adults:
+        params["numAdults"] = num_adults
+    if num_children:
+        params["numChildren"] = num_children
+    if is_special:
+        params["isSpecial"] = is_special
+    return params
 
 
 class MariaApi:
-    def __init__(self):
-        self.base_endpoint = os.getenv('MARIA_API_ENDPOINT')
-
-    def get_parks(self, location: str = "FL") -> List[Park]:
-        r = httpx.get(f"{self.base_endpoint}/parks/")
-        response = r.json()
-        return [Park(**item) for item in response]
-
-    def get_park(self, park_code: str) -> Park:
-        r = httpx.get(f"{self.base_endpoint}/parks/{park_code}")
-        response = r.json()
-        return Park(**response)
-
-    def get_park_products(self, park_code: str, for_date: str = None, 
-                number_days: int = None, num_adults: int = None, 
-                num_children: int = None, is_special: bool = None) -> List[ParkProduct]:
-        params = {}
-        if for_date:
-            params["forDate"] = for_date
-        if number_days:
-            params["numberDays"] = number_days
-        if num_adults:
-            params["numAdults"] = num_adults
-        if num_children:
-            params["numChildren"] = num_children
-        if is_special:
-            params["isSpecial"] = is_special
-        r = httpx.get(f"{self.base_endpoint}/parks/{park_code}/products", params=params)
-        response = r.json()
-        return [ParkProduct(**item) for item in response]
-
-    def get_park_product_detail(self, park_code: str, product_code: str) -> ParkProductDetail:
-        r = httpx.get(f"{self.base_endpoint}/parks/{park_code}/products/{product_code}")
-        response = r.json()
-        return ParkProductDetail(**response)
\ No newline at end of file
+    """
+    Cliente assíncrono da Maria API.
+
+    Mantém um único httpx.AsyncClient (keep-alive + HTTP/2) durante toda a vida
+    da aplicação. Deve ser criado no startup (create_lifespan) e fechado no
+    shutdown com `aclose()`.
+
+    Se `cache` for informado, as leituras do catálogo passam pelo
+    MariaResponseCache (TTL + LRU + stale-while-revalidate).
+
+    Chamadas idênticas simultâneas (mesmo endpoint e params) compartilham uma
+    única requisição à Maria API (single-flight).
+
+    Se `mirror` for informado, as leituras sem parâmetros de data/pessoas são
+    servidas do espelho local do catálogo, com fallback para a Maria API.
+
+    Cada família de endpoint tem seu circuit breaker, e as chamadas respeitam o
+    prazo da requisição atual (resilience.deadline). Com `hedging`, leituras
+    lentas (acima do p95 recente) disparam uma segunda tentativa em paralelo.
+    """
+
+    def __init__(self, base_endpoint: str = None, timeout: float = None,
+                max_connections: int = None, max_keepalive_connections: int = None,
+                http2: bool = None, cache: MariaResponseCache = None,
+                transport: httpx.AsyncBaseTransport = None, mirror: CatalogMirror = None,
+                hedging: bool = None, timeout_floor: float = None):
+        self.cache = cache
+        self.mirror = mirror
+        self.inflight = SingleFlight()
+        self.hedging = HEDGING_ENABLED if hedging is None else hedging
+        self.timeout_floor = CIRCUIT_TIMEOUT_FLOOR if timeout_floor is None else timeout_floor
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.latencies: Dict[str, LatencyTracker] = {}
+        self.hedges = 0
+        self.deadline_exceeded = 0
+        self.base_endpoint = base_endpoint or os.getenv('MARIA_API_ENDPOINT')
+        self.request_timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
+        self.timeout = httpx.Timeout(
+            self.request_timeout,
+            connect=DEFAULT_CONNECT_TIMEOUT,
+        )
+        self.limits = httpx.Limits(
+            max_connections=DEFAULT_MAX_CONNECTIONS if max_connections is None else max_connections,
+            max_keepalive_connections=(
+                DEFAULT_MAX_KEEPALIVE if max_keepalive_connections is None else max_keepalive_connections
+            ),
+            keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+        )
+        self.client = httpx.AsyncClient(
+            base_url=self.base_endpoint or '',
+            timeout=self.timeout,
+            limits=self.limits,
+            http2=DEFAULT_HTTP2 if http2 is None else http2,
+            transport=transport,
+        )
+
+    async def aclose(self):
+        if self.cache is not None:
+            await self.cache.aclose()
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _get(self, path: str, params: dict = None, timeout: float = None) -> httpx.Response:
+        r = await self.client.get(
+            path,
+            params=params,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+        r.raise_for_status()
+        return r
+
+    def breaker(self, family: str) -> CircuitBreaker:
+        breaker = self.breakers.get(family)
+        if breaker is None:
+            breaker = self.breakers[family] = CircuitBreaker(family)
+        return breaker
+
+    def _hedge_delay(self, family: str, limit: float) -> Optional[float]:
+        if not self.hedging:
+            return None
+        p95 = self.latencies[family].percentile(0.95)
+        if p95 is None:
+            return None
+        delay = max(p95, HEDGE_MIN_DELAY)
+        # Sem tempo para uma segunda tentativa útil
+        return delay if delay < limit else None
+
+    def _on_hedge(self):
+        self.hedges += 1
+
+    async def _request(self, family: str, path: str, params: dict = None,
+                timeout: float = None) -> httpx.Response:
+        """
+        GET protegido pelo circuit breaker da família e limitado pelo prazo
+        restante da requisição atual.
+        """
+        limit = self.request_timeout if timeout is None else timeout
+        remaining = remaining_budget()
+        clipped = remaining is not None and remaining < limit
+        if clipped:
+            if remaining <= 0:
+                self.deadline_exceeded += 1
+                raise DeadlineExceededError(f"Maria API budget exhausted before {path}")
+            limit = remaining
+        # Sem prazo nem timeout explícito mantém o httpx.Timeout padrão (connect separado)
+        request_timeout = limit if (clipped or timeout is not None) else None
+
+        breaker = self.breaker(family)
+        breaker.acquire()
+        tracker = self.latencies.setdefault(family, LatencyTracker())
+        started = time.perf_counter()
+        try:
+            delay = self._hedge_delay(family, limit)
+            if delay is None:
+                call = self._get(path, params=params, timeout=request_timeout)
+            else:
+                call = hedged(
+                    lambda: self._get(path, params=params, timeout=request_timeout),
+                    delay, on_hedge=self._on_hedge,
+                )
+            # Os timeouts do httpx são por operação (connect, cada leitura);
+            # o limite da chamada inteira é garantido aqui
+            r = await (call if request_timeout is None else asyncio.wait_for(call, request_timeout))
+        except (httpx.TimeoutException, asyncio.TimeoutError) as e:
+            if not clipped:
+                breaker.record_failure()
+                raise
+            if limit >= self.timeout_floor:
+                # O upstream teve tempo razoável para responder e não respondeu
+                breaker.record_failure()
+            else:
+                # Sobrou pouco do nosso prazo: não é evidência contra o upstream
+                breaker.release()
+            self.deadline_exceeded += 1
+            raise DeadlineExceededError(f"Maria API budget exhausted on {path}") from e
+        except Exception as e:
+            if is_upstream_failure(e):
+                breaker.record_failure()
+            else:
+                # 4xx: o upstream respondeu normalmente
+                breaker.record_success()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_success()
+        tracker.observe(time.perf_counter() - started)
+        return r
+
+    async def _fetch(self, family: str, path: str, parse, params: dict = None,
+                timeout: float = None, mirror_lookup=None, variant: str = 'model',
+                language: str = None):
+        """
+        `parse(content)` valida os bytes da resposta em um único passo (sem
+        r.json() intermediário). O cache e o single-flight guardam a resposta
+        completa, uma por requisição ao upstream; `language` só filtra as
+        traduções da cópia devolvida.
+        """
+        key = make_cache_key(path, params) + (variant,)
+
+        async def request():
+            if mirror_lookup is not None and self.mirror is not None:
+                mirrored = await mirror_lookup(self.mirror)
+                if mirrored is not None:
+                    return mirrored
+            r = await self._request(family, path, params=params, timeout=timeout)
+            return parse(r.content), len(r.content)
+
+        async def load():
+            remaining = remaining_budget()
+            if remaining is None:
+                return await self.inflight.do(key, request)
+            # Quem aguarda uma chamada compartilhada também respeita o próprio prazo
+            if remaining <= 0:
+                self.deadline_exceeded += 1
+                raise DeadlineExceededError(f"Maria API budget exhausted before {path}")
+            try:
+                return await asyncio.wait_for(self.inflight.do(key, request), remaining)
+            except asyncio.TimeoutError:
+                self.deadline_exceeded += 1
+                raise DeadlineExceededError(f"Maria API budget exhausted waiting for {path}")
+
+        if self.cache is None:
+            value, _ = await load()
+        else:
+            value = await self.cache.get_or_load(family, key, load)
+        return select_language(value, language)
+
+    async def get_parks(self, location: str = "FL", timeout: float = None,
+                language: str = None) -> List[Park]:
+        return await self._fetch(
+            'parks', "/parks/",
+            PARKS_ADAPTER.validate_json,
+            timeout=timeout,
+            mirror_lookup=lambda mirror: mirror.get_parks(),
+            language=language,
+        )
+
+    async def get_park(self, park_code: str, timeout: float = None, language: str = None) -> Park:
+        return await self._fetch(
+            'park', f"/parks/{park_code}",
+            Park.model_validate_json,
+            timeout=timeout,
+            mirror_lookup=lambda mirror: mirror.get_park(park_code),
+            language=language,
+        )
+
+    async def get_park_products(self, park_code: str, for_date: str = None,
+                number_days: int = None, num_adults: int = None,
+                num_children: int = None, is_special: bool = None,
+                timeout: float = None, language: str = None) -> List[ParkProduct]:
+        params = build_products_params(for_date, number_days, num_adults, num_children, is_special)
+        return await self._fetch(
+            'products', f"/parks/{park_code}/products",
+            PRODUCTS_ADAPTER.validate_json,
+            params=params,
+            timeout=timeout,
+            # O espelho guarda a listagem sem filtros; com params vai direto à Maria API
+            mirror_lookup=None if params else lambda mirror: mirror.get_park_products(park_code),
+            language=language,
+        )
+
+    async def get_park_product_detail(self, park_code: str, product_code: str,
+                timeout: float = None, language: str = None) -> ParkProductDetail:
+        return await self._fetch(
+            'product_detail', f"/parks/{park_code}/products/{product_code}",
+            ParkProductDetail.model_validate_json,
+            timeout=timeout,
+            mirror_lookup=lambda mirror: mirror.get_park_product_detail(park_code, product_code),
+            language=language,
+        )
+
+    # Variantes "payload": validadas uma vez e guardadas no cache já como dicts
+    # (snake_case, mesmo formato de model_dump(by_alias=False)), prontos para
+    # serem serializados direto em bytes pelas rotas.
+
+    async def get_parks_payload(self, timeout: float = None, language: str = None) -> List[dict]:
+        return await self._fetch(
+            'parks', "/parks/",
+            lambda content: PARKS_ADAPTER.dump_python(PARKS_ADAPTER.validate_json(content)),
+            timeout=timeout,
+            mirror_lookup=lambda mirror: _dump_mirrored(mirror.get_parks(), PARKS_ADAPTER),
+            variant='payload',
+            language=language,
+        )
+
+    async def get_park_products_payload(self, park_code: str, for_date: str = None,
+                number_days: int = None, num_adults: int = None,
+                num_children: int = None, is_special: bool = None,
+                timeout: float = None, language: str = None) -> List[dict]:
+        params = build_products_params(for_date, number_days, num_adults, num_children, is_special)
+        return await self._fetch(
+            'products', f"/parks/{park_code}/products",
+            lambda content: PRODUCTS_ADAPTER.dump_python(PRODUCTS_ADAPTER.validate_json(content)),
+            params=params,
+            timeout=timeout,
+            mirror_lookup=None if params else lambda mirror: _dump_mirrored(mirror.get_park_products(park_code), PRODUCTS_ADAPTER),
+            variant='payload',
+            language=language,
+        )
+
+    async def get_park_products_calendar(self, park_code: str, dates: List[str],
+                number_days: int = None, num_adults: int = None,
+                num_children: int = None, timeout: float = None,
+                language: str = None, concurrency: int = None) -> Dict[str, object]:
+        """
+        Listagem de produtos (payload) para cada data, buscando as datas em
+        paralelo com no máximo `concurrency` chamadas simultâneas. Cada data é
+        cacheada separadamente, então calendários sobrepostos reaproveitam as
+        datas já buscadas.
+
+        Retorna {data: lista de produtos ou a exceção daquela data}.
+        """
+        semaphore = asyncio.Semaphore(concurrency or CALENDAR_CONCURRENCY)
+
+        async def fetch(for_date: str):
+            async with semaphore:
+                return await self.get_park_products_payload(
+                    park_code,
+                    for_date=for_date,
+                    number_days=number_days,
+                    num_adults=num_adults,
+                    num_children=num_children,
+                    timeout=timeout,
+                    language=language,
+                )
+
+        results = await asyncio.gather(*[fetch(for_date) for for_date in dates], return_exceptions=True)
+        return dict(zip(dates, results))
+
+    def resilience_stats(self) -> dict:
+        p95 = {family: tracker.percentile(0.95) for family, tracker in self.latencies.items()}
+        return {
+            'breakers': {family: breaker.stats() for family, breaker in self.breakers.items()},
+            'hedging': self.hedging,
+            'hedges': self.hedges,
+            'deadline_exceeded': self.deadline_exceeded,
+            'p95_ms': {family: round(value * 1000, 1) for family, value in p95.items() if value is not None},
+        }
+
+
+def get_maria_client(request) -> MariaApi:
+    """
+    Retorna o cliente compartilhado criado no lifespan da aplicação.
+    """
+    return request.app.state.maria_client
@@ -0,0 +1,58 @@
+"""
+Leitura do espelho local do catálogo da Maria API (tabelas catalogpark e
+catalogproduct, preenchidas por sync.py).
+
+Cada método retorna None em caso de miss, para que o MariaApi caia para a
+chamada à Maria API.
+"""
+from typing import List, Optional, Tuple
+
+from src.models import CatalogPark, CatalogProduct
+from .dto import Park, ParkProduct, ParkProductDetail
+
+
+class CatalogMirror:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def _result(self, value, size: int):
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value, size
+
+    async def get_parks(self) -> Optional[Tuple[List[Park], int]]:
+        payloads = await CatalogPark.all().order_by('id').values_list('payload', flat=True)
+        if not payloads:
+            return self._result(None, 0)
+        parks = [Park.model_validate_json(payload) for payload in payloads]
+        return self._result(parks, sum(len(payload) for payload in payloads))
+
+    async def get_park(self, park_code: str) -> Optional[Tuple[Park, int]]:
+        payload = await CatalogPark.filter(code=park_code).first().values_list('payload', flat=True)
+        if payload is None:
+            return self._result(None, 0)
+        return self._result(Park.model_validate_json(payload), len(payload))
+
+    async def get_park_products(self, park_code: str) -> Optional[Tuple[List[ParkProduct], int]]:
+        payloads = await CatalogProduct.filter(park_code=park_code).order_by('id').values_list('payload', flat=True)
+        if not payloads:
+            return self._result(None, 0)
+        products = [ParkProduct.model_validate_json(payload) for payload in payloads]
+        return self._result(products, sum(len(payload) for payload in payloads))
+
+    async def get_park_product_detail(self, park_code: str, product_code: str) -> Optional[Tuple[ParkProductDetail, int]]:
+        detail = await CatalogProduct.filter(
+            park_code=park_code, code=product_code, detail__isnull=False,
+        ).first().values_list('detail', flat=True)
+        if detail is None:
+            return self._result(None, 0)
+        return self._result(ParkProductDetail.model_validate_json(detail), len(detail))
+
+    def stats(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+        }
@@ -0,0 +1,231 @@
+"""
+Resiliência da integração com a Maria API.
+
+- CircuitBreaker: por família de endpoint (parks, park, products,
+  product_detail). Após N falhas consecutivas do upstream o circuito abre e as
+  chamadas falham na hora (CircuitOpenError); depois de `recovery_timeout`
+  segundos algumas chamadas de teste (half-open) decidem se ele fecha de novo.
+- deadline(): orçamento de tempo por requisição (contextvar). Todas as chamadas
+  à Maria API feitas dentro do bloco dividem o mesmo prazo.
+- LatencyTracker: janela de latências recentes por família, usada para
+  calcular o atraso (p95) das requisições "hedged".
+
+Enquanto o circuito está aberto o MariaResponseCache serve o último valor bom
+conhecido, mesmo fora da janela stale.
+"""
+import asyncio
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+import httpx
+
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('MARIA_CIRCUIT_FAILURE_THRESHOLD', '5'))
+CIRCUIT_RECOVERY_TIMEOUT = float(os.getenv('MARIA_CIRCUIT_RECOVERY_TIMEOUT', '30'))
+CIRCUIT_HALF_OPEN_CALLS = int(os.getenv('MARIA_CIRCUIT_HALF_OPEN_CALLS', '1'))
+# Orçamento total (segundos) de chamadas à Maria API por requisição da plataforma
+REQUEST_BUDGET = float(os.getenv('MARIA_REQUEST_BUDGET', '8'))
+# Um timeout com pelo menos este tempo disponível conta como falha do upstream,
+# mesmo que o limite tenha sido reduzido pelo prazo da requisição
+CIRCUIT_TIMEOUT_FLOOR = float(os.getenv('MARIA_CIRCUIT_TIMEOUT_FLOOR', '1'))
+HEDGING_ENABLED = os.getenv('MARIA_API_HEDGING', 'false').lower() in ('1', 'true', 'yes')
+HEDGE_MIN_DELAY = float(os.getenv('MARIA_HEDGE_MIN_DELAY', '0.05'))
+HEDGE_MIN_SAMPLES = int(os.getenv('MARIA_HEDGE_MIN_SAMPLES', '20'))
+
+
+class MariaUnavailableError(Exception):
+    """A Maria API não pôde ser consultada (circuito aberto ou prazo esgotado)."""
+
+
+class CircuitOpenError(MariaUnavailableError):
+    def __init__(self, family: str, retry_after: float):
+        super().__init__(f"Maria API circuit open for '{family}' (retry in {retry_after:.1f}s)")
+        self.family = family
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(MariaUnavailableError):
+    pass
+
+
+def is_upstream_failure(exc: BaseException) -> bool:
+    """
+    Falhas que indicam upstream degradado: timeouts, erros de conexão, 429 e 5xx.
+    Respostas 4xx (ex.: produto inexistente) não contam.
+    """
+    if isinstance(exc, MariaUnavailableError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status_code = exc.response.status_code
+        return status_code >= 500 or status_code == 429
+    return isinstance(exc, httpx.TransportError)
+
+
+def maria_error_status(exc: BaseException) -> int:
+    """
+    Status HTTP a devolver para o cliente da plataforma quando a Maria API falha.
+    """
+    if isinstance(exc, (DeadlineExceededError, httpx.TimeoutException)):
+        return 504
+    if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 404:
+        return 404
+    if is_upstream_failure(exc):
+        return 503
+    return 502
+
+
+# ---------------------------------------------------------------------------
+# Orçamento de tempo por requisição
+# ---------------------------------------------------------------------------
+
+_deadline: ContextVar[Optional[float]] = ContextVar('maria_deadline', default=None)
+
+
+@contextmanager
+def deadline(budget: float):
+    """
+    Limita a `budget` segundos o tempo gasto com a Maria API dentro do bloco.
+    Prazos aninhados nunca estendem o prazo externo.
+    """
+    expires_at = time.monotonic() + budget
+    current = _deadline.get()
+    token = _deadline.set(expires_at if current is None else min(current, expires_at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def clear_deadline():
+    """
+    Remove o prazo do contexto atual (ex.: refresh em background, que não deve
+    herdar o prazo da requisição que o disparou).
+    """
+    _deadline.set(None)
+
+
+def remaining_budget() -> Optional[float]:
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+# ---------------------------------------------------------------------------
+# Circuit breaker
+# ---------------------------------------------------------------------------
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, family: str, failure_threshold: int = None,
+                recovery_timeout: float = None, half_open_max_calls: int = None):
+        self.family = family
+        self.failure_threshold = failure_threshold or CIRCUIT_FAILURE_THRESHOLD
+        self.recovery_timeout = CIRCUIT_RECOVERY_TIMEOUT if recovery_timeout is None else recovery_timeout
+        self.half_open_max_calls = half_open_max_calls or CIRCUIT_HALF_OPEN_CALLS
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._probes = 0
+        self.rejected = 0
+        self.opens = 0
+
+    def acquire(self):
+        """
+        Chamado antes de cada requisição. Levanta CircuitOpenError se o
+        circuito está aberto ou se as chamadas de teste já estão em andamento.
+        """
+        if self.state == self.OPEN:
+            elapsed = time.monotonic() - self.opened_at
+            if elapsed < self.recovery_timeout:
+                self.rejected += 1
+                raise CircuitOpenError(self.family, self.recovery_timeout - elapsed)
+            self.state = self.HALF_OPEN
+            self._probes = 0
+        if self.state == self.HALF_OPEN:
+            if self._probes >= self.half_open_max_calls:
+                self.rejected += 1
+                raise CircuitOpenError(self.family, 0)
+            self._probes += 1
+
+    def release(self):
+        """Chamada terminou sem resultado conclusivo (cancelada, prazo local)."""
+        if self.state == self.HALF_OPEN:
+            self._probes = max(0, self._probes - 1)
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        if self.state != self.CLOSED:
+            self.state = self.CLOSED
+            self.opened_at = None
+            self._probes = 0
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.opens += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self._probes = 0
+
+    def stats(self) -> dict:
+        return {
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'opens': self.opens,
+            'rejected': self.rejected,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Latências e hedging
+# ---------------------------------------------------------------------------
+
+class LatencyTracker:
+    def __init__(self, window: int = 200):
+        self.samples = deque(maxlen=window)
+
+    def observe(self, seconds: float):
+        self.samples.append(seconds)
+
+    def percentile(self, p: float) -> Optional[float]:
+        if len(self.samples) < HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def hedged(call, delay: float, on_hedge=None):
+    """
+    Executa `call()`; se não terminar em `delay` segundos, dispara uma segunda
+    chamada idêntica e devolve o primeiro sucesso, cancelando a outra. Só deve
+    ser usado em leituras idempotentes.
+    """
+    tasks = [asyncio.ensure_future(call())]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            if on_hedge is not None:
+                on_hedge()
+            tasks.append(asyncio.ensure_future(call()))
+
+        pending = set(tasks)
+        error = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = error or task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
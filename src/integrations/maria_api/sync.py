@@ -0,0 +1,198 @@
+"""
+Sincronização do catálogo da Maria API para o espelho local.
+
+Busca parques, produtos e detalhes de produtos e grava apenas as linhas cujo
+conteúdo mudou (comparando checksums). Pode rodar em background no lifespan
+da aplicação (run_periodic_sync) ou manualmente via scripts/sync_catalog.py.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+from tortoise.expressions import Q
+from src.models import CatalogPark, CatalogProduct
+from .maria import MariaApi
+
+logger = logging.getLogger(__name__)
+
+SYNC_INTERVAL = float(os.getenv('MARIA_CATALOG_SYNC_INTERVAL', '900'))
+SYNC_DETAIL_CONCURRENCY = int(os.getenv('MARIA_CATALOG_SYNC_CONCURRENCY', '8'))
+
+
+def checksum(payload: str) -> str:
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class CatalogSyncMetrics:
+    def __init__(self):
+        self.runs = 0
+        self.failures = 0
+        self.last_started_at: Optional[float] = None
+        self.last_success_at: Optional[float] = None
+        self.last_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.last_summary: Dict[str, int] = {}
+
+    def lag(self) -> Optional[float]:
+        """Segundos desde a última sincronização concluída com sucesso."""
+        if self.last_success_at is None:
+            return None
+        return time.time() - self.last_success_at
+
+    def stats(self) -> dict:
+        return {
+            'runs': self.runs,
+            'failures': self.failures,
+            'last_success_at': self.last_success_at,
+            'lag_seconds': self.lag(),
+            'last_duration_seconds': self.last_duration,
+            'last_error': self.last_error,
+            'last_summary': self.last_summary,
+        }
+
+
+async def sync_parks(maria_client: MariaApi, summary: Dict[str, int]) -> List[str]:
+    parks = await maria_client.get_parks()
+    existing = {
+        row['code']: row
+        for row in await CatalogPark.all().values('id', 'code', 'checksum')
+    }
+
+    to_create = []
+    for park in parks:
+        payload = park.model_dump_json(by_alias=True)
+        digest = checksum(payload)
+        row = existing.get(park.code)
+        if row is None:
+            to_create.append(CatalogPark(code=park.code, name=park.name, payload=payload, checksum=digest))
+        elif row['checksum'] != digest:
+            await CatalogPark.filter(id=row['id']).update(name=park.name, payload=payload, checksum=digest)
+            summary['parks_updated'] += 1
+
+    if to_create:
+        await CatalogPark.bulk_create(to_create)
+        summary['parks_created'] += len(to_create)
+
+    codes = {park.code for park in parks}
+    removed = [code for code in existing if code not in codes]
+    if removed:
+        await CatalogPark.filter(code__in=removed).delete()
+        await CatalogProduct.filter(park_code__in=removed).delete()
+        summary['parks_deleted'] += len(removed)
+
+    return [park.code for park in parks]
+
+
+async def sync_park_products(maria_client: MariaApi, park_code: str,
+                semaphore: asyncio.Semaphore, summary: Dict[str, int]):
+    products = await maria_client.get_park_products(park_code)
+    existing = {
+        row['code']: row
+        for row in await CatalogProduct.filter(park_code=park_code).values('id', 'code', 'checksum', 'detail_checksum')
+    }
+
+    to_create = []
+    needs_detail = []
+    for product in products:
+        payload = product.model_dump_json(by_alias=True)
+        digest = checksum(payload)
+        row = existing.get(product.code)
+        if row is None:
+            to_create.append(CatalogProduct(park_code=park_code, code=product.code, payload=payload, checksum=digest))
+            needs_detail.append(product.code)
+        elif row['checksum'] != digest:
+            await CatalogProduct.filter(id=row['id']).update(payload=payload, checksum=digest)
+            summary['products_updated'] += 1
+            needs_detail.append(product.code)
+        elif row['detail_checksum'] is None:
+            needs_detail.append(product.code)
+
+    if to_create:
+        await CatalogProduct.bulk_create(to_create)
+        summary['products_created'] += len(to_create)
+
+    codes = {product.code for product in products}
+    removed = [code for code in existing if code not in codes]
+    if removed:
+        await CatalogProduct.filter(park_code=park_code, code__in=removed).delete()
+        summary['products_deleted'] += len(removed)
+
+    # Detalhes só para produtos novos, alterados ou ainda sem detalhe
+    await asyncio.gather(*[
+        sync_product_detail(maria_client, park_code, code, semaphore, summary)
+        for code in needs_detail
+    ])
+
+
+async def sync_product_detail(maria_client: MariaApi, park_code: str, product_code: str,
+                semaphore: asyncio.Semaphore, summary: Dict[str, int]):
+    async with semaphore:
+        try:
+            detail = await maria_client.get_park_product_detail(park_code, product_code)
+        except Exception as e:
+            summary['detail_errors'] += 1
+            logger.warning("Catalog sync: detail %s/%s failed: %s", park_code, product_code, e)
+            return
+    payload = detail.model_dump_json(by_alias=True)
+    digest = checksum(payload)
+    updated = await CatalogProduct.filter(
+        Q(detail_checksum__isnull=True) | Q(detail_checksum__not=digest),
+        park_code=park_code, code=product_code,
+    ).update(detail=payload, detail_checksum=digest)
+    summary['details_updated'] += updated
+
+
+async def sync_catalog(maria_client: MariaApi, metrics: CatalogSyncMetrics = None) -> Dict[str, int]:
+    """
+    Executa uma sincronização completa. Retorna contadores de linhas escritas.
+    """
+    metrics = metrics or CatalogSyncMetrics()
+    summary = dict.fromkeys([
+        'parks_created', 'parks_updated', 'parks_deleted',
+        'products_created', 'products_updated', 'products_deleted',
+        'details_updated', 'detail_errors', 'park_errors',
+    ], 0)
+
+    metrics.runs += 1
+    metrics.last_started_at = time.time()
+    started = time.perf_counter()
+    try:
+        park_codes = await sync_parks(maria_client, summary)
+        semaphore = asyncio.Semaphore(SYNC_DETAIL_CONCURRENCY)
+        for park_code in park_codes:
+            # Um parque com falha (timeout, circuito aberto) não impede os demais
+            try:
+                await sync_park_products(maria_client, park_code, semaphore, summary)
+            except Exception as e:
+                summary['park_errors'] += 1
+                logger.warning("Catalog sync: park %s failed: %s", park_code, e)
+    except Exception as e:
+        metrics.failures += 1
+        metrics.last_error = str(e)
+        raise
+    finally:
+        metrics.last_duration = time.perf_counter() - started
+
+    metrics.last_success_at = time.time()
+    metrics.last_error = None
+    metrics.last_summary = summary
+    return summary
+
+
+async def run_periodic_sync(maria_client: MariaApi, metrics: CatalogSyncMetrics,
+                interval: float = SYNC_INTERVAL):
+    """
+    Loop de sincronização em background (iniciado no lifespan).
+    """
+    while True:
+        try:
+            summary = await sync_catalog(maria_client, metrics)
+            logger.info("Catalog sync finished in %.2fs: %s", metrics.last_duration, summary)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Catalog sync failed: %s", e)
+        await asyncio.sleep(interval)
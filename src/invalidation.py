@@ -0,0 +1,117 @@
+"""
+Barramento de invalidação dos caches em memória.
+
+Cada cache local (tokens, lojas, ...) assina um tópico e remove suas entradas
+quando recebe uma chave. Com vários processos (workers do uvicorn/gunicorn),
+AUTH_INVALIDATION_BUS=postgres propaga as invalidações entre eles via
+LISTEN/NOTIFY no próprio banco; o padrão (local) só atende o processo atual.
+"""
+import asyncio
+import json
+import logging
+import os
+import uuid
+from typing import Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_BUS = os.getenv('AUTH_INVALIDATION_BUS', 'local').lower()
+INVALIDATION_CHANNEL = os.getenv('AUTH_INVALIDATION_CHANNEL', 'cache_invalidation')
+
+
+class InvalidationBus:
+    """
+    Implementação local: publicar apenas chama os assinantes deste processo.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[str, List[Callable[[str], None]]] = {}
+        self.published = 0
+        self.received = 0
+
+    def subscribe(self, topic: str, handler: Callable[[str], None]):
+        self._handlers.setdefault(topic, []).append(handler)
+
+    def dispatch(self, topic: str, key: str):
+        for handler in self._handlers.get(topic, ()):
+            try:
+                handler(key)
+            except Exception as e:
+                logger.warning("Invalidation handler failed for %s %s: %s", topic, key, e)
+
+    async def publish(self, topic: str, key: str):
+        self.published += 1
+        self.dispatch(topic, key)
+        await self._broadcast(topic, key)
+
+    async def _broadcast(self, topic: str, key: str):
+        pass
+
+    async def start(self):
+        pass
+
+    async def aclose(self):
+        pass
+
+    def stats(self) -> dict:
+        return {
+            'backend': 'local',
+            'published': self.published,
+            'received': self.received,
+        }
+
+
+class PostgresInvalidationBus(InvalidationBus):
+    """
+    Propaga as invalidações para os demais processos com NOTIFY e escuta as
+    deles com LISTEN (conexão asyncpg dedicada).
+    """
+
+    def __init__(self, dsn: str, channel: str = INVALIDATION_CHANNEL):
+        super().__init__()
+        self.dsn = dsn
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._connection = None
+        self._lock = asyncio.Lock()
+
+    async def start(self):
+        import asyncpg
+
+        self._connection = await asyncpg.connect(self.dsn)
+        await self._connection.add_listener(self.channel, self._on_notify)
+
+    async def aclose(self):
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+    async def _broadcast(self, topic: str, key: str):
+        if self._connection is None:
+            return
+        payload = json.dumps({'origin': self.origin, 'topic': topic, 'key': key})
+        try:
+            # Uma conexão asyncpg não aceita comandos simultâneos
+            async with self._lock:
+                await self._connection.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+        except Exception as e:
+            logger.warning("Invalidation broadcast failed for %s %s: %s", topic, key, e)
+
+    def _on_notify(self, connection, pid, channel, payload: str):
+        message = json.loads(payload)
+        if message['origin'] == self.origin:
+            return
+        self.received += 1
+        self.dispatch(message['topic'], message['key'])
+
+    def stats(self) -> dict:
+        return {**super().stats(), 'backend': 'postgres', 'connected': self._connection is not None}
+
+
+def create_invalidation_bus() -> InvalidationBus:
+    if INVALIDATION_BUS == 'postgres':
+        return PostgresInvalidationBus(os.getenv('DATABASE_URL'))
+    return InvalidationBus()
+
+
+invalidation_bus = create_invalidation_bus()
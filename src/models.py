@@ -12,6 +12,7 @@ ORDER_STATUS = (
 
 CART_STATUS = (
     ('active', 'Ativo'),
+    ('closed', 'Fechado'),  # Convertido em pedido
     ('abandoned', 'Abandonado'),
 )
 
@@ -29,7 +30,7 @@ class Store(Model):
     id = fields.IntField(primary_key=True)
     name = fields.CharField(max_length=255)
     seller = fields.ForeignKeyField("models.Seller", related_name='seller_owner')
-    credential = fields.CharField(max_length=255)
+    credential = fields.CharField(max_length=255, db_index=True)
     commission_percentage = fields.DecimalField(max_digits=5, decimal_places=2, default=0)  # Ex: 10.50 = 10.5%
     created_at = fields.DatetimeField(auto_now_add=True)
 
@@ -38,30 +39,42 @@ class Seller(Model):
     name = fields.CharField(max_length=255)
     email = fields.CharField(unique=True, max_length=255)
     password = fields.CharField(max_length=255)
+    # Incrementada a cada login; revoga os tokens assinados anteriores
+    token_epoch = fields.IntField(default=0)
     created_at = fields.DatetimeField(auto_now_add=True)
 
 class SellerAuth(Model):
     id = fields.IntField(primary_key=True)
     status = fields.CharField(max_length=255, choices=AUTH_STATUS, default='valid')
     seller = fields.ForeignKeyField("models.Seller", related_name='seller_auth')
-    access_token = fields.CharField(max_length=255)
+    access_token = fields.CharField(max_length=255, db_index=True)
     created_at = fields.DatetimeField(auto_now_add=True)
 
+    class Meta:
+        # Login invalida apenas o token vigente do usuário
+        indexes = (("seller", "status"),)
+
 class Customer(Model):
     id = fields.IntField(primary_key=True)
     store = fields.ForeignKeyField("models.Store", related_name='store_customer')
     name = fields.CharField(max_length=255)
     email = fields.CharField(unique=True, max_length=255)
     password = fields.CharField(max_length=255)
+    # Incrementada a cada login; revoga os tokens assinados anteriores
+    token_epoch = fields.IntField(default=0)
     created_at = fields.DatetimeField(auto_now_add=True)
 
 class CustomerAuth(Model):
     id = fields.IntField(primary_key=True)
     status = fields.CharField(max_length=255, choices=AUTH_STATUS, default='valid')
     customer = fields.ForeignKeyField("models.Customer", related_name='customer_auth')
-    access_token = fields.CharField(max_length=255)
+    access_token = fields.CharField(max_length=255, db_index=True)
     created_at = fields.DatetimeField(auto_now_add=True)
 
+    class Meta:
+        # Login invalida apenas o token vigente do usuário
+        indexes = (("customer", "status"),)
+
 class Product(Model):
     id = fields.IntField(primary_key=True)
     status = fields.CharField(max_length=255, choices=PRODUCT_STATUS, default='active')
@@ -73,13 +86,25 @@ class Product(Model):
     store = fields.ForeignKeyField("models.Store", related_name='store_product')
     created_at = fields.DatetimeField(auto_now_add=True)
 
+    class Meta:
+        # Um produto da Maria API por loja (também indexa a busca por código externo)
+        unique_together = (("store", "park_code", "product_code"),)
+
 
 class Cart(Model):
     id = fields.IntField(primary_key=True)
     store = fields.ForeignKeyField("models.Store", related_name='store_cart')
     status = fields.CharField(max_length=255, choices=CART_STATUS, default='active')
     customer = fields.ForeignKeyField("models.Customer", related_name='cart_customer')
+    # Incrementada a cada alteração dos itens (ETag de /carts/current)
+    version = fields.IntField(default=0)
     created_at = fields.DatetimeField(auto_now_add=True)
+    # Última alteração dos itens (usado para marcar carrinhos abandonados)
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        # Busca do carrinho ativo do cliente na loja; busca dos carrinhos parados
+        indexes = (("store", "customer", "status"), ("status", "updated_at"))
 
 class CartItem(Model):
     id = fields.IntField(primary_key=True)
@@ -89,6 +114,12 @@ class CartItem(Model):
     price = fields.IntField(default=0)  # Price in cents at the time of addition
     attributes = fields.JSONField(default={})  # Stores date, adults, children, etc.
     created_at = fields.DatetimeField(auto_now_add=True)
+    # sha256 dos atributos normalizados (ver utils.attributes_key)
+    attributes_key = fields.CharField(max_length=64, default='')
+
+    class Meta:
+        # Uma linha por produto/atributos no carrinho: adicionar de novo soma amount
+        unique_together = (("cart", "product", "attributes_key"),)
 
 class Order(Model):
     id = fields.IntField(primary_key=True)
@@ -110,6 +141,11 @@ class Order(Model):
     address_state = fields.CharField(max_length=255, null=True)
     address_zip = fields.CharField(max_length=255, null=True)
 
+    # Resumo dos itens, gravado na criação (ver utils.order_totals)
+    total_cents = fields.IntField(default=0)
+    item_count = fields.IntField(default=0)  # Soma das quantidades
+    items_summary = fields.TextField(default='')  # "1x Produto 1, 3x Produto 2"
+
     created_at = fields.DatetimeField(auto_now_add=True)
 
 class OrderItem(Model):
@@ -118,4 +154,46 @@ class OrderItem(Model):
     product = fields.ForeignKeyField("models.Product", related_name='product_orderitem')
     price = fields.IntField()
     amount = fields.IntField(default=1)
-    attributes = fields.JSONField(default={})  # Snapshot of cart item attributes
\ No newline at end of file
+    attributes = fields.JSONField(default={})  # Snapshot of cart item attributes
+
+class CatalogPark(Model):
+    """Espelho local de um parque da Maria API (payload original em JSON)."""
+    id = fields.IntField(primary_key=True)
+    code = fields.CharField(max_length=255, unique=True)
+    name = fields.CharField(max_length=255)
+    payload = fields.TextField()
+    checksum = fields.CharField(max_length=64)
+    synced_at = fields.DatetimeField(auto_now=True)
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+class CatalogProduct(Model):
+    """Espelho local de um produto da Maria API (item da listagem + detalhe)."""
+    id = fields.IntField(primary_key=True)
+    park_code = fields.CharField(max_length=255, db_index=True)
+    code = fields.CharField(max_length=255)
+    payload = fields.TextField()
+    checksum = fields.CharField(max_length=64)
+    detail = fields.TextField(null=True)
+    detail_checksum = fields.CharField(max_length=64, null=True)
+    synced_at = fields.DatetimeField(auto_now=True)
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = (("park_code", "code"),)
+
+class IdempotencyKey(Model):
+    """Resultado de uma requisição com Idempotency-Key (ver src/idempotency.py)."""
+    id = fields.IntField(primary_key=True)
+    scope = fields.CharField(max_length=255)  # Endpoint + quem chamou
+    key = fields.CharField(max_length=255)
+    fingerprint = fields.CharField(max_length=64)  # sha256 do corpo da requisição
+    status_code = fields.IntField(null=True)  # None enquanto a primeira execução não termina
+    response = fields.JSONField(null=True)
+    # Execução em andamento: quem a detém e até quando (renovado enquanto roda)
+    owner = fields.CharField(max_length=32, null=True)
+    locked_until = fields.DatetimeField(null=True)
+    expires_at = fields.DatetimeField(db_index=True)
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = (("scope", "key"),)
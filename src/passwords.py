@@ -0,0 +1,98 @@
+"""
+Hash de senhas com scrypt (hashlib, sem dependências extras).
+
+O scrypt é propositalmente lento e a versão do hashlib libera o GIL, então o
+cálculo roda num pool de threads limitado (PASSWORD_HASH_WORKERS) sem travar o
+event loop. O custo é configurável por PASSWORD_SCRYPT_N/R/P; hashes gerados
+com outro custo são refeitos no próximo login (needs_rehash).
+
+Formato armazenado: "scrypt$<n>$<r>$<p>$<salt base64>$<hash base64>".
+Senhas antigas em texto puro continuam aceitas e são convertidas no login.
+"""
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+PASSWORD_SCRYPT_N = int(os.getenv('PASSWORD_SCRYPT_N', str(2 ** 14)))
+PASSWORD_SCRYPT_R = int(os.getenv('PASSWORD_SCRYPT_R', '8'))
+PASSWORD_SCRYPT_P = int(os.getenv('PASSWORD_SCRYPT_P', '1'))
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', str(min(4, os.cpu_count() or 1))))
+
+SCHEME = 'scrypt'
+SALT_SIZE = 16
+KEY_SIZE = 32
+
+
+class PasswordHasher:
+    def __init__(self, n: int = PASSWORD_SCRYPT_N, r: int = PASSWORD_SCRYPT_R, p: int = PASSWORD_SCRYPT_P,
+                workers: int = PASSWORD_HASH_WORKERS):
+        self.n = n
+        self.r = r
+        self.p = p
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hash')
+        # Hash de referência para igualar o tempo de resposta de usuários inexistentes
+        self._dummy = None
+
+    def _derive(self, password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+        return hashlib.scrypt(
+            password.encode(), salt=salt, n=n, r=r, p=p,
+            maxmem=256 * n * r + 1024 * 1024, dklen=KEY_SIZE,
+        )
+
+    def hash_sync(self, password: str) -> str:
+        salt = os.urandom(SALT_SIZE)
+        key = self._derive(password, salt, self.n, self.r, self.p)
+        return f"{SCHEME}${self.n}${self.r}${self.p}${_encode(salt)}${_encode(key)}"
+
+    def verify_sync(self, password: str, stored: str) -> bool:
+        if not is_hashed(stored):
+            # Legado em texto puro
+            return hmac.compare_digest(password.encode(), stored.encode())
+        try:
+            _, n, r, p, salt, key = stored.split('$')
+            expected = _decode(key)
+            derived = self._derive(password, _decode(salt), int(n), int(r), int(p))
+        except ValueError:
+            return False
+        return hmac.compare_digest(derived, expected)
+
+    def needs_rehash(self, stored: str) -> bool:
+        if not is_hashed(stored):
+            return True
+        return stored.split('$')[1:4] != [str(self.n), str(self.r), str(self.p)]
+
+    async def hash(self, password: str) -> str:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.hash_sync, password)
+
+    async def verify(self, password: str, stored: str = None) -> bool:
+        """
+        stored=None (usuário inexistente) faz o mesmo trabalho e retorna False.
+        """
+        loop = asyncio.get_running_loop()
+        if stored is None:
+            if self._dummy is None:
+                self._dummy = await self.hash('dummy-password')
+            await loop.run_in_executor(self._executor, self.verify_sync, password, self._dummy)
+            return False
+        return await loop.run_in_executor(self._executor, self.verify_sync, password, stored)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+def is_hashed(stored: str) -> bool:
+    return stored.startswith(f"{SCHEME}$")
+
+
+def _encode(raw: bytes) -> str:
+    return base64.b64encode(raw).decode().rstrip('=')
+
+
+def _decode(value: str) -> bytes:
+    return base64.b64decode(value + '=' * (-len(value) % 4))
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,201 @@
+"""
+Motor de precificação com comissões (plataforma + seller).
+
+O multiplicador combinado (1 + plataforma/100) * (1 + seller/100) é calculado
+uma única vez por loja como fração de inteiros, e os preços são recalculados em
+centavos com aritmética inteira (ponto fixo), arredondando como
+Decimal.quantize(Decimal('0.01')) (ROUND_HALF_EVEN).
+"""
+from decimal import Decimal
+from math import gcd
+from typing import Dict, List, Tuple
+
+from src.constants import PLATFORM_COMMISSION_PERCENTAGE
+
+PRICE_TYPES = ('adult', 'child', 'total')
+
+# Percentuais com até 4 casas decimais: 20.0% -> 200000 / 1_000_000
+PERCENT_SCALE = 10_000
+FACTOR_SCALE = 100 * PERCENT_SCALE
+
+
+def _factor_numerator(percentage: Decimal) -> int:
+    scaled = Decimal(str(percentage)) * PERCENT_SCALE
+    if scaled != scaled.to_integral_value():
+        # Truncar mudaria o preço em relação ao cálculo com Decimal
+        raise ValueError(f"Commission percentage has more than 4 decimal places: {percentage}")
+    return FACTOR_SCALE + int(scaled)
+
+
+def _div_round_half_even(numerator: int, denominator: int) -> int:
+    quotient, remainder = divmod(numerator, denominator)
+    double = 2 * remainder
+    if double > denominator or (double == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+def parse_amount(amount: str) -> Tuple[int, int]:
+    """
+    "750.98" -> (75098, 100). Retorna (valor inteiro, escala).
+    """
+    amount = str(amount).strip()
+    whole, _, fraction = amount.partition('.')
+    if not (whole + fraction).lstrip('-').isdigit() or (fraction and not fraction.isdigit()):
+        raise ValueError(f"Invalid amount: {amount!r}")
+    return int(whole + fraction), 10 ** len(fraction)
+
+
+def format_cents(cents: int) -> str:
+    """
+    75098 -> "750.98"
+    """
+    sign = '-' if cents < 0 else ''
+    units, remainder = divmod(abs(cents), 100)
+    return f"{sign}{units}.{remainder:02d}"
+
+
+class CommissionPricer:
+    """
+    Aplica as comissões de uma loja. Crie uma instância por requisição/loja
+    (CommissionPricer.for_store) e reutilize para toda a listagem.
+    """
+
+    def __init__(self, seller_commission, platform_commission=PLATFORM_COMMISSION_PERCENTAGE):
+        self.platform_commission = str(platform_commission)
+        self.seller_commission = str(Decimal(str(seller_commission)))
+        self.numerator = (
+            _factor_numerator(Decimal(str(platform_commission)))
+            * _factor_numerator(Decimal(str(seller_commission)))
+        )
+        self.denominator = FACTOR_SCALE * FACTOR_SCALE
+        # Fração reduzida (ex.: 1.2 * 1.125 = 27/20): multiplicações com inteiros pequenos
+        divisor = gcd(self.numerator, self.denominator)
+        self.numerator //= divisor
+        self.denominator //= divisor
+        self._memo: Dict[str, str] = {}
+
+    @classmethod
+    def for_store(cls, store) -> "CommissionPricer":
+        return cls(store.commission_percentage)
+
+    def amount_to_cents(self, amount: str) -> int:
+        """
+        Preço base (string da Maria API) -> preço final com comissões, em centavos.
+        """
+        value, scale = parse_amount(amount)
+        return _div_round_half_even(value * self.numerator * 100, self.denominator * scale)
+
+    def reprice_amount(self, amount: str) -> str:
+        # Preços se repetem muito numa listagem: memoiza por string
+        repriced = self._memo.get(amount)
+        if repriced is None:
+            repriced = format_cents(self.amount_to_cents(amount))
+            self._memo[amount] = repriced
+        return repriced
+
+    def reprice_products(self, products: List[dict], copy: bool = False) -> List[dict]:
+        """
+        Recalcula em lote os preços usdbrl de adult, child e total de uma
+        listagem de produtos (ParkProduct.model_dump()).
+
+        Por padrão altera os próprios dicts. Com copy=True (listagens vindas do
+        cache, compartilhadas entre requisições) copia apenas o caminho até cada
+        preço alterado e devolve uma nova lista.
+        """
+        numerator = self.numerator
+        denominator = self.denominator
+        memo = self._memo
+        platform_commission = self.platform_commission
+        seller_commission = self.seller_commission
+        result = [] if copy else products
+
+        for product in products:
+            prices = product.get('prices')
+            if not prices:
+                if copy:
+                    result.append(product)
+                continue
+            if copy:
+                product = dict(product)
+                prices = product['prices'] = dict(prices)
+                result.append(product)
+            for price_type in PRICE_TYPES:
+                pair = prices.get(price_type)
+                usdbrl = pair.get('usdbrl') if pair else None
+                if not usdbrl:
+                    continue
+                if copy:
+                    pair = prices[price_type] = dict(pair)
+                    usdbrl = pair['usdbrl'] = dict(usdbrl)
+                amount = usdbrl['amount']
+                repriced = memo.get(amount)
+                if repriced is None:
+                    if amount[-3:-2] == '.':
+                        # Caminho rápido ("750.98"): centavos e half-even inline
+                        cents, remainder = divmod(int(amount[:-3] + amount[-2:]) * numerator, denominator)
+                        remainder *= 2
+                        if remainder > denominator or (remainder == denominator and cents & 1):
+                            cents += 1
+                        repriced = format_cents(cents)
+                    else:
+                        repriced = format_cents(self.amount_to_cents(amount))
+                    memo[amount] = repriced
+                usdbrl['amount'] = repriced
+            product['platform_commission'] = platform_commission
+            product['seller_commission'] = seller_commission
+        return result
+
+    def reprice_detail(self, detail: dict) -> dict:
+        """
+        Recalcula o starting_price de um ParkProductDetail.model_dump().
+        """
+        starting_price = detail.get('starting_price')
+        if starting_price and starting_price.get('usdbrl'):
+            usdbrl = starting_price['usdbrl']
+            detail['original_price'] = str(Decimal(str(usdbrl['amount'])))
+            usdbrl['amount'] = self.reprice_amount(usdbrl['amount'])
+            detail['platform_commission'] = self.platform_commission
+            detail['seller_commission'] = self.seller_commission
+        return detail
+
+    def price_calendar(self, dates: List[str], listings: Dict[str, List[dict]]) -> dict:
+        """
+        Matriz compacta produto × data com os preços usdbrl já com comissões.
+
+        `listings` mapeia cada data para a listagem daquele dia
+        (get_park_products_payload); datas ausentes ficam com None. Cada linha
+        de `prices[tipo]` corresponde a um item de `products` e cada coluna a
+        uma data de `dates`.
+        """
+        products = []
+        rows: Dict[str, int] = {}
+        prices = {price_type: [] for price_type in PRICE_TYPES}
+
+        for column, day in enumerate(dates):
+            for product in listings.get(day) or ():
+                index = rows.get(product['code'])
+                if index is None:
+                    index = rows[product['code']] = len(products)
+                    extensions = product.get('extensions') or {}
+                    products.append({
+                        'code': product['code'],
+                        'ticket_name': product.get('ticket_name'),
+                        'number_days': extensions.get('number_days'),
+                    })
+                    for matrix in prices.values():
+                        matrix.append([None] * len(dates))
+                product_prices = product.get('prices') or {}
+                for price_type, matrix in prices.items():
+                    pair = product_prices.get(price_type)
+                    usdbrl = pair.get('usdbrl') if pair else None
+                    if usdbrl:
+                        matrix[index][column] = self.reprice_amount(usdbrl['amount'])
+
+        return {
+            'dates': dates,
+            'products': products,
+            'prices': prices,
+            'platform_commission': self.platform_commission,
+            'seller_commission': self.seller_commission,
+        }
@@ -12,7 +12,8 @@ from tortoise.functions import Sum, Count
 from tortoise.expressions import Q
 
 from src.authentication import seller_required, store_required
-from src.models import Order, OrderItem, Customer, Store, Product
+from src.auth_cache import store_cache
+from src.models import Order, Customer, Store, Product
 
 router = APIRouter(prefix="/seller/admin", tags=["seller_admin"])
 templates = Jinja2Templates(directory="templates")
@@ -32,6 +33,15 @@ async def seller_admin_dashboard_page(request: Request):
     })
 
 
+async def paid_total(orders) -> int:
+    """
+    Soma de Order.total_cents no banco, sem ler os itens dos pedidos.
+    """
+    # first(): exatamente uma linha, com o agregado de todos os pedidos
+    row = await orders.annotate(total=Sum('total_cents')).first().values('total')
+    return (row['total'] if row else None) or 0
+
+
 @router.get("/api/dashboard-stats")
 @seller_required
 @store_required
@@ -51,32 +61,20 @@ async def get_seller_dashboard_stats(request: Request):
     month_start = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
     
     # Valor total do dia (pedidos concluídos)
-    orders_today = await Order.filter(
+    total_today = await paid_total(Order.filter(
         store=store,
         created_at__gte=today_start,
         status='paid'  # Usando 'paid' ao invés de 'completed'
-    ).prefetch_related('orderitem_order__product')
-    
-    total_today = 0
-    for order in orders_today:
-        items = await order.orderitem_order.all()
-        order_total = sum(item.price * item.amount for item in items)
-        total_today += order_total
+    ))
     
     total_today = total_today / 100  # Converter de cents para reais
     
     # Valor total do mês
-    orders_month = await Order.filter(
+    total_month = await paid_total(Order.filter(
         store=store,
         created_at__gte=month_start,
         status='paid'
-    ).prefetch_related('orderitem_order__product')
-    
-    total_month = 0
-    for order in orders_month:
-        items = await order.orderitem_order.all()
-        order_total = sum(item.price * item.amount for item in items)
-        total_month += order_total
+    ))
     
     total_month = total_month / 100  # Converter de cents para reais
     
@@ -102,30 +100,20 @@ async def get_seller_orders(request: Request, limit: int = 50):
     store = request.current_store
     
     # Buscar pedidos ordenados por data (mais recentes primeiro)
-    orders = await Order.filter(store=store).order_by('-created_at').limit(limit).prefetch_related('orderitem_order__product', 'customer')
+    orders = await Order.filter(store=store).order_by('-created_at').limit(limit)
     
     orders_data = []
     
     for order in orders:
-        # Montar string de produtos (1x PRODUTO 1, 3x Produto 2)
-        items = await order.orderitem_order.all().prefetch_related('product')
-        products_str = ", ".join([f"{item.amount}x {item.product.name}" for item in items])
-        
-        # Calcular total do pedido
-        order_total = sum(item.price * item.amount for item in items) / 100
-        
-        # Dados do cliente
-        customer = await order.customer
-        customer_email = customer.email if customer else "N/A"
-        
+        # Produtos (1x PRODUTO 1, 3x Produto 2) e total gravados na criação do pedido
         orders_data.append({
             "id": order.id,
             "code": order.code,
             "customer_name": order.customer_name,
             "customer_email": order.customer_email,
             "status": order.status,
-            "products": products_str,
-            "total": float(order_total),
+            "products": order.items_summary,
+            "total": float(order.total_cents / 100),
             "created_at": order.created_at.isoformat()
         })
     
@@ -246,25 +234,24 @@ async def get_seller_customers(request: Request, limit: int = 100, offset: int =
     # Total de customers
     total = await Customer.filter(store=store).count()
     
+    # Total gasto e número de pedidos pagos de todos os customers da página numa consulta
+    paid = await Order.filter(
+        store=store, status='paid', customer_id__in=[customer.id for customer in customers],
+    ).group_by('customer_id').annotate(
+        total=Sum('total_cents'), orders=Count('id'),
+    ).values('customer_id', 'total', 'orders')
+    paid_by_customer = {row['customer_id']: row for row in paid}
+    
     customers_data = []
     for customer in customers:
-        # Calcular total gasto pelo customer (pedidos pagos)
-        orders = await Order.filter(customer=customer, store=store, status='paid').prefetch_related('orderitem_order')
-        
-        total_spent = 0
-        total_orders = len(orders)
-        
-        for order in orders:
-            items = await order.orderitem_order.all()
-            order_total = sum(item.price * item.amount for item in items)
-            total_spent += order_total
+        totals = paid_by_customer.get(customer.id, {'total': 0, 'orders': 0})
         
         customers_data.append({
             "id": customer.id,
             "name": customer.name,
             "email": customer.email,
-            "total_spent": float(total_spent / 100),  # Converter de cents para reais
-            "total_orders": total_orders,
+            "total_spent": float(totals['total'] / 100),  # Converter de cents para reais
+            "total_orders": totals['orders'],
             "created_at": customer.created_at.isoformat()
         })
     
@@ -292,20 +279,16 @@ async def get_customer_orders(request: Request, customer_id: int):
         raise HTTPException(status_code=404, detail="Cliente não encontrado")
     
     # Buscar pedidos do customer
-    orders = await Order.filter(customer=customer, store=store).order_by('-created_at').prefetch_related('orderitem_order__product')
+    orders = await Order.filter(customer=customer, store=store).order_by('-created_at')
     
     orders_data = []
     for order in orders:
-        items = await order.orderitem_order.all().prefetch_related('product')
-        products_str = ", ".join([f"{item.amount}x {item.product.name}" for item in items])
-        order_total = sum(item.price * item.amount for item in items) / 100
-        
         orders_data.append({
             "id": order.id,
             "code": order.code,
             "status": order.status,
-            "products": products_str,
-            "total": float(order_total),
+            "products": order.items_summary,
+            "total": float(order.total_cents / 100),
             "created_at": order.created_at.isoformat()
         })
     
@@ -360,7 +343,9 @@ async def update_store_settings(request: Request):
     """
     Atualiza configurações da loja
     """
-    store = request.current_store
+    # current_store pode ser a instância compartilhada do cache de credenciais:
+    # altera uma cópia fresca e invalida o cache depois de salvar
+    store = await Store.get(id=request.current_store.id)
     
     # Pegar dados do body
     body = await request.json()
@@ -383,6 +368,7 @@ async def update_store_settings(request: Request):
         store.commission_percentage = commission
     
     await store.save()
+    await store_cache.invalidate_store(store.credential)
     
     return {
         "id": store.id,
@@ -1,8 +1,14 @@
-from fastapi import APIRouter, Request, HTTPException
+import copy
+from typing import Callable, List, Tuple
+from fastapi import APIRouter, Request, HTTPException, Response
+from tortoise import timezone
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
 from src.models import Cart, CartItem, Product
-from src.dtos.cart import CartItemSchema, CartItemUpdateSchema
+from src.dtos.cart import CartItemSchema, CartItemUpdateSchema, CartBatchSchema
 from src.authentication import customer_required, store_required
-from src.utils import get_cart_items
+from src.cart_cache import CartSnapshot, cart_cache
+from src.utils import attributes_key, load_cart_snapshot, upsert_cart_item
 
 router = APIRouter(
     prefix="/carts",
@@ -11,14 +17,73 @@ router = APIRouter(
 )
 
 
+def cart_key(request: Request) -> Tuple[int, int]:
+    return (request.current_store.id, request.current_user.id)
+
+
+async def read_cart(request: Request) -> CartSnapshot:
+    key = cart_key(request)
+    cart = cart_cache.get(key)
+    if cart is None:
+        stamp = cart_cache.snapshot()
+        cart = await load_cart_snapshot(*key)
+        cart_cache.put(key, cart, stamp)
+    return cart
+
+
+async def bump_version(cart: Cart, connection) -> bool:
+    """
+    Incrementa a versão do carrinho na mesma transação da alteração, antes
+    dela: a linha do carrinho fica travada até o commit, então o checkout não o
+    fecha no meio e nada é gravado num carrinho fechado (409).
+
+    Retorna se a versão era a esperada, ou seja, se o snapshot em cache pode
+    ser atualizado sem reler o carrinho.
+    """
+    now = timezone.now()
+    active = Cart.filter(id=cart.id, status='active').using_db(connection)
+    if await active.filter(version=cart.version).update(version=cart.version + 1, updated_at=now):
+        return True
+    if await active.update(version=F('version') + 1, updated_at=now):
+        return False
+    raise HTTPException(status_code=409, detail="Cart is no longer active")
+
+
+async def write_through(request: Request, cart: Cart, apply: Callable[[List[dict]], None],
+                in_sequence: bool, created: bool = False) -> dict:
+    """
+    Aplica no snapshot em cache a mesma alteração (apply) feita no banco, sem
+    reler o carrinho. Se outro request alterou o carrinho no meio tempo
+    (in_sequence falso, ver bump_version), recarrega do banco.
+    """
+    key = cart_key(request)
+    base = CartSnapshot(cart.id, cart.version) if created else cart_cache.get(key)
+    if in_sequence and base is not None and (base.cart_id, base.version) == (cart.id, cart.version):
+        items = copy.deepcopy(base.items)
+        apply(items)
+        snapshot = CartSnapshot(cart.id, cart.version + 1, items)
+    else:
+        snapshot = await load_cart_snapshot(*key)
+    await cart_cache.publish(key, snapshot)
+    return snapshot.to_response()
+
+
 @router.get("/current")
 @customer_required
 @store_required
-async def get_current_cart(request: Request):
+async def get_current_cart(request: Request, response: Response):
     """
     Retorna os itens do carrinho atual do cliente autenticado.
+
+    Servido do cache quando quente. Responde 304 se o If-None-Match do cliente
+    ainda corresponde à versão atual do carrinho.
     """
-    return await get_cart_items(request.current_store.id, request.current_user.id)
+    cart = await read_cart(request)
+    headers = {'ETag': cart.etag, 'Cache-Control': 'private, no-cache'}
+    if request.headers.get('If-None-Match') == cart.etag:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return cart.to_response()
 
 
 @router.post("/")
@@ -32,6 +97,7 @@ async def store(request: Request, body: CartItemSchema):
     if product.status == 'inactive':
         raise HTTPException(status_code=404, detail="Product inactive")
 
+    created = False
     cart = await Cart.filter(store_id=request.current_store.id, customer_id=request.current_user.id, status='active').first()
     if not cart:
         cart = await Cart.create(
@@ -39,16 +105,28 @@ async def store(request: Request, body: CartItemSchema):
             customer_id=request.current_user.id,
             status='active',
         )
+        created = True
     
-    response = await CartItem.create(
-        cart_id=cart.id,
-        product_id=body.product_id,
-        amount=body.amount,
-        price=body.price,
-        attributes=body.attributes
-    )
+    async with in_transaction() as connection:
+        in_sequence = await bump_version(cart, connection)
+        amount = await upsert_cart_item(cart.id, product.id, body.amount, body.price, body.attributes,
+                                        connection=connection)
+
+    def add_item(items: List[dict]):
+        key = attributes_key(body.attributes)
+        for item in items:
+            if item['product_id'] == product.id and attributes_key(item['attributes']) == key:
+                item['amount'] = amount
+                return
+        items.append({
+            'product_id': product.id,
+            'product_name': product.name,
+            'price': body.price,
+            'amount': amount,
+            'attributes': body.attributes,
+        })
 
-    return await get_cart_items(request.current_store.id, request.current_user.id)
+    return await write_through(request, cart, add_item, in_sequence, created=created)
 
 @router.put("/update-amount")
 @customer_required
@@ -58,14 +136,20 @@ async def update_amount(request: Request, body: CartItemUpdateSchema):
     if not cart:
         raise HTTPException(status_code=404, detail="Cart not found")
     
-    cart_item = await CartItem.filter(cart=cart.id, product=body.product_id).first()
+    cart_item = await CartItem.filter(cart=cart.id, product=body.product_id).order_by('id').first()
     if not cart_item:
         raise HTTPException(status_code=404, detail="Cart item not found")
     
     cart_item.amount = body.amount if body.amount > 0 else 1
-    await cart_item.save()
+    async with in_transaction() as connection:
+        in_sequence = await bump_version(cart, connection)
+        await cart_item.save(using_db=connection)
 
-    return await get_cart_items(request.current_store.id, request.current_user.id)
+    def set_amount(items: List[dict]):
+        # Mesmo critério da consulta acima: o primeiro item do produto
+        next(item for item in items if item['product_id'] == body.product_id)['amount'] = cart_item.amount
+
+    return await write_through(request, cart, set_amount, in_sequence)
 
 @router.delete("/{product_id}")
 @customer_required
@@ -75,12 +159,72 @@ async def delete_item(request: Request, product_id: int):
     if not cart:
         raise HTTPException(status_code=404, detail="Cart not found")
     
-    cart_item = await CartItem.filter(cart=cart.id, product=product_id).first()
+    cart_item = await CartItem.filter(cart=cart.id, product=product_id).order_by('id').first()
     if not cart_item:
         raise HTTPException(status_code=404, detail="Cart item not found")
-    await cart_item.delete()
+    async with in_transaction() as connection:
+        in_sequence = await bump_version(cart, connection)
+        await cart_item.delete(using_db=connection)
+        emptied = not await CartItem.filter(cart=cart.id).using_db(connection).exists()
+        if emptied:
+            await cart.delete(using_db=connection)
 
-    if not await CartItem.filter(cart=cart.id).all():
-        await cart.delete()
-    
-    return await get_cart_items(request.current_store.id, request.current_user.id)
\ No newline at end of file
+    if emptied:
+        await cart_cache.publish(cart_key(request), CartSnapshot())
+        return CartSnapshot().to_response()
+
+    def remove_item(items: List[dict]):
+        items.remove(next(item for item in items if item['product_id'] == product_id))
+
+    return await write_through(request, cart, remove_item, in_sequence)
+
+@router.post("/batch")
+@customer_required
+@store_required
+async def batch(request: Request, body: CartBatchSchema):
+    """
+    Aplica várias operações (add/update/remove) no carrinho numa única
+    transação, na ordem recebida. Se alguma falhar, nenhuma é aplicada.
+
+    Os produtos adicionados são validados numa única consulta e o carrinho é
+    relido uma só vez no final.
+    """
+    add_ids = {operation.product_id for operation in body.operations if operation.op == 'add'}
+    products = {product.id: product for product in await Product.filter(id__in=add_ids)} if add_ids else {}
+    for product_id in add_ids:
+        if product_id not in products:
+            raise HTTPException(status_code=404, detail="Product not found")
+        if products[product_id].status == 'inactive':
+            raise HTTPException(status_code=404, detail="Product inactive")
+
+    key = cart_key(request)
+    async with in_transaction() as connection:
+        cart = await Cart.filter(store_id=key[0], customer_id=key[1], status='active').using_db(connection).first()
+        if not cart:
+            if not add_ids:
+                raise HTTPException(status_code=404, detail="Cart not found")
+            cart = await Cart.create(store_id=key[0], customer_id=key[1], status='active', using_db=connection)
+        await bump_version(cart, connection)
+
+        for operation in body.operations:
+            if operation.op == 'add':
+                await upsert_cart_item(cart.id, operation.product_id, operation.amount, operation.price,
+                                       operation.attributes, connection=connection)
+                continue
+
+            cart_item = await CartItem.filter(cart=cart.id, product=operation.product_id) \
+                .using_db(connection).order_by('id').first()
+            if not cart_item:
+                raise HTTPException(status_code=404, detail="Cart item not found")
+            if operation.op == 'update':
+                cart_item.amount = operation.amount if operation.amount > 0 else 1
+                await cart_item.save(using_db=connection)
+            else:
+                await cart_item.delete(using_db=connection)
+
+        if not await CartItem.filter(cart=cart.id).using_db(connection).exists():
+            await cart.delete(using_db=connection)
+
+    snapshot = await load_cart_snapshot(*key)
+    await cart_cache.publish(key, snapshot)
+    return snapshot.to_response()
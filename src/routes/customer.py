@@ -3,6 +3,7 @@ from tortoise.exceptions import IntegrityError
 from src.models import Customer, CustomerAuth
 from src.dtos.customer import CustomerSchema, CustomerAuthSchema
 from src.utils import generate_credentials, authenticate_user
+from src.passwords import password_hasher
 from src.authentication import store_required
 
 router = APIRouter(
@@ -22,7 +23,7 @@ async def store(request: Request, body: CustomerSchema):
         store_id=request.current_store.id,
         name=body.name,
         email=body.email,
-        password=body.password,
+        password=await password_hasher.hash(body.password),
     )
     response = await generate_credentials(customer, 'customer')
     return response
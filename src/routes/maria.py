@@ -1,8 +1,14 @@
-from fastapi import APIRouter, Request
-from src.authentication import store_required
-from src.integrations.maria_api.maria import MariaApi
-from src.constants import PLATFORM_COMMISSION_PERCENTAGE
-from decimal import Decimal
+import logging
+import os
+from datetime import date, timedelta
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from src.authentication import store_required, seller_required
+from src.integrations.maria_api.maria import get_maria_client
+from src.integrations.maria_api.resilience import maria_error_status
+from src.pricing import CommissionPricer
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/maria",
@@ -10,19 +16,44 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Modo rápido: listagens validadas uma vez (no cache), preços ajustados numa
+# cópia rasa e bytes gerados direto pelo orjson, sem model_dump/jsonable_encoder
+FAST_SERIALIZATION = os.getenv('MARIA_FAST_SERIALIZATION', 'true').lower() in ('1', 'true', 'yes')
+
+# Maior intervalo aceito pelo calendário de preços (dias)
+CALENDAR_MAX_DAYS = int(os.getenv('MARIA_CALENDAR_MAX_DAYS', '62'))
+
+
+@router.get("/stats")
+@seller_required
+async def get_stats(request: Request):
+    """
+    Métricas da integração com a Maria API (cache, requisições coalescidas,
+    circuit breakers e sincronização do espelho local do catálogo).
+    """
+    maria_client = get_maria_client(request)
+    return {
+        'cache': maria_client.cache.stats() if maria_client.cache else None,
+        'inflight': maria_client.inflight.stats(),
+        'resilience': maria_client.resilience_stats(),
+        'mirror': maria_client.mirror.stats() if maria_client.mirror else None,
+        'catalog_sync': request.app.state.catalog_sync.stats(),
+    }
 
 @router.get("/parks")
 @store_required
-async def get_parks(request: Request):
-    maria_client = MariaApi()
-    parks = maria_client.get_parks()
+async def get_parks(request: Request, language: str = None):
+    maria_client = get_maria_client(request)
+    if FAST_SERIALIZATION:
+        return ORJSONResponse(await maria_client.get_parks_payload(language=language))
+    parks = await maria_client.get_parks(language=language)
     return [park.model_dump(by_alias=False) for park in parks]
 
 @router.get("/parks/{park_code}")
 @store_required
-async def get_park(request: Request, park_code: str):
-    maria_client = MariaApi()
-    park = maria_client.get_park(park_code)
+async def get_park(request: Request, park_code: str, language: str = None):
+    maria_client = get_maria_client(request)
+    park = await maria_client.get_park(park_code, language=language)
     return park.model_dump(by_alias=False)
 
 @router.get("/parks/{park_code}/products")
@@ -34,74 +65,100 @@ async def get_park_products(
     numberDays: int = None,
     numAdults: int = None,
     numChildren: int = None,
-    isSpecial: bool = None
+    isSpecial: bool = None,
+    language: str = None
 ):
-    maria_client = MariaApi()
-    products = maria_client.get_park_products(
+    maria_client = get_maria_client(request)
+    # Aplicar comissões (plataforma + seller) em todos os preços, em lote
+    pricer = CommissionPricer.for_store(request.current_store)
+
+    if FAST_SERIALIZATION:
+        products = await maria_client.get_park_products_payload(
+            park_code=park_code,
+            for_date=forDate,
+            number_days=numberDays,
+            num_adults=numAdults,
+            num_children=numChildren,
+            is_special=isSpecial,
+            language=language
+        )
+        return ORJSONResponse(pricer.reprice_products(products, copy=True))
+
+    products = await maria_client.get_park_products(
         park_code=park_code,
         for_date=forDate,
         number_days=numberDays,
         num_adults=numAdults,
         num_children=numChildren,
-        is_special=isSpecial
+        is_special=isSpecial,
+        language=language
     )
-    store = request.current_store
-    
-    # Aplicar comissões nos preços
-    products_with_commission = []
-    for product in products:
-        product_dict = product.model_dump(by_alias=False)
-        
-        # Aplicar comissões em todos os preços (adult, child, total)
-        if product_dict.get('prices'):
-            seller_commission = Decimal(str(store.commission_percentage))
-            
-            # Processar cada tipo de preço
-            for price_type in ['adult', 'child', 'total']:
-                if price_type in product_dict['prices'] and product_dict['prices'][price_type].get('usdbrl'):
-                    base_price = Decimal(str(product_dict['prices'][price_type]['usdbrl']['amount']))
-                    
-                    # Aplicar comissão da plataforma (5%)
-                    price_with_platform = base_price * (1 + PLATFORM_COMMISSION_PERCENTAGE / 100)
-                    
-                    # Aplicar comissão do seller
-                    final_price = price_with_platform * (1 + seller_commission / 100)
-                    
-                    # Atualizar preço
-                    product_dict['prices'][price_type]['usdbrl']['amount'] = str(final_price.quantize(Decimal('0.01')))
-            
-            # Adicionar metadados de comissão (apenas uma vez por produto)
-            product_dict['platform_commission'] = str(PLATFORM_COMMISSION_PERCENTAGE)
-            product_dict['seller_commission'] = str(seller_commission)
-        
-        products_with_commission.append(product_dict)
-    
-    return products_with_commission
+    return pricer.reprice_products([product.model_dump(by_alias=False) for product in products])
+
+@router.get("/parks/{park_code}/calendar")
+@store_required
+async def get_park_price_calendar(
+    request: Request,
+    park_code: str,
+    startDate: date,
+    endDate: date,
+    numberDays: int = None,
+    numAdults: int = None,
+    numChildren: int = None,
+    language: str = None
+):
+    """
+    Preços de todos os produtos do parque para cada data do intervalo
+    (inclusive), numa matriz produto × data, com comissões aplicadas.
+
+    As datas são buscadas em paralelo (limite MARIA_CALENDAR_CONCURRENCY) e
+    cacheadas individualmente. Datas que falharem aparecem em `errors` com o
+    status correspondente; se todas falharem, responde 503 (Maria API fora do
+    ar ou lenta) ou 502, e os erros vão para o log.
+    """
+    if endDate < startDate:
+        raise HTTPException(status_code=400, detail="endDate must be on or after startDate")
+    days = (endDate - startDate).days + 1
+    if days > CALENDAR_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"Date range must be at most {CALENDAR_MAX_DAYS} days")
+
+    dates = [(startDate + timedelta(days=offset)).isoformat() for offset in range(days)]
+    maria_client = get_maria_client(request)
+    results = await maria_client.get_park_products_calendar(
+        park_code,
+        dates,
+        number_days=numberDays,
+        num_adults=numAdults,
+        num_children=numChildren,
+        language=language,
+    )
+
+    listings = {}
+    errors = {}
+    for day, result in results.items():
+        if isinstance(result, Exception):
+            errors[day] = maria_error_status(result)
+        else:
+            listings[day] = result
+    if not listings:
+        for day, error in results.items():
+            logger.warning("Maria API calendar %s %s failed: %r", park_code, day, error)
+        statuses = set(errors.values())
+        if statuses == {404}:
+            raise HTTPException(status_code=404, detail="Not found in Maria API")
+        raise HTTPException(status_code=503 if statuses & {503, 504} else 502, detail="Maria API unavailable")
+
+    pricer = CommissionPricer.for_store(request.current_store)
+    calendar = pricer.price_calendar(dates, listings)
+    calendar['park_code'] = park_code
+    calendar['errors'] = errors
+    return ORJSONResponse(calendar)
 
 @router.get("/parks/{park_code}/products/{product_code}")
 @store_required
-async def get_park_product_detail(request: Request, park_code: str, product_code: str):
-    maria_client = MariaApi()
-    product = maria_client.get_park_product_detail(park_code, product_code)
-    store = request.current_store
-    
-    product_dict = product.model_dump(by_alias=False)
-    
+async def get_park_product_detail(request: Request, park_code: str, product_code: str, language: str = None):
+    maria_client = get_maria_client(request)
+    product = await maria_client.get_park_product_detail(park_code, product_code, language=language)
     # Aplicar comissões no preço
-    if product_dict.get('starting_price') and product_dict['starting_price'].get('usdbrl'):
-        base_price = Decimal(str(product_dict['starting_price']['usdbrl']['amount']))
-        
-        # Aplicar comissão da plataforma (5%)
-        price_with_platform = base_price * (1 + PLATFORM_COMMISSION_PERCENTAGE / 100)
-        
-        # Aplicar comissão do seller
-        seller_commission = Decimal(str(store.commission_percentage))
-        final_price = price_with_platform * (1 + seller_commission / 100)
-        
-        # Atualizar preço no produto
-        product_dict['starting_price']['usdbrl']['amount'] = str(final_price.quantize(Decimal('0.01')))
-        product_dict['original_price'] = str(base_price)
-        product_dict['platform_commission'] = str(PLATFORM_COMMISSION_PERCENTAGE)
-        product_dict['seller_commission'] = str(seller_commission)
-    
-    return product_dict
+    pricer = CommissionPricer.for_store(request.current_store)
+    return pricer.reprice_detail(product.model_dump(by_alias=False))
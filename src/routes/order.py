@@ -2,9 +2,13 @@ import uuid
 from fastapi import APIRouter, Request, HTTPException
 from src.models import Order, OrderItem, Cart, CartItem, Product
 from src.authentication import customer_required, store_required
-from src.utils import get_order_details, get_cart_items
+from src.cart_cache import CartSnapshot, cart_cache
+from src.idempotency import idempotent
+from src.utils import load_cart_snapshot, order_totals
 from src.dtos.order import OrderCreate
+from tortoise import timezone
 from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
 
 router = APIRouter(
     prefix="/orders",
@@ -17,43 +21,83 @@ router = APIRouter(
 @router.post("/")
 @customer_required
 @store_required
+@idempotent("orders.create")
 async def store(request: Request, body: OrderCreate):
-    cart = await get_cart_items(request.current_store.id, request.current_user.id)
-    if cart["cart_empty"]:
+    """
+    Converte o carrinho ativo em pedido e fecha o carrinho na mesma transação:
+    a próxima adição começa um carrinho novo.
+
+    Aceita o header Idempotency-Key: repetições recebem o pedido já criado.
+
+    Os produtos são validados numa única consulta, os itens gravados num único
+    bulk insert e a resposta é montada com os dados já em memória.
+    """
+    key = (request.current_store.id, request.current_user.id)
+    # O snapshot em cache serve (o fechamento abaixo confere a versão), mas um
+    # vazio pode estar desatualizado: antes do 404, confere no banco
+    snapshot = cart_cache.get(key)
+    if snapshot is None or not snapshot.items:
+        snapshot = await load_cart_snapshot(*key)
+    if not snapshot.items:
         raise HTTPException(status_code=404, detail="Cart empty")
-    
-    for item in cart["items"]:
-        if not await Product.filter(store_id=request.current_store.id, id=item["product_id"], status='active').first():
-            raise HTTPException(status_code=404, detail=f"Product {item['product_name']} not found")
 
-    order = await Order.create(
-        status='created', 
+    active_ids = set(await Product.filter(
         store_id=request.current_store.id,
-        customer_id=request.current_user.id, 
-        code=str(uuid.uuid4().hex)[:250],
-        # Customer details
-        customer_name=body.customer_name,
-        customer_email=body.customer_email,
-        customer_document=body.customer_document,
-        customer_phone=body.customer_phone,
-        # Address
-        address_street=body.address_street,
-        address_number=body.address_number,
-        address_city=body.address_city,
-        address_state=body.address_state,
-        address_zip=body.address_zip
-    )
+        id__in={item["product_id"] for item in snapshot.items},
+        status='active',
+    ).values_list('id', flat=True))
+    for item in snapshot.items:
+        if item["product_id"] not in active_ids:
+            raise HTTPException(status_code=404, detail=f"Product {item['product_name']} not found")
 
-    for item in cart["items"]:
-        await OrderItem.create(
-            order_id=order.id, 
-            product_id=item["product_id"], 
-            amount=item["amount"], 
-            price=item["price"],
-            attributes=item.get("attributes", {})
+    async with in_transaction() as connection:
+        # Só fecha o carrinho na versão lida acima: se ele mudou (ou outro
+        # checkout já o fechou), nada é gravado
+        closed = await Cart.filter(id=snapshot.cart_id, version=snapshot.version, status='active') \
+            .using_db(connection).update(status='closed', updated_at=timezone.now())
+        if not closed:
+            await cart_cache.publish(key, None)
+            raise HTTPException(status_code=409, detail="Cart changed, try again")
+        order = await Order.create(
+            using_db=connection,
+            status='created', 
+            store_id=request.current_store.id,
+            customer_id=request.current_user.id, 
+            code=str(uuid.uuid4().hex)[:250],
+            # Customer details
+            customer_name=body.customer_name,
+            customer_email=body.customer_email,
+            customer_document=body.customer_document,
+            customer_phone=body.customer_phone,
+            # Address
+            address_street=body.address_street,
+            address_number=body.address_number,
+            address_city=body.address_city,
+            address_state=body.address_state,
+            address_zip=body.address_zip,
+            **order_totals(snapshot.items)
         )
 
-    return await get_order_details(order.id)
+        await OrderItem.bulk_create([
+            OrderItem(
+                order_id=order.id, 
+                product_id=item["product_id"], 
+                amount=item["amount"], 
+                price=item["price"],
+                attributes=item.get("attributes", {})
+            )
+            for item in snapshot.items
+        ], using_db=connection)
+
+    await cart_cache.publish(key, CartSnapshot())
+    # Mesmo formato de get_order_details, sem reler o pedido
+    return {
+        'status': order.status,
+        'code': order.code,
+        'items': snapshot.items,
+        'total_price': order.total_cents,
+        'created_at': order.created_at.isoformat(),
+    }
 
 
 @router.get("/{code}")
@@ -95,9 +139,10 @@ async def get_order_by_code(code: str):
 
 
 @router.post("/{code}/pay")
-async def simulate_payment(code: str):
+@idempotent("orders.pay")
+async def simulate_payment(request: Request, code: str):
     """
-    Simulate payment for an order
+    Simulate payment for an order (accepts an Idempotency-Key header)
     """
     order = await Order.filter(code=code).first()
     
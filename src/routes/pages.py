@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Request
 from fastapi.templating import Jinja2Templates
-from src.integrations.maria_api.maria import MariaApi
+from src.integrations.maria_api.maria import get_maria_client
 
 templates = Jinja2Templates(directory="templates")
 
@@ -16,8 +16,8 @@ async def index(request: Request):
 
 @router.get("/parks/{park_code}")
 async def park(request: Request, park_code: str):
-    maria_client = MariaApi()
-    park = maria_client.get_park(park_code)
+    maria_client = get_maria_client(request)
+    park = await maria_client.get_park(park_code)
     return templates.TemplateResponse("pages/park.html", {"request": request, "park": park})
 
 @router.get("/checkout")
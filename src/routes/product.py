@@ -1,9 +1,16 @@
+import asyncio
+import os
+from typing import Dict, List, Tuple
 from fastapi import APIRouter, Request, HTTPException, Query
+from tortoise.exceptions import IntegrityError
 from src.models import Product
 from src.authentication import store_required
-from src.integrations.maria_api.maria import MariaApi
-from src.constants import PLATFORM_COMMISSION_PERCENTAGE
-from decimal import Decimal
+from src.dtos.product import ExternalProductBatchSchema
+from src.integrations.maria_api.maria import MariaApi, get_maria_client
+from src.integrations.maria_api.dto import ParkProductDetail
+from src.integrations.maria_api.resilience import maria_error_status
+from src.pricing import CommissionPricer
+from src.singleflight import SingleFlight
 import re
 
 router = APIRouter(
@@ -12,81 +19,57 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Detalhes buscados em paralelo na Maria API por requisição em lote
+BATCH_CONCURRENCY = int(os.getenv('PRODUCT_BATCH_CONCURRENCY', '8'))
 
-@router.get("/by-external-code")
-@store_required
-async def get_or_create_product_by_external_code(
-    request: Request,
-    product_code: str = Query(..., min_length=1, max_length=100),
-    park_code: str = Query(..., min_length=1, max_length=50),
-):
+# Criações simultâneas do mesmo produto (mesma loja e código) compartilham uma
+# única validação na Maria API e um único insert
+product_creation = SingleFlight()
+
+
+def sanitize_code(value: str) -> str:
+    # Sanitização básica: remove caracteres perigosos
+    return re.sub(r'[^\w\-]', '', value.strip())
+
+
+async def fetch_product_detail(maria_client: MariaApi, park_code: str, product_code: str) -> ParkProductDetail:
     """
-    Busca um produto pelo código externo (Maria API).
-    Se não existir, cria após validar na Maria API.
-    Retorna apenas o ID interno do produto.
-    
-    Proteções de segurança:
-    - Valida que product_code e park_code não estão vazios
-    - Verifica se produto existe na Maria API antes de criar
-    - Sanitiza dados da API externa
-    - Vincula produto ao store da requisição (isolamento multi-tenant)
-    - Valida preço
+    Busca o produto na Maria API para validar. 404 só quando a Maria API diz
+    que o produto não existe; indisponibilidade (circuito aberto, timeout, 5xx)
+    vira 503/504 para o cliente tentar de novo.
     """
-    
-    # Sanitização básica: remove caracteres perigosos
-    product_code = re.sub(r'[^\w\-]', '', product_code.strip())
-    park_code = re.sub(r'[^\w\-]', '', park_code.strip())
-    
-    if not product_code or not park_code:
-        raise HTTPException(status_code=400, detail="Invalid product_code or park_code")
-    
-    # Busca produto existente no banco (vinculado ao store)
-    existing_product = await Product.filter(
-        product_code=product_code,
-        park_code=park_code,
-        store_id=request.current_store.id
-    ).first()
-    
-    if existing_product:
-        return {"product_id": existing_product.id}
-    
-    # Produto não existe, buscar na Maria API para validar
     try:
-        maria_client = MariaApi()
-        product_detail = maria_client.get_park_product_detail(park_code, product_code)
+        return await maria_client.get_park_product_detail(park_code, product_code)
     except Exception as e:
-        raise HTTPException(
-            status_code=404, 
-            detail=f"Product not found in Maria API or API error: {str(e)}"
-        )
-    
+        status_code = maria_error_status(e)
+        if status_code == 404:
+            raise HTTPException(status_code=404, detail="Product not found in Maria API")
+        raise HTTPException(status_code=status_code, detail=f"Maria API unavailable: {str(e)}")
+
+
+def build_product(store, park_code: str, product_code: str,
+                product_detail: ParkProductDetail, pricer: CommissionPricer) -> Product:
+    """
+    Monta (sem salvar) o Product a partir do detalhe da Maria API, validando
+    e sanitizando os dados externos.
+    """
     # Validar dados do produto
     if not product_detail.ticket_name:
         raise HTTPException(status_code=400, detail="Invalid product: missing ticket_name")
-    
+
     # Extrair e validar preço (converter de string para centavos)
     try:
-        price_str = product_detail.starting_price.usdbrl.amount
-        base_price = Decimal(str(price_str))
-        
-        if base_price <= 0:
+        # Aplicar comissões (plataforma + seller) e converter para centavos
+        price_cents = pricer.amount_to_cents(product_detail.starting_price.usdbrl.amount)
+
+        if price_cents <= 0:
             raise HTTPException(status_code=400, detail="Invalid product: price must be greater than 0")
-        
-        # Aplicar comissão da plataforma (5%)
-        price_with_platform = base_price * (1 + PLATFORM_COMMISSION_PERCENTAGE / 100)
-        
-        # Aplicar comissão do seller
-        seller_commission = Decimal(str(request.current_store.commission_percentage))
-        final_price = price_with_platform * (1 + seller_commission / 100)
-        
-        # Converter para centavos (arredondando)
-        price_cents = int(final_price * 100)
     except (ValueError, AttributeError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid product: invalid price format - {str(e)}")
-    
+
     # Sanitizar nome (truncar e escapar)
     name = product_detail.ticket_name[:255].strip()
-    
+
     # Montar descrição a partir dos dados disponíveis
     description_parts = []
     if product_detail.park_included:
@@ -95,26 +78,190 @@ async def get_or_create_product_by_external_code(
         description_parts.append(product_detail.extensions.about_ticket[:500])
     elif product_detail.extensions.ticket_type:
         description_parts.append(f"Tipo: {product_detail.extensions.ticket_type}")
-    
+
     description = "\n".join(description_parts) if description_parts else name
     description = description[:1000].strip()  # Limitar tamanho
-    
-    # Criar produto no banco (vinculado ao store da requisição)
+
+    # Vinculado ao store da requisição
+    return Product(
+        store_id=store.id,
+        product_code=product_code,
+        park_code=park_code,
+        name=name,
+        description=description,
+        price=price_cents,
+        status='active'
+    )
+
+
+async def find_product_id(store_id: int, park_code: str, product_code: str):
+    return await Product.filter(
+        product_code=product_code,
+        park_code=park_code,
+        store_id=store_id
+    ).first().values_list('id', flat=True)
+
+
+async def create_product(request: Request, park_code: str, product_code: str) -> int:
+    store = request.current_store
+    # Outra requisição pode ter criado enquanto esta aguardava
+    existing_product_id = await find_product_id(store.id, park_code, product_code)
+    if existing_product_id:
+        return existing_product_id
+
+    product_detail = await fetch_product_detail(get_maria_client(request), park_code, product_code)
+    pricer = CommissionPricer.for_store(store)
+    new_product = build_product(store, park_code, product_code, product_detail, pricer)
+
+    # Criar produto no banco
     try:
-        new_product = await Product.create(
-            store_id=request.current_store.id,
-            product_code=product_code,
-            park_code=park_code,
-            name=name,
-            description=description,
-            price=price_cents,
-            status='active'
-        )
+        await new_product.save()
+    except IntegrityError:
+        # Criado em paralelo por outro processo: o índice único garante um só
+        existing_product_id = await find_product_id(store.id, park_code, product_code)
+        if existing_product_id:
+            return existing_product_id
+        raise HTTPException(status_code=500, detail="Error creating product")
     except Exception as e:
         raise HTTPException(
-            status_code=500, 
+            status_code=500,
             detail=f"Error creating product: {str(e)}"
         )
-    
-    return {"product_id": new_product.id}
 
+    return new_product.id
+
+
+@router.get("/by-external-code")
+@store_required
+async def get_or_create_product_by_external_code(
+    request: Request,
+    product_code: str = Query(..., min_length=1, max_length=100),
+    park_code: str = Query(..., min_length=1, max_length=50),
+):
+    """
+    Busca um produto pelo código externo (Maria API).
+    Se não existir, cria após validar na Maria API.
+    Retorna apenas o ID interno do produto.
+
+    Proteções de segurança:
+    - Valida que product_code e park_code não estão vazios
+    - Verifica se produto existe na Maria API antes de criar
+    - Sanitiza dados da API externa
+    - Vincula produto ao store da requisição (isolamento multi-tenant)
+    - Valida preço
+    """
+
+    product_code = sanitize_code(product_code)
+    park_code = sanitize_code(park_code)
+
+    if not product_code or not park_code:
+        raise HTTPException(status_code=400, detail="Invalid product_code or park_code")
+
+    # Busca produto existente no banco (vinculado ao store)
+    existing_product_id = await find_product_id(request.current_store.id, park_code, product_code)
+    if existing_product_id:
+        return {"product_id": existing_product_id}
+
+    # Produto não existe, buscar na Maria API para validar e criar
+    product_id = await product_creation.do(
+        (request.current_store.id, park_code, product_code),
+        lambda: create_product(request, park_code, product_code),
+    )
+    return {"product_id": product_id}
+
+
+def external_key(park_code: str, product_code: str) -> str:
+    return f"{park_code}/{product_code}"
+
+
+async def find_products(store_id: int, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+    """
+    IDs dos produtos já cadastrados para os pares (park_code, product_code),
+    numa única consulta com IN.
+    """
+    if not pairs:
+        return {}
+    rows = await Product.filter(
+        store_id=store_id,
+        product_code__in={product_code for _, product_code in pairs},
+        park_code__in={park_code for park_code, _ in pairs},
+    ).order_by('id').values_list('id', 'park_code', 'product_code')
+    wanted = set(pairs)
+    found = {}
+    for product_id, park_code, product_code in rows:
+        key = (park_code, product_code)
+        if key in wanted and key not in found:
+            found[key] = product_id
+    return found
+
+
+@router.post("/by-external-code/batch")
+@store_required
+async def get_or_create_products_by_external_code(request: Request, body: ExternalProductBatchSchema):
+    """
+    Versão em lote de /by-external-code para montar um carrinho com vários
+    ingressos de uma vez:
+
+    - todos os produtos já cadastrados são resolvidos numa única consulta (IN)
+    - os que faltam são validados na Maria API em paralelo
+    - os novos são inseridos com um único bulk insert
+
+    Retorna {"product_ids": {"park_code/product_code": id}, "errors": {...}};
+    um par inválido ou indisponível não impede a criação dos demais.
+    """
+    store = request.current_store
+    errors = {}
+    pairs = []
+    for ref in body.products:
+        park_code = sanitize_code(ref.park_code)
+        product_code = sanitize_code(ref.product_code)
+        if not product_code or not park_code:
+            errors[external_key(ref.park_code, ref.product_code)] = {
+                "status_code": 400, "detail": "Invalid product_code or park_code",
+            }
+            continue
+        if (park_code, product_code) not in pairs:
+            pairs.append((park_code, product_code))
+
+    found = await find_products(store.id, pairs)
+    missing = [pair for pair in pairs if pair not in found]
+
+    if missing:
+        maria_client = get_maria_client(request)
+        pricer = CommissionPricer.for_store(store)
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def resolve(park_code: str, product_code: str) -> Product:
+            async with semaphore:
+                product_detail = await fetch_product_detail(maria_client, park_code, product_code)
+            return build_product(store, park_code, product_code, product_detail, pricer)
+
+        results = await asyncio.gather(*[resolve(*pair) for pair in missing], return_exceptions=True)
+        new_products = []
+        for pair, result in zip(missing, results):
+            if isinstance(result, HTTPException):
+                errors[external_key(*pair)] = {"status_code": result.status_code, "detail": result.detail}
+            elif isinstance(result, Exception):
+                raise result
+            else:
+                new_products.append(result)
+
+        if new_products:
+            try:
+                # Conflitos no índice único (criados em paralelo) são ignorados
+                # e resolvidos pela releitura abaixo
+                await Product.bulk_create(new_products, ignore_conflicts=True)
+            except Exception as e:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Error creating products: {str(e)}"
+                )
+            # bulk_create não devolve os IDs em todos os bancos: relê com IN
+            found.update(await find_products(store.id, [
+                (product.park_code, product.product_code) for product in new_products
+            ]))
+
+    return {
+        "product_ids": {external_key(*pair): found[pair] for pair in pairs if pair in found},
+        "errors": errors,
+    }
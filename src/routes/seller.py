@@ -3,6 +3,7 @@ from tortoise.exceptions import IntegrityError
 from src.models import Seller, Store
 from src.dtos.seller import SellerSchema, SellerAuthSchema
 from src.utils import generate_credentials, authenticate_user
+from src.passwords import password_hasher
 from src.authentication import seller_required, store_required
 
 router = APIRouter(
@@ -18,7 +19,7 @@ async def store(body: SellerSchema):
         seller = await Seller.create(
             name=body.name,
             email=body.email,
-            password=body.password,
+            password=await password_hasher.hash(body.password),
         )
         response = await generate_credentials(seller, 'seller')
         return response
@@ -4,6 +4,7 @@ Cria dados iniciais se não existirem.
 """
 import uuid
 from src.models import Seller, SellerAuth, Store, Customer, CustomerAuth
+from src.passwords import password_hasher
 from tortoise.exceptions import DoesNotExist
 
 
@@ -22,7 +23,7 @@ async def seed_database():
         admin_seller = await Seller.create(
             name="Admin",
             email=admin_email,
-            password=admin_password,
+            password=await password_hasher.hash(admin_password),
         )
         print(f"✓ Seller admin criado (ID: {admin_seller.id})")
         print(f"  Email: {admin_email}")
@@ -72,7 +73,7 @@ async def seed_database():
             store=store,
             name="Test Customer",
             email=customer_email,
-            password=customer_password,
+            password=await password_hasher.hash(customer_password),
         )
         print(f"✓ Customer de teste criado (ID: {test_customer.id})")
         print(f"  Email: {customer_email}")
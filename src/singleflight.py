@@ -0,0 +1,47 @@
+"""
+Coalescência de chamadas concorrentes idênticas (single-flight).
+
+Enquanto uma chamada para uma chave está em andamento, novas chamadas com a
+mesma chave aguardam o mesmo resultado em vez de executar de novo. Erros são
+propagados para todos que estavam aguardando e nunca ficam guardados: a
+próxima chamada após a conclusão executa novamente.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.executions = 0
+        self.shared = 0
+
+    def __len__(self):
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            self.executions += 1
+            # Executa como task para que o cancelamento de quem chamou primeiro
+            # não cancele a chamada compartilhada pelos demais
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Evita "Task exception was never retrieved" se todos desistiram
+            task.exception()
+
+    def stats(self) -> dict:
+        return {
+            'in_flight': len(self._calls),
+            'executions': self.executions,
+            'shared': self.shared,
+        }
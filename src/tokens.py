@@ -0,0 +1,93 @@
+"""
+Access tokens assinados (HMAC-SHA256), verificados sem consultar o banco.
+
+Formato: "v1.<payload>.<assinatura>", ambos em base64url sem padding. O payload
+carrega o id do usuário (sub), o papel (role), a loja (sid), a expiração (exp,
+epoch em segundos) e a época de revogação do usuário (ep). Um novo login
+incrementa a época (Customer/Seller.token_epoch), revogando os tokens anteriores.
+
+Emissão controlada por AUTH_TOKEN_MODE:
+- db (padrão): UUID aleatório guardado em CustomerAuth/SellerAuth
+- signed: token assinado com AUTH_TOKEN_SECRET, sem gravar nada em *Auth
+
+Tokens assinados são aceitos sempre que houver AUTH_TOKEN_SECRET, então dá para
+alternar o modo sem derrubar as sessões já emitidas.
+"""
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+from typing import Optional
+
+AUTH_TOKEN_MODE = os.getenv('AUTH_TOKEN_MODE', 'db').lower()
+AUTH_TOKEN_SECRET = os.getenv('AUTH_TOKEN_SECRET', '')
+# Validade dos tokens emitidos (segundos)
+AUTH_TOKEN_EXPIRATION = int(os.getenv('AUTH_TOKEN_EXPIRATION', str(7 * 24 * 3600)))
+
+TOKEN_PREFIX = 'v1.'
+
+
+class TokenSigner:
+    def __init__(self, secret: str, expiration: int = AUTH_TOKEN_EXPIRATION):
+        if not secret:
+            raise ValueError('AUTH_TOKEN_SECRET is required for signed tokens')
+        self._key = secret.encode()
+        self.expiration = expiration
+
+    def _sign(self, payload: bytes) -> str:
+        return _encode(hmac.new(self._key, payload, hashlib.sha256).digest())
+
+    def issue(self, role: str, user_id: int, store_id: Optional[int], epoch: int, now: float = None) -> str:
+        claims = {
+            'sub': user_id,
+            'role': role,
+            'sid': store_id,
+            'exp': int((now or time.time()) + self.expiration),
+            'ep': epoch,
+        }
+        payload = _encode(json.dumps(claims, separators=(',', ':')).encode())
+        return f"{TOKEN_PREFIX}{payload}.{self._sign(payload.encode())}"
+
+    def verify(self, token: str, role: str, now: float = None) -> Optional[dict]:
+        """
+        Retorna as claims de um token íntegro, não expirado e do papel
+        esperado; None caso contrário.
+        """
+        if not token.startswith(TOKEN_PREFIX):
+            return None
+        try:
+            payload, signature = token[len(TOKEN_PREFIX):].split('.')
+        except ValueError:
+            return None
+        if not hmac.compare_digest(self._sign(payload.encode()), signature):
+            return None
+        try:
+            claims = json.loads(_decode(payload))
+        except ValueError:
+            return None
+        if claims.get('role') != role or claims.get('exp', 0) <= (now or time.time()):
+            return None
+        return claims
+
+
+def _encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode()
+
+
+def _decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + '=' * (-len(value) % 4))
+
+
+def is_signed_token(token: str) -> bool:
+    return token.startswith(TOKEN_PREFIX)
+
+
+def create_signer() -> Optional[TokenSigner]:
+    if AUTH_TOKEN_MODE == 'signed' or AUTH_TOKEN_SECRET:
+        return TokenSigner(AUTH_TOKEN_SECRET)
+    return None
+
+
+token_signer = create_signer()
@@ -1,68 +1,188 @@
+import hashlib
+import json
 import uuid
-from src.models import CustomerAuth, SellerAuth, Customer, Seller, Cart, CartItem, Order, OrderItem
+from tortoise import Tortoise, timezone
+from tortoise.expressions import F
+from src.models import CustomerAuth, SellerAuth, Customer, Seller, Store, Cart, CartItem, Order, OrderItem
 from src.dtos.customer import CustomerAuthSchema
 from src.dtos.seller import SellerAuthSchema
+from src.auth_cache import access_token_cache
+from src.tokens import AUTH_TOKEN_MODE, token_signer
+from src.passwords import password_hasher
+from src.cart_cache import CartSnapshot
 from fastapi import HTTPException
 
+async def bump_token_epoch(user: Customer | Seller) -> int:
+    """
+    Incrementa a época de revogação do usuário no banco, invalidando os tokens
+    assinados emitidos antes.
+    """
+    user_model = type(user)
+    await user_model.filter(id=user.id).update(token_epoch=F('token_epoch') + 1)
+    user.token_epoch = await user_model.filter(id=user.id).first().values_list('token_epoch', flat=True)
+    return user.token_epoch
+
+
 async def generate_credentials(user: Customer | Seller, model: str):
-    access_token = uuid.uuid4()
-    
     if model == 'customer':
-        await CustomerAuth.filter(customer=user).update(status='invalidated')
-        customer_auth = await CustomerAuth.create(customer=user, access_token=access_token)
+        # Só o token vigente; os antigos já foram invalidados ou removidos
+        await CustomerAuth.filter(customer=user, status='valid').update(status='invalidated')
+        epoch = await bump_token_epoch(user)
+        await access_token_cache.invalidate_user('customer', user.id)
+        if AUTH_TOKEN_MODE == 'signed':
+            access_token = token_signer.issue('customer', user.id, user.store_id, epoch)
+        else:
+            access_token = uuid.uuid4()
+            await CustomerAuth.create(customer=user, access_token=access_token)
         return {
             'access_token': access_token,
-            'customer_id': customer_auth.customer.id,
-            'name': customer_auth.customer.name,
+            'customer_id': user.id,
+            'name': user.name,
         }
     elif model == 'seller':
-        await SellerAuth.filter(seller=user).update(status='invalidated')
-        seller_auth = await SellerAuth.create(seller=user, access_token=access_token)
+        # Só o token vigente; os antigos já foram invalidados ou removidos
+        await SellerAuth.filter(seller=user, status='valid').update(status='invalidated')
+        epoch = await bump_token_epoch(user)
+        await access_token_cache.invalidate_user('seller', user.id)
+        if AUTH_TOKEN_MODE == 'signed':
+            store_id = await Store.filter(seller_id=user.id).first().values_list('id', flat=True)
+            access_token = token_signer.issue('seller', user.id, store_id, epoch)
+        else:
+            access_token = uuid.uuid4()
+            await SellerAuth.create(seller=user, access_token=access_token)
         return {
             'access_token': access_token,
-            'seller_id': seller_auth.seller.id,
-            'name': seller_auth.seller.name,
+            'seller_id': user.id,
+            'name': user.name,
         }
     
     raise ValueError('Invalid model')
 
 
+async def check_password(user: Customer | Seller | None, password: str) -> bool:
+    """
+    Verifica a senha no pool de hashing e converte hashes legados (texto puro
+    ou custo antigo) no primeiro login bem-sucedido.
+    """
+    if not await password_hasher.verify(password, user.password if user else None):
+        return False
+    if password_hasher.needs_rehash(user.password):
+        user.password = await password_hasher.hash(password)
+        await type(user).filter(id=user.id).update(password=user.password)
+    return True
+
+
 async def authenticate_user(body: CustomerAuthSchema | SellerAuthSchema, model: str, store_id: int = None):
     if model == 'customer':
-        customer = await Customer.filter(store_id=store_id, email=body.email, password=body.password).first()
-        if not customer:
+        customer = await Customer.filter(store_id=store_id, email=body.email).first()
+        if not await check_password(customer, body.password):
             raise HTTPException(status_code=401, detail="Invalid credentials")
         return await generate_credentials(customer, 'customer')
     elif model == 'seller':
-        seller = await Seller.filter(email=body.email, password=body.password).first()
-        if not seller:
+        seller = await Seller.filter(email=body.email).first()
+        if not await check_password(seller, body.password):
             raise HTTPException(status_code=401, detail="Invalid credentials")
         return await generate_credentials(seller, 'seller')
 
 
-async def get_cart_items(store_id: int, customer_id: int):
-    cart = await Cart.filter(store_id=store_id, customer_id=customer_id, status='active').first()
-    if not cart:
-        return {
-            'cart_empty': True,
-            'items': [],
+CART_ITEM_FIELDS = ('product_id', 'product__name', 'price', 'amount', 'attributes')
+
+
+def attributes_key(attributes: dict) -> str:
+    """
+    Identifica uma combinação de atributos independente da ordem das chaves:
+    {"date": ..., "adults": 2} e {"adults": 2, "date": ...} são a mesma linha.
+    """
+    normalized = json.dumps(attributes or {}, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def placeholders(connection, count: int) -> list:
+    if connection.capabilities.dialect == 'postgres':
+        return [f"${i}" for i in range(1, count + 1)]
+    return ['?'] * count
+
+
+async def upsert_cart_item(cart_id: int, product_id: int, amount: int, price: int, attributes: dict,
+                connection=None) -> int:
+    """
+    Adiciona o produto ao carrinho numa única instrução: se já existe a linha
+    (carrinho, produto, atributos), soma amount atomicamente (o preço da
+    primeira adição é mantido). Retorna o amount resultante.
+
+    Não confere o status do carrinho: chame na transação que já travou o
+    carrinho ativo (ver bump_version em src/routes/cart.py).
+    """
+    connection = connection or Tortoise.get_connection('default')
+    fields_map = CartItem._meta.fields_map
+    values = [
+        cart_id,
+        product_id,
+        amount,
+        price,
+        fields_map['attributes'].to_db_value(attributes, None),
+        attributes_key(attributes),
+        fields_map['created_at'].to_db_value(timezone.now(), None),
+    ]
+    marks = placeholders(connection, len(values))
+    _, rows = await connection.execute_query(
+        'INSERT INTO "cartitem" ("cart_id", "product_id", "amount", "price", "attributes", "attributes_key", "created_at") '
+        f'VALUES ({", ".join(marks)}) '
+        'ON CONFLICT ("cart_id", "product_id", "attributes_key") '
+        'DO UPDATE SET "amount" = "cartitem"."amount" + EXCLUDED."amount" '
+        'RETURNING "amount"',
+        values,
+    )
+    return rows[0]['amount']
+
+
+def serialize_items(rows: list) -> list:
+    return [
+        {
+            'product_id': row['product_id'],
+            'product_name': row['product__name'],
+            'price': row['price'],  # Use stored price
+            'amount': row['amount'],
+            'attributes': row['attributes'],
         }
+        for row in rows
+    ]
 
-    items = []
 
-    for item in await CartItem.filter(cart=cart.id).all():
-        product = await item.product
-        items.append({
-            'product_id': product.id,
-            'product_name': product.name,
-            'price': item.price,  # Use stored price
-            'amount': item.amount,
-            'attributes': item.attributes
-        })
+async def load_cart_snapshot(store_id: int, customer_id: int) -> CartSnapshot:
+    """
+    Itens do carrinho ativo numa única consulta (cartitem + cart + product),
+    só com as colunas da resposta: o custo não cresce com o número de itens.
+    """
+    rows = await CartItem.filter(
+        cart__store_id=store_id,
+        cart__customer_id=customer_id,
+        cart__status='active',
+    ).order_by('id').values('cart_id', 'cart__version', *CART_ITEM_FIELDS)
+
+    # Carrinho sem itens é removido (ver DELETE /carts/{product_id})
+    if not rows:
+        return CartSnapshot()
+    return CartSnapshot(
+        cart_id=rows[0]['cart_id'],
+        version=rows[0]['cart__version'],
+        items=serialize_items(rows),
+    )
+
+
+async def get_cart_items(store_id: int, customer_id: int):
+    return (await load_cart_snapshot(store_id, customer_id)).to_response()
+
 
+def order_totals(items: list) -> dict:
+    """
+    Campos de resumo do pedido (Order.total_cents, item_count e
+    items_summary), calculados uma vez a partir dos itens serializados.
+    """
     return {
-        'cart_empty': False,
-        'items': items,
+        'total_cents': sum(item['price'] * item['amount'] for item in items),
+        'item_count': sum(item['amount'] for item in items),
+        'items_summary': ", ".join(f"{item['amount']}x {item['product_name']}" for item in items),
     }
 
 
@@ -71,23 +191,13 @@ async def get_order_details(order_id: int):
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     
-    items = []
-    total_price = 0
-    for item in await OrderItem.filter(order=order.id).all():
-        product = await item.product
-        items.append({
-            'product_id': product.id,
-            'product_name': product.name,
-            'price': item.price,
-            'amount': item.amount,
-            'attributes': item.attributes
-        })
-        total_price += item.price * item.amount
+    # Os itens só são lidos para a lista da resposta; o total vem do pedido
+    rows = await OrderItem.filter(order=order.id).order_by('id').values(*CART_ITEM_FIELDS)
 
     return {
         'status': order.status,
         'code': order.code,
-        'items': items,
-        'total_price': total_price,
+        'items': serialize_items(rows),
+        'total_price': order.total_cents,
         'created_at': order.created_at.isoformat(),
     }
\ No newline at end of file
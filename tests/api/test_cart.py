@@ -94,4 +94,269 @@ async def test_should_delete_cart_item_with_customer_authorization(client: Async
     )
     assert request.status_code == 200
     response = request.json()
-    assert response["cart_empty"] == True
\ No newline at end of file
+    assert response["cart_empty"] == True
+
+
+@pytest.mark.anyio
+async def test_warm_cart_request_shouldnt_query_auth_tables(client: AsyncClient,
+                            get_authenticated_customer_access_token: str,
+                            get_authenticated_store_credential: str, capture_queries, monkeypatch):
+    headers = {
+        "Customer-Authorization": f"Bearer {get_authenticated_customer_access_token}",
+        "Store-Credential": get_authenticated_store_credential,
+    }
+    request = await client.get("/carts/current", headers=headers)
+    assert request.status_code == 200
+
+    queries = capture_queries()
+    request = await client.get("/carts/current", headers=headers)
+    assert request.status_code == 200
+    # Autenticação, loja e o próprio carrinho vêm dos caches
+    assert queries == []
+
+
+@pytest.mark.anyio
+async def test_cart_read_should_cost_a_constant_number_of_queries(client: AsyncClient,
+                            customer_headers, capture_queries, monkeypatch):
+    from src.cart_cache import cart_cache
+    from src.models import Cart, CartItem, Product
+
+    customer_id, headers = await customer_headers("carrinho@gmail.com")
+    products = [
+        await Product.create(store_id=1, name=f"Ingresso {i}", description="", price=1000 + i,
+                             product_code=f"cart-{i}", park_code="cart-park")
+        for i in range(50)
+    ]
+    cart = await Cart.create(store_id=1, customer_id=customer_id)
+
+    counts = {}
+    for size in (1, 50):
+        await CartItem.filter(cart_id=cart.id).delete()
+        await CartItem.bulk_create([
+            CartItem(cart_id=cart.id, product_id=product.id, amount=2, price=product.price, attributes={"adults": 2})
+            for product in products[:size]
+        ])
+        # Aquece os caches de autenticação; o carrinho é lido do banco
+        await client.get("/carts/current", headers=headers)
+        cart_cache.cache.clear()
+
+        queries = capture_queries()
+        request = await client.get("/carts/current", headers=headers)
+        monkeypatch.undo()
+        response = request.json()
+        assert request.status_code == 200
+        assert len(response["items"]) == size
+        counts[size] = len(queries)
+
+    assert response["items"][49] == {
+        "product_id": products[49].id,
+        "product_name": "Ingresso 49",
+        "price": 1049,
+        "amount": 2,
+        "attributes": {"adults": 2},
+    }
+    assert counts[1] == counts[50] == 1
+
+
+@pytest.mark.anyio
+async def test_cart_mutations_should_write_through_and_honour_etags(client: AsyncClient,
+                            customer_headers, capture_queries, monkeypatch):
+    from src.cart_cache import cart_cache
+    from src.models import Product
+    from src.utils import get_cart_items
+
+    customer_id, headers = await customer_headers("etag@gmail.com")
+    first, second = [
+        await Product.create(store_id=1, name=f"Ingresso ETag {i}", description="", price=5000,
+                             product_code=f"etag-{i}", park_code="etag-park")
+        for i in range(2)
+    ]
+
+    request = await client.get("/carts/current", headers=headers)
+    assert request.json() == {"cart_empty": True, "items": []}
+    etags = [request.headers["ETag"]]
+
+    steps = [
+        ("post", "/carts/", {"product_id": first.id, "amount": 1, "price": 5000, "attributes": {"adults": 1}}),
+        ("post", "/carts/", {"product_id": second.id, "amount": 2, "price": 4500}),
+        ("put", "/carts/update-amount", {"product_id": first.id, "amount": 3}),
+        ("delete", f"/carts/{second.id}", None),
+    ]
+    for method, url, body in steps:
+        kwargs = {"json": body} if body is not None else {}
+        request = await getattr(client, method)(url, headers=headers, **kwargs)
+        assert request.status_code == 200
+        # O snapshot atualizado no lugar é igual ao carrinho relido do banco
+        assert request.json() == await get_cart_items(1, customer_id)
+
+        queries = capture_queries()
+        request = await client.get("/carts/current", headers=headers)
+        monkeypatch.undo()
+        assert queries == []
+        assert request.json() == await get_cart_items(1, customer_id)
+        assert request.headers["ETag"] not in etags
+        etags.append(request.headers["ETag"])
+
+    assert request.json()["items"] == [{
+        "product_id": first.id,
+        "product_name": "Ingresso ETag 0",
+        "price": 5000,
+        "amount": 3,
+        "attributes": {"adults": 1},
+    }]
+
+    request = await client.get("/carts/current", headers={**headers, "If-None-Match": etags[-1]})
+    assert request.status_code == 304
+    assert request.content == b""
+    request = await client.get("/carts/current", headers={**headers, "If-None-Match": etags[-2]})
+    assert request.status_code == 200
+
+    # Relido do banco, o carrinho mantém o mesmo ETag
+    cart_cache.cache.clear()
+    request = await client.get("/carts/current", headers={**headers, "If-None-Match": etags[-1]})
+    assert request.status_code == 304
+
+
+@pytest.mark.anyio
+async def test_adding_the_same_line_should_increment_amount(client: AsyncClient,
+                            customer_headers):
+    import asyncio
+    from src.models import CartItem, Product
+    from src.utils import get_cart_items
+
+    customer_id, headers = await customer_headers("upsert@gmail.com")
+    product = await Product.create(store_id=1, name="Ingresso Upsert", description="", price=5000,
+                                   product_code="upsert", park_code="upsert-park")
+
+    async def add(amount: int, attributes: dict):
+        return await client.post("/carts/", headers=headers, json={
+            "product_id": product.id, "amount": amount, "price": 5000, "attributes": attributes,
+        })
+
+    await add(1, {"date": "2026-12-01", "adults": 2})
+    # Mesmos atributos em outra ordem: mesma linha
+    request = await add(2, {"adults": 2, "date": "2026-12-01"})
+    assert [item["amount"] for item in request.json()["items"]] == [3]
+    # Outra data: outra linha
+    request = await add(1, {"date": "2026-12-02", "adults": 2})
+    assert [item["amount"] for item in request.json()["items"]] == [3, 1]
+
+    # Adições simultâneas não se perdem nem duplicam linhas
+    await asyncio.gather(*[add(1, {"date": "2026-12-01", "adults": 2}) for _ in range(20)])
+    assert await CartItem.filter(cart__customer_id=customer_id).count() == 2
+    cart = await get_cart_items(1, customer_id)
+    assert [item["amount"] for item in cart["items"]] == [23, 1]
+    request = await client.get("/carts/current", headers=headers)
+    assert request.json() == cart
+
+
+@pytest.mark.anyio
+async def test_cart_item_line_should_be_unique():
+    from tortoise.exceptions import IntegrityError
+    from src.models import Cart, CartItem, Product
+    from src.utils import attributes_key
+
+    product = await Product.filter(store_id=1).first()
+    cart = await Cart.create(store_id=1, customer_id=1, status='active')
+    key = attributes_key({"adults": 1})
+    await CartItem.create(cart=cart, product=product, attributes={"adults": 1}, attributes_key=key)
+    with pytest.raises(IntegrityError):
+        await CartItem.create(cart=cart, product=product, attributes={"adults": 1}, attributes_key=key)
+    await cart.delete()
+
+
+@pytest.mark.anyio
+async def test_cart_writes_shouldnt_touch_a_closed_cart():
+    from fastapi import HTTPException
+    from tortoise.transactions import in_transaction
+    from src.models import Cart, CartItem, Product
+    from src.routes.cart import bump_version
+    from src.utils import upsert_cart_item
+
+    product = await Product.filter(store_id=1).first()
+    cart = await Cart.create(store_id=1, customer_id=1, status='active')
+
+    # Outra alteração no meio tempo: grava, mas o snapshot precisa ser relido
+    await Cart.filter(id=cart.id).update(version=cart.version + 1)
+    async with in_transaction() as connection:
+        assert await bump_version(cart, connection) is False
+    assert (await Cart.get(id=cart.id)).version == cart.version + 2
+
+    # Fechado pelo checkout entre a leitura e a escrita: nada é gravado
+    await Cart.filter(id=cart.id).update(status='closed')
+    with pytest.raises(HTTPException) as error:
+        async with in_transaction() as connection:
+            await bump_version(cart, connection)
+            await upsert_cart_item(cart.id, product.id, 1, 1000, {}, connection=connection)
+    assert error.value.status_code == 409
+    assert not await CartItem.filter(cart_id=cart.id).exists()
+    assert (await Cart.get(id=cart.id)).version == cart.version + 2
+    await cart.delete()
+
+
+@pytest.mark.anyio
+async def test_cart_batch_should_apply_operations_atomically(client: AsyncClient,
+                            customer_headers, capture_queries, monkeypatch):
+    from src.models import Product
+    from src.utils import get_cart_items
+
+    customer_id, headers = await customer_headers("batch@gmail.com")
+    products = [
+        await Product.create(store_id=1, name=f"Ingresso Lote {i}", description="", price=3000,
+                             product_code=f"batch-{i}", park_code="batch-park")
+        for i in range(3)
+    ]
+    inactive = await Product.create(store_id=1, name="Ingresso Inativo", description="", price=3000,
+                                    product_code="batch-inactive", park_code="batch-park", status="inactive")
+
+    # Atualizar ou remover sem carrinho
+    request = await client.post("/carts/batch", headers=headers, json={
+        "operations": [{"op": "remove", "product_id": products[0].id}],
+    })
+    assert request.status_code == 404
+
+    queries = capture_queries()
+    request = await client.post("/carts/batch", headers=headers, json={"operations": [
+        {"op": "add", "product_id": products[0].id, "amount": 1, "price": 3000, "attributes": {"adults": 1}},
+        {"op": "add", "product_id": products[1].id, "amount": 2, "price": 2500},
+        {"op": "add", "product_id": products[2].id, "amount": 1, "price": 3000},
+        {"op": "add", "product_id": products[0].id, "amount": 1, "price": 3000, "attributes": {"adults": 1}},
+        {"op": "update", "product_id": products[1].id, "amount": 5},
+        {"op": "remove", "product_id": products[2].id},
+    ]})
+    monkeypatch.undo()
+    assert request.status_code == 200
+    # Todos os produtos adicionados validados numa única consulta
+    assert len([query for query in queries if 'FROM "product"' in query]) == 1
+    assert request.json() == await get_cart_items(1, customer_id)
+    assert [(item["product_id"], item["amount"]) for item in request.json()["items"]] == [
+        (products[0].id, 2), (products[1].id, 5),
+    ]
+    request = await client.get("/carts/current", headers=headers)
+    assert request.json() == await get_cart_items(1, customer_id)
+
+    # Uma operação inválida desfaz as anteriores
+    before = await get_cart_items(1, customer_id)
+    request = await client.post("/carts/batch", headers=headers, json={"operations": [
+        {"op": "update", "product_id": products[0].id, "amount": 9},
+        {"op": "remove", "product_id": products[2].id},
+    ]})
+    assert request.status_code == 404
+    assert await get_cart_items(1, customer_id) == before
+
+    request = await client.post("/carts/batch", headers=headers, json={"operations": [
+        {"op": "add", "product_id": inactive.id, "amount": 1, "price": 3000},
+    ]})
+    assert request.status_code == 404
+    assert request.json()["detail"] == "Product inactive"
+
+    request = await client.post("/carts/batch", headers=headers, json={"operations": [
+        {"op": "remove", "product_id": products[0].id},
+        {"op": "remove", "product_id": products[1].id},
+    ]})
+    assert request.json() == {"cart_empty": True, "items": []}
+    request = await client.get("/carts/current", headers=headers)
+    assert request.json() == {"cart_empty": True, "items": []}
+
+    request = await client.post("/carts/batch", headers=headers, json={"operations": []})
+    assert request.status_code == 422
@@ -0,0 +1,109 @@
+import httpx
+import pytest
+from httpx import AsyncClient
+from src.integrations.maria_api.cache import MariaResponseCache
+from src.routes import maria as maria_routes
+from tests.integration.payloads import PARK, make_product
+
+PARK_CODE = PARK["code"]
+
+
+@pytest.fixture
+def maria_upstream(use_maria_client):
+    async def handler(request: httpx.Request):
+        if request.url.path.rstrip("/") == "/parks":
+            return httpx.Response(200, json=[PARK])
+        return httpx.Response(200, json=[make_product(f"product-{i}", f"{100 + i}.5{i % 10}") for i in range(20)])
+
+    return use_maria_client(handler, cache=MariaResponseCache())
+
+
+@pytest.mark.anyio
+async def test_fast_serialization_should_match_model_dump_response(client: AsyncClient,
+                maria_upstream, get_authenticated_store_credential: str, monkeypatch):
+    headers = {"Store-Credential": get_authenticated_store_credential}
+    responses = {}
+    for fast in (False, True, True):
+        monkeypatch.setattr(maria_routes, "FAST_SERIALIZATION", fast)
+        parks = await client.get("/maria/parks", headers=headers)
+        products = await client.get(f"/maria/parks/{PARK_CODE}/products", headers=headers,
+                                    params={"forDate": "2025-12-01", "numAdults": 2})
+        assert parks.status_code == 200
+        assert products.status_code == 200
+        responses.setdefault(fast, []).append((parks.json(), products.json()))
+
+    legacy = responses[False][0]
+    # Segunda chamada no modo rápido vem do cache: preços não podem ser reaplicados
+    assert responses[True][0] == legacy
+    assert responses[True][1] == legacy
+    assert legacy[1][0]["prices"]["adult"]["usdbrl"]["amount"] != "100.50"
+    assert legacy[1][0]["platform_commission"] is not None
+
+
+@pytest.mark.anyio
+async def test_should_answer_503_when_maria_is_down(client: AsyncClient, use_maria_client,
+                get_authenticated_store_credential: str):
+    headers = {"Store-Credential": get_authenticated_store_credential}
+
+    async def handler(request: httpx.Request):
+        return httpx.Response(502, json={"detail": "bad gateway"})
+
+    use_maria_client(handler)
+    response = await client.get(f"/maria/parks/{PARK_CODE}", headers=headers)
+    assert response.status_code == 503
+
+    # Produto indisponível na Maria API não é "não encontrado"
+    response = await client.get("/products/by-external-code", headers=headers,
+                                params={"product_code": "product-1", "park_code": PARK_CODE})
+    assert response.status_code == 503
+
+    for _ in range(5):
+        await client.get(f"/maria/parks/{PARK_CODE}", headers=headers)
+    response = await client.get(f"/maria/parks/{PARK_CODE}", headers=headers)
+    assert response.status_code == 503
+    assert "retry-after" in response.headers
+
+
+@pytest.mark.anyio
+async def test_should_return_price_calendar_matrix(client: AsyncClient, maria_upstream,
+                get_authenticated_store_credential: str):
+    headers = {"Store-Credential": get_authenticated_store_credential}
+    response = await client.get(f"/maria/parks/{PARK_CODE}/calendar", headers=headers, params={
+        "startDate": "2026-12-01", "endDate": "2026-12-07", "numAdults": 2,
+    })
+    assert response.status_code == 200
+    calendar = response.json()
+    assert calendar["dates"] == [f"2026-12-0{day}" for day in range(1, 8)]
+    assert len(calendar["products"]) == 20
+    assert len(calendar["prices"]["adult"]) == 20
+    assert all(len(row) == 7 for row in calendar["prices"]["adult"])
+    assert calendar["prices"]["adult"][0][0] != "100.50"
+    assert calendar["errors"] == {}
+
+    response = await client.get(f"/maria/parks/{PARK_CODE}/calendar", headers=headers, params={
+        "startDate": "2026-12-07", "endDate": "2026-12-01",
+    })
+    assert response.status_code == 400
+
+    response = await client.get(f"/maria/parks/{PARK_CODE}/calendar", headers=headers, params={
+        "startDate": "2026-01-01", "endDate": "2026-12-31",
+    })
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_calendar_should_answer_503_when_every_date_fails(client: AsyncClient, use_maria_client,
+                get_authenticated_store_credential: str, caplog):
+    headers = {"Store-Credential": get_authenticated_store_credential}
+
+    async def handler(request: httpx.Request):
+        return httpx.Response(503, json={"detail": "unavailable"})
+
+    use_maria_client(handler)
+    with caplog.at_level("WARNING", logger="src.routes.maria"):
+        response = await client.get(f"/maria/parks/{PARK_CODE}/calendar", headers=headers, params={
+            "startDate": "2026-12-01", "endDate": "2026-12-02",
+        })
+    assert response.status_code == 503
+    assert response.json() == {"detail": "Maria API unavailable"}
+    assert len([record for record in caplog.records if "calendar" in record.getMessage()]) == 2
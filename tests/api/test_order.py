@@ -78,4 +78,338 @@ async def test_should_create_order(client: AsyncClient,
     assert response["items"][0]["product_id"] == 1
     assert response["items"][0]["amount"] == 1
     assert response["total_price"] == 100
-    assert response["created_at"] is not None
\ No newline at end of file
+    assert response["created_at"] is not None
+
+ORDER_BODY = {
+    "customer_name": "Cliente",
+    "customer_email": "cliente@gmail.com",
+    "customer_document": "12345678900",
+    "customer_phone": "11999999999",
+    "address_street": "Rua A",
+    "address_number": "1",
+    "address_city": "São Paulo",
+    "address_state": "SP",
+    "address_zip": "01000-000",
+}
+
+
+@pytest.mark.anyio
+async def test_checkout_should_close_the_cart(client: AsyncClient, customer_headers):
+    from src.models import Cart, Product
+
+    customer_id, headers = await customer_headers("checkout@gmail.com")
+    first, second = [
+        await Product.create(store_id=1, name=f"Ingresso Checkout {i}", description="", price=2000,
+                             product_code=f"checkout-{i}", park_code="checkout-park")
+        for i in range(2)
+    ]
+
+    await client.post("/carts/", headers=headers, json={"product_id": first.id, "amount": 2, "price": 2000})
+    request = await client.get("/carts/current", headers=headers)
+    assert request.json()["cart_empty"] is False
+
+    request = await client.post("/orders/", headers=headers, json=ORDER_BODY)
+    assert request.status_code == 200
+    assert [(item["product_id"], item["amount"]) for item in request.json()["items"]] == [(first.id, 2)]
+    assert await Cart.filter(customer_id=customer_id).values_list('status', flat=True) == ['closed']
+
+    # O carrinho em cache também é descartado
+    request = await client.get("/carts/current", headers=headers)
+    assert request.json() == {"cart_empty": True, "items": []}
+    request = await client.post("/orders/", headers=headers, json=ORDER_BODY)
+    assert request.status_code == 404
+
+    # A próxima compra começa um carrinho novo, sem os itens da anterior
+    await client.post("/carts/", headers=headers, json={"product_id": second.id, "amount": 1, "price": 2000})
+    request = await client.post("/orders/", headers=headers, json=ORDER_BODY)
+    assert [(item["product_id"], item["amount"]) for item in request.json()["items"]] == [(second.id, 1)]
+    statuses = await Cart.filter(customer_id=customer_id).order_by('id').values_list('status', flat=True)
+    assert statuses == ['closed', 'closed']
+
+
+@pytest.mark.anyio
+async def test_checkout_shouldnt_trust_a_cached_empty_cart(client: AsyncClient,
+                            customer_headers):
+    from src.cart_cache import CartSnapshot, cart_cache
+    from src.models import Cart, CartItem, Product
+
+    customer_id, headers = await customer_headers("stale@gmail.com")
+    product = await Product.create(store_id=1, name="Ingresso Stale", description="", price=2000,
+                                   product_code="stale", park_code="stale-park")
+
+    # Snapshot vazio em cache, carrinho gravado por outro worker
+    cart_cache.put((1, customer_id), CartSnapshot(), cart_cache.snapshot())
+    cart = await Cart.create(store_id=1, customer_id=customer_id)
+    await CartItem.create(cart=cart, product=product, amount=1, price=2000, attributes={})
+
+    request = await client.post("/orders/", headers=headers, json=ORDER_BODY)
+    assert request.status_code == 200
+    assert [item["product_id"] for item in request.json()["items"]] == [product.id]
+
+
+@pytest.fixture
+def capture_all_queries(capture_queries, monkeypatch):
+    """
+    capture_queries (tests/conftest.py) mais as instruções executadas dentro
+    das transações.
+    """
+    def capture() -> list:
+        from tortoise.backends.sqlite.client import SqliteTransactionWrapper
+
+        queries = capture_queries()
+        for method in ("execute_query", "execute_query_dict", "execute_insert", "execute_many"):
+            original = getattr(SqliteTransactionWrapper, method)
+
+            async def record(self, query, values=None, _original=original):
+                queries.append(query)
+                return await _original(self, query, values)
+
+            monkeypatch.setattr(SqliteTransactionWrapper, method, record)
+        return queries
+    return capture
+
+
+@pytest.mark.anyio
+async def test_checkout_should_cost_a_constant_number_of_queries(client: AsyncClient,
+                            customer_headers, capture_all_queries, monkeypatch):
+    from src.cart_cache import cart_cache
+    from src.models import Cart, CartItem, Order, Product
+    from src.utils import get_order_details
+
+    customer_id, headers = await customer_headers("bulk-order@gmail.com")
+    products = [
+        await Product.create(store_id=1, name=f"Ingresso Pedido {i}", description="", price=1000 + i,
+                             product_code=f"bulk-order-{i}", park_code="bulk-order-park")
+        for i in range(30)
+    ]
+    # Aquece o cache de autenticação
+    await client.get("/carts/current", headers=headers)
+
+    counts = {}
+    for size in (1, 30):
+        cart = await Cart.create(store_id=1, customer_id=customer_id)
+        await CartItem.bulk_create([
+            CartItem(cart_id=cart.id, product_id=product.id, amount=2, price=product.price,
+                     attributes={"adults": 2})
+            for product in products[:size]
+        ])
+        # Carrinho gravado direto no banco: descarta o snapshot em cache
+        cart_cache.cache.clear()
+
+        queries = capture_all_queries()
+        request = await client.post("/orders/", headers=headers, json=ORDER_BODY)
+        monkeypatch.undo()
+        assert request.status_code == 200
+        counts[size] = len(queries)
+        assert len([query for query in queries if 'FROM "product"' in query]) == 1
+        assert len([query for query in queries if 'INSERT INTO "orderitem"' in query]) == 1
+
+        order = await Order.get(code=request.json()["code"])
+        assert request.json() == await get_order_details(order.id)
+        assert len(request.json()["items"]) == size
+
+    assert request.json()["total_price"] == sum(2 * (1000 + i) for i in range(30))
+    assert counts[1] == counts[30]
+
+
+@pytest.mark.anyio
+async def test_checkout_should_roll_back_when_an_item_fails(client: AsyncClient,
+                            customer_headers, monkeypatch):
+    from src.models import Cart, Order, OrderItem, Product
+
+    customer_id, headers = await customer_headers("rollback-order@gmail.com")
+    product = await Product.create(store_id=1, name="Ingresso Rollback", description="", price=1000,
+                                   product_code="rollback-order", park_code="rollback-park")
+    await client.post("/carts/", headers=headers, json={"product_id": product.id, "amount": 1, "price": 1000})
+
+    async def fail(*args, **kwargs):
+        raise RuntimeError("falha ao gravar os itens")
+
+    monkeypatch.setattr(OrderItem, "bulk_create", fail)
+    with pytest.raises(RuntimeError):
+        await client.post("/orders/", headers=headers, json=ORDER_BODY)
+    monkeypatch.undo()
+
+    # Nem pedido pela metade nem carrinho fechado
+    assert not await Order.filter(customer_id=customer_id).exists()
+    assert await Cart.filter(customer_id=customer_id).values_list('status', flat=True) == ['active']
+    request = await client.post("/orders/", headers=headers, json=ORDER_BODY)
+    assert request.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_order_idempotency_key_should_replay_the_first_result(client: AsyncClient,
+                            customer_headers):
+    import asyncio
+    from src.models import Order, Product
+
+    customer_id, headers = await customer_headers("idempotency@gmail.com")
+    product = await Product.create(store_id=1, name="Ingresso Idempotente", description="", price=1500,
+                                   product_code="idempotency", park_code="idempotency-park")
+
+    # Falha (carrinho vazio) não consome a chave
+    request = await client.post("/orders/", headers={**headers, "Idempotency-Key": "pedido-1"}, json=ORDER_BODY)
+    assert request.status_code == 404
+    await client.post("/carts/", headers=headers, json={"product_id": product.id, "amount": 1, "price": 1500})
+
+    # Repetições simultâneas esperam a primeira execução
+    requests = await asyncio.gather(*[
+        client.post("/orders/", headers={**headers, "Idempotency-Key": "pedido-1"}, json=ORDER_BODY)
+        for _ in range(5)
+    ])
+    assert [request.status_code for request in requests] == [200] * 5
+    assert len({request.json()["code"] for request in requests}) == 1
+    assert sorted(request.headers.get("Idempotent-Replayed", "") for request in requests) == [""] + ["true"] * 4
+    assert await Order.filter(customer_id=customer_id).count() == 1
+
+    request = await client.post("/orders/", headers={**headers, "Idempotency-Key": "pedido-1"}, json=ORDER_BODY)
+    assert request.json() == requests[0].json()
+
+    # Mesma chave com outro corpo
+    request = await client.post("/orders/", headers={**headers, "Idempotency-Key": "pedido-1"},
+                                json={**ORDER_BODY, "address_number": "2"})
+    assert request.status_code == 422
+
+    code = requests[0].json()["code"]
+    responses = [
+        await client.post(f"/orders/{code}/pay", headers={"Idempotency-Key": "pagamento-1"})
+        for _ in range(2)
+    ]
+    assert responses[0].json() == responses[1].json() == {"message": "Payment successful", "status": "paid"}
+    assert responses[1].headers["Idempotent-Replayed"] == "true"
+
+
+@pytest.mark.anyio
+async def test_stranded_idempotency_key_should_be_taken_over_after_its_lease(monkeypatch):
+    import datetime
+    from fastapi import HTTPException
+    from src import idempotency
+    from src.models import IdempotencyKey
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    expires_at = now + datetime.timedelta(hours=1)
+    # Worker que morreu no meio da execução: lease vencido
+    await IdempotencyKey.create(scope="lease", key="orfa", fingerprint="x", owner="morto",
+                                locked_until=now - datetime.timedelta(seconds=1), expires_at=expires_at)
+    owner, entry = await idempotency.claim("lease", "orfa", "x")
+    assert entry is None and owner != "morto"
+    assert (await IdempotencyKey.get(scope="lease", key="orfa")).owner == owner
+
+    # Outra requisição não assume a chave de quem ainda detém o lease, e
+    # espera só com SELECTs (nenhum INSERT com violação de unicidade)
+    inserts = []
+    create = IdempotencyKey.create
+
+    async def counting_create(*args, **kwargs):
+        inserts.append(kwargs)
+        return await create(*args, **kwargs)
+
+    monkeypatch.setattr(IdempotencyKey, "create", counting_create)
+    monkeypatch.setattr(idempotency, "IDEMPOTENCY_WAIT_TIMEOUT", 0.1)
+    with pytest.raises(HTTPException) as error:
+        await idempotency.wait_for("lease", "orfa", "x")
+    assert error.value.status_code == 409
+    assert inserts == []
+
+    # Corpo diferente não assume um lease vencido
+    await IdempotencyKey.filter(scope="lease", key="orfa").update(locked_until=now - datetime.timedelta(seconds=1))
+    owner_, entry = await idempotency.claim("lease", "orfa", "y")
+    assert owner_ is None and entry.owner == owner
+
+
+@pytest.mark.anyio
+async def test_idempotency_replay_should_keep_the_original_status_code():
+    from fastapi import FastAPI, Request
+    from fastapi.responses import JSONResponse
+    from httpx import ASGITransport
+    from src.idempotency import idempotent
+
+    app = FastAPI()
+
+    @app.post("/created", status_code=201)
+    @idempotent("teste.created")
+    async def created(request: Request):
+        return {"created": True}
+
+    @app.post("/accepted")
+    @idempotent("teste.accepted")
+    async def accepted(request: Request):
+        return JSONResponse({"accepted": True}, status_code=202)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        for path, status_code, body in (("/created", 201, {"created": True}), ("/accepted", 202, {"accepted": True})):
+            responses = [await client.post(path, headers={"Idempotency-Key": "status"}) for _ in range(2)]
+            assert [response.status_code for response in responses] == [status_code] * 2
+            assert [response.json() for response in responses] == [body] * 2
+            assert responses[1].headers["Idempotent-Replayed"] == "true"
+
+
+@pytest.mark.anyio
+async def test_expired_idempotency_keys_should_be_purged():
+    import datetime
+    from src.idempotency import purge_expired_keys
+    from src.models import IdempotencyKey
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    await IdempotencyKey.bulk_create([
+        IdempotencyKey(scope="teste", key=f"expirada-{i}", fingerprint="x", status_code=200, response={},
+                       expires_at=now - datetime.timedelta(seconds=1))
+        for i in range(3)
+    ])
+    await IdempotencyKey.create(scope="teste", key="vigente", fingerprint="x", status_code=200, response={},
+                                expires_at=now + datetime.timedelta(hours=1))
+
+    assert await purge_expired_keys(batch_size=2, pause=0) == 3
+    assert await IdempotencyKey.filter(scope="teste").values_list("key", flat=True) == ["vigente"]
+
+
+@pytest.mark.anyio
+async def test_admin_order_views_should_use_the_stored_totals(client: AsyncClient,
+                            get_authenticated_seller_access_token: str,
+                            get_authenticated_store_credential: str,
+                            customer_headers, capture_queries, monkeypatch):
+    from src.models import Order, Product
+
+    customer_id, headers = await customer_headers("totals@gmail.com")
+    first, second = [
+        await Product.create(store_id=1, name=f"Ingresso Total {i}", description="", price=1000,
+                             product_code=f"totals-{i}", park_code="totals-park")
+        for i in range(2)
+    ]
+    await client.post("/carts/batch", headers=headers, json={"operations": [
+        {"op": "add", "product_id": first.id, "amount": 1, "price": 1250},
+        {"op": "add", "product_id": second.id, "amount": 3, "price": 990},
+    ]})
+    request = await client.post("/orders/", headers=headers, json=ORDER_BODY)
+    code = request.json()["code"]
+    assert request.json()["total_price"] == 1250 + 3 * 990
+
+    order = await Order.get(code=code)
+    assert (order.total_cents, order.item_count) == (1250 + 3 * 990, 4)
+    assert order.items_summary == "1x Ingresso Total 0, 3x Ingresso Total 1"
+
+    admin_headers = {
+        "Seller-Authorization": f"Bearer {get_authenticated_seller_access_token}",
+        "Store-Credential": get_authenticated_store_credential,
+    }
+    request = await client.get("/seller/admin/api/dashboard-stats", headers=admin_headers)
+    total_today = request.json()["total_today"]
+    await client.post(f"/orders/{code}/pay")
+
+    queries = capture_queries()
+    stats = (await client.get("/seller/admin/api/dashboard-stats", headers=admin_headers)).json()
+    orders = (await client.get("/seller/admin/api/orders", headers=admin_headers)).json()["orders"]
+    customer_orders = (await client.get(f"/seller/admin/api/customers/{customer_id}/orders",
+                                        headers=admin_headers)).json()["orders"]
+    customers = (await client.get("/seller/admin/api/customers", headers=admin_headers)).json()["customers"]
+    monkeypatch.undo()
+    assert not [query for query in queries if "orderitem" in query]
+
+    assert stats["total_today"] == pytest.approx(total_today + 42.20)
+    listed = next(order for order in orders if order["code"] == code)
+    assert (listed["products"], listed["total"]) == ("1x Ingresso Total 0, 3x Ingresso Total 1", 42.2)
+    assert [(order["products"], order["total"]) for order in customer_orders] == [
+        ("1x Ingresso Total 0, 3x Ingresso Total 1", 42.2),
+    ]
+    customer = next(customer for customer in customers if customer["id"] == customer_id)
+    assert (customer["total_spent"], customer["total_orders"]) == (42.2, 1)
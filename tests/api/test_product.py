@@ -1,5 +1,27 @@
+import asyncio
+import httpx
 import pytest
 from httpx import AsyncClient
+from tortoise.exceptions import IntegrityError
+from src.models import Product
+from tests.integration.payloads import PARK, make_product_detail
+
+PARK_CODE = PARK["code"]
+
+
+@pytest.fixture
+def maria_details(use_maria_client):
+    calls = []
+
+    async def handler(request: httpx.Request):
+        product_code = request.url.path.rsplit("/", 1)[-1]
+        calls.append(product_code)
+        if product_code.startswith("missing"):
+            return httpx.Response(404, json={"detail": "Product not found"})
+        return httpx.Response(200, json=make_product_detail(product_code, "100.00"))
+
+    use_maria_client(handler)
+    return calls
 
 
 @pytest.mark.anyio
@@ -62,4 +84,69 @@ async def test_should_create_product_with_seller_authorization(client: AsyncClie
     assert response["id"] == 1
     assert response["name"] == "Produto de Teste"
     assert response["description"] == "Descrição do produto de teste"
-    assert response["price"] == 100
\ No newline at end of file
+    assert response["price"] == 100
+
+
+@pytest.mark.anyio
+async def test_should_get_or_create_products_in_batch(client: AsyncClient, maria_details,
+                get_authenticated_store_credential: str):
+    headers = {"Store-Credential": get_authenticated_store_credential}
+    refs = [{"park_code": PARK_CODE, "product_code": code} for code in ("batch-1", "batch-2", "missing-1")]
+    request = await client.post("/products/by-external-code/batch", headers=headers,
+                                json={"products": refs + refs[:1]})
+    assert request.status_code == 200
+    response = request.json()
+    ids = response["product_ids"]
+    assert set(ids) == {f"{PARK_CODE}/batch-1", f"{PARK_CODE}/batch-2"}
+    assert response["errors"][f"{PARK_CODE}/missing-1"]["status_code"] == 404
+    assert sorted(maria_details) == ["batch-1", "batch-2", "missing-1"]
+
+    # Já cadastrados: resolvidos no banco, só o novo vai à Maria API
+    maria_details.clear()
+    refs.append({"park_code": PARK_CODE, "product_code": "batch-3"})
+    request = await client.post("/products/by-external-code/batch", headers=headers,
+                                json={"products": refs[:2] + refs[3:]})
+    response = request.json()
+    assert maria_details == ["batch-3"]
+    assert response["product_ids"][f"{PARK_CODE}/batch-1"] == ids[f"{PARK_CODE}/batch-1"]
+    assert response["product_ids"][f"{PARK_CODE}/batch-2"] == ids[f"{PARK_CODE}/batch-2"]
+    assert len(set(response["product_ids"].values())) == 3
+
+    # Mesmo ID pelo endpoint unitário
+    request = await client.get("/products/by-external-code", headers=headers,
+                               params={"park_code": PARK_CODE, "product_code": "batch-3"})
+    assert request.json()["product_id"] == response["product_ids"][f"{PARK_CODE}/batch-3"]
+
+
+@pytest.mark.anyio
+async def test_batch_should_validate_the_payload(client: AsyncClient, get_authenticated_store_credential: str):
+    headers = {"Store-Credential": get_authenticated_store_credential}
+    request = await client.post("/products/by-external-code/batch", headers=headers, json={"products": []})
+    assert request.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_concurrent_first_requests_should_create_a_single_product(client: AsyncClient, maria_details,
+                get_authenticated_store_credential: str):
+    headers = {"Store-Credential": get_authenticated_store_credential}
+    params = {"park_code": PARK_CODE, "product_code": "concurrent-1"}
+    responses = await asyncio.gather(*[
+        client.get("/products/by-external-code", headers=headers, params=params)
+        for _ in range(100)
+    ])
+    assert all(response.status_code == 200 for response in responses)
+    assert len({response.json()["product_id"] for response in responses}) == 1
+    assert maria_details == ["concurrent-1"]
+    assert await Product.filter(park_code=PARK_CODE, product_code="concurrent-1").count() == 1
+
+
+@pytest.mark.anyio
+async def test_unique_index_should_reject_duplicate_products(client: AsyncClient, maria_details,
+                get_authenticated_store_credential: str):
+    headers = {"Store-Credential": get_authenticated_store_credential}
+    params = {"park_code": PARK_CODE, "product_code": "unique-1"}
+    product_id = (await client.get("/products/by-external-code", headers=headers, params=params)).json()["product_id"]
+    product = await Product.get(id=product_id)
+    with pytest.raises(IntegrityError):
+        await Product.create(store_id=product.store_id, park_code=PARK_CODE, product_code="unique-1",
+                             name="Duplicado", description="", price=1)
@@ -32,4 +32,118 @@ async def test_shouldnt_create_seller_with_same_email(client: AsyncClient):
     )
     response = request.json()
     assert request.status_code == 400
-    assert response["detail"] == "Email already registered"
\ No newline at end of file
+    assert response["detail"] == "Email already registered"
+
+@pytest.mark.anyio
+async def test_relogin_should_revoke_cached_token_immediately(client: AsyncClient):
+    from src.auth_cache import access_token_cache
+
+    request = await client.post(
+        "/sellers/",
+        json={
+            "name": "Vendedor Cache",
+            "email": "cache@magic.com",
+            "password": "123456",
+        },
+    )
+    old_token = request.json()["access_token"]
+    headers = {"Seller-Authorization": f"Bearer {old_token}"}
+
+    request = await client.get("/sellers/me", headers=headers)
+    assert request.status_code == 200
+
+    # Segunda requisição resolvida pelo cache
+    hits = access_token_cache.cache.hits
+    request = await client.get("/sellers/me", headers=headers)
+    assert request.status_code == 200
+    assert request.json()["email"] == "cache@magic.com"
+    assert access_token_cache.cache.hits == hits + 1
+
+    request = await client.post(
+        "/sellers/auth",
+        json={
+            "email": "cache@magic.com",
+            "password": "123456",
+        },
+    )
+    new_token = request.json()["access_token"]
+
+    request = await client.get("/sellers/me", headers=headers)
+    assert request.status_code == 403
+
+    request = await client.get("/sellers/me", headers={"Seller-Authorization": f"Bearer {new_token}"})
+    assert request.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_signed_tokens_should_authenticate_without_auth_rows(client: AsyncClient, monkeypatch):
+    from src import authentication, utils
+    from src.models import SellerAuth
+    from src.tokens import TokenSigner
+
+    signer = TokenSigner("segredo-de-teste")
+    monkeypatch.setattr(utils, "AUTH_TOKEN_MODE", "signed")
+    monkeypatch.setattr(utils, "token_signer", signer)
+    monkeypatch.setattr(authentication, "token_signer", signer)
+
+    request = await client.post(
+        "/sellers/",
+        json={
+            "name": "Vendedor Assinado",
+            "email": "signed@magic.com",
+            "password": "123456",
+        },
+    )
+    seller_id = request.json()["seller_id"]
+    old_token = request.json()["access_token"]
+    assert old_token.startswith("v1.")
+    assert await SellerAuth.filter(seller_id=seller_id).count() == 0
+
+    request = await client.get("/sellers/me", headers={"Seller-Authorization": f"Bearer {old_token}"})
+    assert request.status_code == 200
+    assert request.json()["email"] == "signed@magic.com"
+
+    # Novo login incrementa a época e revoga o token anterior
+    request = await client.post("/sellers/auth", json={"email": "signed@magic.com", "password": "123456"})
+    new_token = request.json()["access_token"]
+    request = await client.get("/sellers/me", headers={"Seller-Authorization": f"Bearer {old_token}"})
+    assert request.status_code == 403
+    request = await client.get("/sellers/me", headers={"Seller-Authorization": f"Bearer {new_token}"})
+    assert request.status_code == 200
+
+    # O mesmo token não vale no header de cliente
+    request = await client.get("/carts/current", headers={"Customer-Authorization": f"Bearer {new_token}"})
+    assert request.status_code == 403
+
+
+@pytest.mark.anyio
+async def test_login_should_upgrade_legacy_plaintext_password(client: AsyncClient):
+    from src.models import Seller
+    from src.passwords import is_hashed
+
+    seller = await Seller.create(name="Vendedor Legado", email="legacy@magic.com", password="123456")
+
+    request = await client.post("/sellers/auth", json={"email": "legacy@magic.com", "password": "errada"})
+    assert request.status_code == 401
+    await seller.refresh_from_db()
+    assert seller.password == "123456"
+
+    request = await client.post("/sellers/auth", json={"email": "legacy@magic.com", "password": "123456"})
+    assert request.status_code == 200
+    await seller.refresh_from_db()
+    assert is_hashed(seller.password)
+
+    # Login seguinte já usa o hash
+    request = await client.post("/sellers/auth", json={"email": "legacy@magic.com", "password": "123456"})
+    assert request.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_new_sellers_should_never_store_plaintext_passwords(client: AsyncClient):
+    from src.models import Seller
+
+    await client.post("/sellers/", json={"name": "Vendedor", "email": "hashed@magic.com", "password": "123456"})
+    seller = await Seller.get(email="hashed@magic.com")
+    assert seller.password != "123456"
+    request = await client.post("/sellers/auth", json={"email": "hashed@magic.com", "password": "123456"})
+    assert request.status_code == 200
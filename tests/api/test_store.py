@@ -31,4 +31,46 @@ async def test_should_create_store_with_seller(client: AsyncClient, get_authenti
     response_store_created = request.json()
     assert request.status_code == 200
     assert response_store_created["id"] == 1
-    assert response_store_created["name"] == "Magic Store"
\ No newline at end of file
+    assert response_store_created["name"] == "Magic Store"
+
+@pytest.mark.anyio
+async def test_invalid_store_credential_should_be_forbidden_and_negatively_cached(client: AsyncClient):
+    from src.auth_cache import store_cache
+
+    hits = store_cache.negative.hits
+    for _ in range(2):
+        request = await client.post(
+            "/customers/auth",
+            headers={"Store-Credential": "credencial-inexistente"},
+            json={"email": "guilherme@gmail.com", "password": "123456"},
+        )
+        assert request.status_code == 403
+        assert request.json()["detail"] == "Store credential is invalid"
+    assert store_cache.negative.hits == hits + 1
+
+
+@pytest.mark.anyio
+async def test_update_store_settings_should_invalidate_cached_store(client: AsyncClient,
+                            get_authenticated_seller_access_token: str,
+                            get_authenticated_store_credential: str):
+    headers = {
+        "Seller-Authorization": f"Bearer {get_authenticated_seller_access_token}",
+        "Store-Credential": get_authenticated_store_credential,
+    }
+    request = await client.get("/seller/admin/api/settings", headers=headers)
+    original_name = request.json()["name"]
+
+    request = await client.put("/seller/admin/api/settings", headers=headers, json={"name": "Magic Store Renomeada"})
+    assert request.status_code == 200
+    request = await client.get("/seller/admin/api/settings", headers=headers)
+    assert request.json()["name"] == "Magic Store Renomeada"
+
+    # Atualização inválida não altera a loja em cache
+    request = await client.put("/seller/admin/api/settings", headers=headers,
+                               json={"name": "Outro Nome", "commission_percentage": 150})
+    assert request.status_code == 400
+    request = await client.get("/seller/admin/api/settings", headers=headers)
+    assert request.json()["name"] == "Magic Store Renomeada"
+
+    request = await client.put("/seller/admin/api/settings", headers=headers, json={"name": original_name})
+    assert request.status_code == 200
@@ -1,8 +1,10 @@
+import httpx
 import pytest
 from asgi_lifespan import LifespanManager
 from dotenv import load_dotenv
 from httpx import AsyncClient, ASGITransport
 from src.application import create_application
+from src.integrations.maria_api.maria import MariaApi
 
 load_dotenv()
 
@@ -12,12 +14,51 @@ def anyio_backend():
     return "asyncio"
 
 
-@pytest.fixture(scope="session", autouse=True)
-async def client():
+@pytest.fixture(scope="session")
+async def app():
     app = create_application(fake_db=True)
     async with LifespanManager(app):
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
-            yield c
+        yield app
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def client(app):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def make_maria_client():
+    """
+    Cria um MariaApi que responde com um handler httpx.MockTransport (ou com um
+    app ASGI, como o stand-in, via asgi_app=):
+
+        maria_client = make_maria_client(handler, cache=MariaResponseCache())
+    """
+    def make(handler=None, *, asgi_app=None, **kwargs):
+        transport = httpx.ASGITransport(app=asgi_app) if asgi_app is not None else httpx.MockTransport(handler)
+        return MariaApi(base_endpoint="http://maria.test", transport=transport, **kwargs)
+    return make
+
+
+@pytest.fixture
+async def use_maria_client(app, make_maria_client):
+    """
+    Troca o cliente da Maria API da aplicação durante o teste; o original volta
+    no teardown:
+
+        maria_client = use_maria_client(handler)
+    """
+    original = app.state.maria_client
+
+    def use(handler, **kwargs):
+        app.state.maria_client = make_maria_client(handler, **kwargs)
+        return app.state.maria_client
+
+    yield use
+    if app.state.maria_client is not original:
+        await app.state.maria_client.aclose()
+    app.state.maria_client = original
 
 # create a fixture to authenticate customer
 @pytest.fixture(scope="session")
@@ -58,4 +99,51 @@ async def get_authenticated_store_credential(client: AsyncClient, get_authentica
         }
     )
     response_store_authenticated = request.json()
-    return response_store_authenticated['credential']
\ No newline at end of file
+    return response_store_authenticated['credential']
+
+
+@pytest.fixture
+def customer_headers(client: AsyncClient, get_authenticated_store_credential: str):
+    """
+    Cadastra um cliente na loja de teste e retorna (customer_id, headers):
+
+        customer_id, headers = await customer_headers("cliente@gmail.com")
+    """
+    async def create(email: str):
+        request = await client.post(
+            "/customers/",
+            headers={"Store-Credential": get_authenticated_store_credential},
+            json={"name": "Cliente", "email": email, "password": "123456"},
+        )
+        headers = {
+            "Customer-Authorization": f"Bearer {request.json()['access_token']}",
+            "Store-Credential": get_authenticated_store_credential,
+        }
+        return request.json()["customer_id"], headers
+    return create
+
+
+@pytest.fixture
+def capture_queries(monkeypatch):
+    """
+    Registra as consultas feitas na conexão padrão a partir da chamada:
+
+        queries = capture_queries()
+        ...
+        monkeypatch.undo()
+    """
+    def capture() -> list:
+        from tortoise import Tortoise
+
+        queries = []
+        connection = Tortoise.get_connection("default")
+        for method in ("execute_query", "execute_query_dict"):
+            original = getattr(connection, method)
+
+            async def record(query, values=None, _original=original):
+                queries.append(query)
+                return await _original(query, values)
+
+            monkeypatch.setattr(connection, method, record)
+        return queries
+    return capture
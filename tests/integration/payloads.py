@@ -0,0 +1,72 @@
+"""
+Payloads de exemplo da Maria API usados nos testes (formato original, camelCase).
+"""
+import copy
+
+
+PARK = {
+    "code": "bdab5664-ab6c-4cbd-817e-59a8c76b4dac",
+    "name": "Disney Orlando",
+    "description": "Walt Disney World Resort",
+    "images": {"cover": "https://i.imgur.com/2Nn9jYe.jpg", "thumbnail": "https://i.imgur.com/2Nn9jYe.jpg"},
+    "parklocation": {"city": "Orlando", "state": "FL"},
+    "attraction": "Magic Kingdom, EPCOT",
+    "status": True,
+    "translations": [],
+}
+
+PRODUCT = {
+    "code": "987cedca-559e-4b71-a00b-932c5208b846",
+    "ticketName": "1-Day Magic Kingdom",
+    "parkIncluded": "Magic Kingdom",
+    "parkLocation": {"city": "Orlando", "state": "FL"},
+    "isMultiDays": False,
+    "isParkToPark": False,
+    "isDated": True,
+    "isTimed": False,
+    "availableOptions": [],
+    "extensions": {"numberDays": 1, "usageWindow": 1, "numberParks": 1, "productKind": "ticket"},
+    "prices": {
+        "adult": {"original": {"amount": "150.00", "currency": "USD", "symbol": "$"},
+                  "usdbrl": {"amount": "800.00", "currency": "BRL", "symbol": "R$"}},
+        "child": {"original": {"amount": "140.00", "currency": "USD", "symbol": "$"},
+                  "usdbrl": {"amount": "750.00", "currency": "BRL", "symbol": "R$"}},
+        "total": {"original": {"amount": "290.00", "currency": "USD", "symbol": "$"},
+                  "usdbrl": {"amount": "1550.00", "currency": "BRL", "symbol": "R$"}},
+        "type": "per_person",
+    },
+    "isSpecial": False,
+    "translations": [],
+    "hasActivePromo": False,
+}
+
+PRODUCT_DETAIL = {
+    "code": PRODUCT["code"],
+    "ticketName": PRODUCT["ticketName"],
+    "parkIncluded": PRODUCT["parkIncluded"],
+    "parklocation": {"city": "Orlando", "state": "FL"},
+    "isMultiDays": False,
+    "isParkToPark": False,
+    "isDated": True,
+    "isTimed": False,
+    "availableOptions": [],
+    "extensions": {"days": 1, "parks": 1, "productKind": "ticket", "aboutTicket": "Acesso a 1 parque"},
+    "startingPrice": PRODUCT["prices"]["adult"],
+    "isSpecial": False,
+    "status": True,
+    "translations": [],
+}
+
+
+def make_product(code: str, amount: str = "800.00") -> dict:
+    product = copy.deepcopy(PRODUCT)
+    product["code"] = code
+    product["prices"]["adult"]["usdbrl"]["amount"] = amount
+    return product
+
+
+def make_product_detail(code: str, amount: str = "800.00") -> dict:
+    detail = copy.deepcopy(PRODUCT_DETAIL)
+    detail["code"] = code
+    detail["startingPrice"]["usdbrl"]["amount"] = amount
+    return detail
@@ -0,0 +1,55 @@
+import datetime
+import pytest
+from httpx import AsyncClient
+from src.auth_purge import purge_auth_tokens
+from src.models import SellerAuth
+from src.tokens import AUTH_TOKEN_EXPIRATION
+
+
+async def create_seller(client: AsyncClient, email: str) -> dict:
+    request = await client.post("/sellers/", json={"name": "Vendedor", "email": email, "password": "123456"})
+    return request.json()
+
+
+async def login(client: AsyncClient, email: str) -> str:
+    request = await client.post("/sellers/auth", json={"email": email, "password": "123456"})
+    return request.json()["access_token"]
+
+
+@pytest.mark.anyio
+async def test_login_should_only_invalidate_the_current_token(client: AsyncClient):
+    seller = await create_seller(client, "login@magic.com")
+    for _ in range(3):
+        await login(client, "login@magic.com")
+    statuses = await SellerAuth.filter(seller_id=seller["seller_id"]).order_by('id').values_list('status', flat=True)
+    assert statuses == ['invalidated', 'invalidated', 'invalidated', 'valid']
+
+
+@pytest.mark.anyio
+async def test_expired_token_should_be_rejected(client: AsyncClient):
+    seller = await create_seller(client, "expired@magic.com")
+    token = seller["access_token"]
+    expired_at = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=AUTH_TOKEN_EXPIRATION + 60)
+    await SellerAuth.filter(access_token=token).update(created_at=expired_at)
+
+    request = await client.get("/sellers/me", headers={"Seller-Authorization": f"Bearer {token}"})
+    assert request.status_code == 403
+
+
+@pytest.mark.anyio
+async def test_purge_should_remove_invalidated_and_expired_tokens_in_batches(client: AsyncClient):
+    seller = await create_seller(client, "purge@magic.com")
+    for _ in range(4):
+        token = await login(client, "purge@magic.com")
+    expired = await SellerAuth.create(seller_id=seller["seller_id"], access_token="expirado")
+    expired_at = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=AUTH_TOKEN_EXPIRATION + 60)
+    await SellerAuth.filter(id=expired.id).update(created_at=expired_at)
+
+    summary = await purge_auth_tokens(batch_size=2, pause=0)
+    assert summary["sellerauth"] >= 5
+    remaining = await SellerAuth.filter(seller_id=seller["seller_id"]).values_list('access_token', flat=True)
+    assert remaining == [token]
+    assert await SellerAuth.filter(status='invalidated').count() == 0
+
+    request = await client.get("/sellers/me", headers={"Seller-Authorization": f"Bearer {token}"})
+    assert request.status_code == 200
@@ -0,0 +1,52 @@
+import datetime
+import pytest
+from httpx import AsyncClient
+from src.cart_sweeper import CART_ABANDON_AFTER, sweep_abandoned_carts
+from src.models import Cart, CartItem, Product
+
+
+@pytest.mark.anyio
+async def test_sweep_should_abandon_idle_carts_and_purge_their_items(client: AsyncClient,
+                            get_authenticated_store_credential: str):
+    request = await client.post(
+        "/customers/",
+        headers={"Store-Credential": get_authenticated_store_credential},
+        json={"name": "Cliente", "email": "sweep@gmail.com", "password": "123456"},
+    )
+    customer_id = request.json()["customer_id"]
+    headers = {
+        "Customer-Authorization": f"Bearer {request.json()['access_token']}",
+        "Store-Credential": get_authenticated_store_credential,
+    }
+    product = await Product.create(store_id=1, name="Ingresso Sweep", description="", price=1000,
+                                   product_code="sweep", park_code="sweep-park")
+
+    idle_at = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=CART_ABANDON_AFTER + 60)
+    idle = []
+    for _ in range(3):
+        cart = await Cart.create(store_id=1, customer_id=customer_id, status='active')
+        await CartItem.create(cart=cart, product=product, amount=1, price=1000)
+        await Cart.filter(id=cart.id).update(updated_at=idle_at)
+        idle.append(cart.id)
+    closed = await Cart.create(store_id=1, customer_id=customer_id, status='closed')
+    await Cart.filter(id=closed.id).update(updated_at=idle_at)
+
+    # O carrinho ativo (em cache) é o mais antigo dos parados
+    request = await client.get("/carts/current", headers=headers)
+    assert request.json()["cart_empty"] is False
+
+    summary = await sweep_abandoned_carts(batch_size=2, pause=0)
+    assert summary == {"abandoned_carts": 3, "deleted_items": 3}
+    assert await Cart.filter(id__in=idle).values_list('status', flat=True) == ['abandoned'] * 3
+    assert await Cart.filter(id=closed.id).values_list('status', flat=True) == ['closed']
+    assert await CartItem.filter(cart_id__in=idle).count() == 0
+
+    request = await client.get("/carts/current", headers=headers)
+    assert request.json() == {"cart_empty": True, "items": []}
+
+    # Carrinho alterado recentemente continua ativo
+    request = await client.post("/carts/", headers=headers, json={"product_id": product.id, "amount": 1, "price": 1000})
+    assert request.status_code == 200
+    assert await sweep_abandoned_carts(batch_size=2, pause=0) == {"abandoned_carts": 0, "deleted_items": 0}
+    request = await client.get("/carts/current", headers=headers)
+    assert request.json()["items"][0]["amount"] == 1
@@ -0,0 +1,106 @@
+import httpx
+import pytest
+from src.models import CatalogPark, CatalogProduct
+from src.integrations.maria_api.mirror import CatalogMirror
+from src.integrations.maria_api.sync import CatalogSyncMetrics, sync_catalog
+from tests.integration.payloads import PARK, make_product, make_product_detail
+
+PARK_CODE = PARK["code"]
+
+
+def make_upstream(catalog: dict, calls: list):
+    async def handler(request: httpx.Request):
+        calls.append(request.url.path)
+        path = request.url.path.rstrip("/")
+        if path == "/parks":
+            return httpx.Response(200, json=[PARK])
+        if path == f"/parks/{PARK_CODE}":
+            return httpx.Response(200, json=PARK)
+        if path == f"/parks/{PARK_CODE}/products":
+            return httpx.Response(200, json=[make_product(code, amount) for code, amount in catalog.items()])
+        product_code = path.rsplit("/", 1)[-1]
+        if product_code in catalog:
+            return httpx.Response(200, json=make_product_detail(product_code, catalog[product_code]))
+        return httpx.Response(404, json={"detail": "not found"})
+
+    return handler
+
+
+@pytest.mark.anyio
+async def test_should_sync_catalog_writing_only_changed_rows(make_maria_client):
+    await CatalogPark.all().delete()
+    await CatalogProduct.all().delete()
+    catalog = {"product-a": "800.00", "product-b": "900.00"}
+    metrics = CatalogSyncMetrics()
+
+    async with make_maria_client(make_upstream(catalog, [])) as maria_client:
+        summary = await sync_catalog(maria_client, metrics)
+        assert summary["parks_created"] == 1
+        assert summary["products_created"] == 2
+        assert summary["details_updated"] == 2
+
+        # Nada mudou: nenhuma escrita
+        summary = await sync_catalog(maria_client, metrics)
+        assert sum(summary.values()) == 0
+
+        catalog["product-b"] = "950.00"
+        del catalog["product-a"]
+        summary = await sync_catalog(maria_client, metrics)
+        assert summary["products_updated"] == 1
+        assert summary["products_deleted"] == 1
+        assert summary["details_updated"] == 1
+
+    assert await CatalogProduct.filter(park_code=PARK_CODE).count() == 1
+    assert metrics.runs == 3
+    assert metrics.lag() is not None
+    assert metrics.last_duration is not None
+
+
+@pytest.mark.anyio
+async def test_should_serve_catalog_from_mirror_and_fall_back_to_upstream(make_maria_client):
+    await CatalogPark.all().delete()
+    await CatalogProduct.all().delete()
+    catalog = {"product-a": "800.00"}
+    async with make_maria_client(make_upstream(catalog, [])) as maria_client:
+        await sync_catalog(maria_client)
+
+    calls = []
+    async with make_maria_client(make_upstream(catalog, calls)) as maria_client:
+        maria_client.mirror = CatalogMirror()
+        parks = await maria_client.get_parks()
+        park = await maria_client.get_park(PARK_CODE)
+        products = await maria_client.get_park_products(PARK_CODE)
+        detail = await maria_client.get_park_product_detail(PARK_CODE, "product-a")
+        assert calls == []
+        assert parks[0].code == PARK_CODE
+        assert park.location.city == "Orlando"
+        assert products[0].prices.adult.usdbrl.amount == "800.00"
+        assert detail.starting_price.usdbrl.amount == "800.00"
+
+        # Listagem com data não está no espelho: vai à Maria API
+        await maria_client.get_park_products(PARK_CODE, for_date="2025-12-01")
+        assert calls == [f"/parks/{PARK_CODE}/products"]
+        assert maria_client.mirror.stats() == {"hits": 4, "misses": 0}
+
+
+@pytest.mark.anyio
+async def test_a_failing_park_shouldnt_stop_the_others(make_maria_client):
+    await CatalogPark.all().delete()
+    await CatalogProduct.all().delete()
+    parks = [dict(PARK, code="park-down"), PARK]
+
+    async def handler(request: httpx.Request):
+        path = request.url.path.rstrip("/")
+        if path == "/parks":
+            return httpx.Response(200, json=parks)
+        if path == "/parks/park-down/products":
+            return httpx.Response(503, json={"detail": "unavailable"})
+        if path == f"/parks/{PARK_CODE}/products":
+            return httpx.Response(200, json=[make_product("product-a", "800.00")])
+        return httpx.Response(200, json=make_product_detail("product-a", "800.00"))
+
+    async with make_maria_client(handler) as maria_client:
+        summary = await sync_catalog(maria_client)
+    assert summary["park_errors"] == 1
+    assert summary["products_created"] == 1
+    assert await CatalogProduct.filter(park_code=PARK_CODE).count() == 1
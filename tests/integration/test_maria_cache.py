@@ -0,0 +1,85 @@
+import asyncio
+import pytest
+from src.integrations.maria_api.cache import CachePolicy, MariaResponseCache, make_cache_key
+
+
+def make_cache(ttl=60, stale_ttl=60, max_entries=10, max_size=1024):
+    return MariaResponseCache({
+        'products': CachePolicy(ttl=ttl, stale_ttl=stale_ttl, max_entries=max_entries, max_size=max_size),
+    })
+
+
+def counting_loader(calls, value="payload", size=10):
+    async def load():
+        calls.append(1)
+        return f"{value}-{len(calls)}", size
+    return load
+
+
+def test_should_key_cache_by_endpoint_and_params():
+    key_a = make_cache_key("/parks/1/products", {"forDate": "2025-12-01", "numAdults": 2})
+    key_b = make_cache_key("/parks/1/products", {"numAdults": 2, "forDate": "2025-12-01"})
+    key_c = make_cache_key("/parks/1/products", {"numAdults": 3, "forDate": "2025-12-01"})
+    assert key_a == key_b
+    assert key_a != key_c
+
+
+@pytest.mark.anyio
+async def test_should_serve_fresh_entries_from_cache():
+    cache = make_cache()
+    calls = []
+    assert await cache.get_or_load('products', 'k', counting_loader(calls)) == "payload-1"
+    assert await cache.get_or_load('products', 'k', counting_loader(calls)) == "payload-1"
+    assert len(calls) == 1
+    stats = cache.stats()['families']['products']
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+
+
+@pytest.mark.anyio
+async def test_should_serve_stale_entry_while_refreshing():
+    cache = make_cache(ttl=0, stale_ttl=60)
+    calls = []
+    loader = counting_loader(calls)
+    assert await cache.get_or_load('products', 'k', loader) == "payload-1"
+    # Expirada: devolve o valor antigo e agenda refresh em background
+    assert await cache.get_or_load('products', 'k', loader) == "payload-1"
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert len(calls) == 2
+    assert cache.stats()['stale_hits'] == 1
+    assert cache.stats()['refreshes'] == 1
+    assert cache.caches['products'].get_entry('k').value == "payload-2"
+
+
+@pytest.mark.anyio
+async def test_should_keep_stale_entry_when_refresh_fails():
+    cache = make_cache(ttl=0, stale_ttl=60)
+    await cache.get_or_load('products', 'k', counting_loader([]))
+
+    async def failing_loader():
+        raise RuntimeError("upstream down")
+
+    assert await cache.get_or_load('products', 'k', failing_loader) == "payload-1"
+    await asyncio.sleep(0)
+    assert cache.stats()['refresh_errors'] == 1
+    assert cache.caches['products'].get_entry('k').value == "payload-1"
+
+
+@pytest.mark.anyio
+async def test_should_evict_least_recently_used_entries():
+    cache = make_cache(max_entries=2, max_size=25)
+    for key in ('a', 'b'):
+        await cache.get_or_load('products', key, counting_loader([], value=key))
+    await cache.get_or_load('products', 'a', counting_loader([]))  # 'a' passa a ser o mais recente
+    await cache.get_or_load('products', 'c', counting_loader([], value='c'))
+
+    products = cache.caches['products']
+    assert products.get_entry('b') is None
+    assert products.get_entry('a') is not None
+    assert products.stats()['evictions'] == 1
+
+    # Limite de memória: 10 + 20 > 25 bytes
+    await cache.get_or_load('products', 'd', counting_loader([], value='d', size=20))
+    assert products.size <= 25
+    assert products.stats()['evictions'] == 3
@@ -0,0 +1,59 @@
+import asyncio
+import httpx
+import pytest
+from src.integrations.maria_api.cache import MariaResponseCache
+from tests.integration.payloads import make_product
+
+
+class Upstream:
+    def __init__(self):
+        self.dates = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, request: httpx.Request):
+        for_date = request.url.params["forDate"]
+        self.dates.append(for_date)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if for_date == "2026-12-13":
+            return httpx.Response(503, json={"detail": "error"})
+        return httpx.Response(200, json=[make_product("product-1", "100.00")])
+
+
+def date_range(start: int, end: int):
+    return [f"2026-12-{day:02d}" for day in range(start, end + 1)]
+
+
+@pytest.mark.anyio
+async def test_should_fetch_dates_concurrently_with_bounded_concurrency(make_maria_client):
+    upstream = Upstream()
+    async with make_maria_client(upstream, cache=MariaResponseCache()) as maria_client:
+        results = await maria_client.get_park_products_calendar(
+            "park-1", date_range(1, 12), num_adults=2, concurrency=4,
+        )
+    assert list(results) == date_range(1, 12)
+    assert all(result[0]["code"] == "product-1" for result in results.values())
+    assert sorted(upstream.dates) == date_range(1, 12)
+    assert 1 < upstream.max_active <= 4
+
+
+@pytest.mark.anyio
+async def test_overlapping_calendars_should_reuse_cached_dates(make_maria_client):
+    upstream = Upstream()
+    async with make_maria_client(upstream, cache=MariaResponseCache()) as maria_client:
+        await maria_client.get_park_products_calendar("park-1", date_range(1, 10), num_adults=2)
+        await maria_client.get_park_products_calendar("park-1", date_range(5, 12), num_adults=2)
+    assert sorted(upstream.dates) == date_range(1, 12)
+
+
+@pytest.mark.anyio
+async def test_failed_dates_should_be_reported_without_failing_the_others(make_maria_client):
+    upstream = Upstream()
+    async with make_maria_client(upstream, cache=MariaResponseCache()) as maria_client:
+        results = await maria_client.get_park_products_calendar("park-1", date_range(12, 14))
+    assert isinstance(results["2026-12-13"], httpx.HTTPStatusError)
+    assert results["2026-12-12"][0]["code"] == "product-1"
+    assert results["2026-12-14"][0]["code"] == "product-1"
@@ -0,0 +1,61 @@
+import asyncio
+import httpx
+import pytest
+from tests.integration.payloads import PRODUCT
+
+
+def make_upstream(status_code=200):
+    calls = []
+
+    async def handler(request: httpx.Request):
+        calls.append(str(request.url))
+        await asyncio.sleep(0.05)
+        if status_code != 200:
+            return httpx.Response(status_code, json={"detail": "error"})
+        return httpx.Response(200, json=[PRODUCT])
+
+    return handler, calls
+
+
+@pytest.mark.anyio
+async def test_should_share_one_upstream_call_between_identical_requests(make_maria_client):
+    handler, calls = make_upstream()
+    maria_client = make_maria_client(handler)
+    async with maria_client:
+        results = await asyncio.gather(*[
+            maria_client.get_park_products("park-1", for_date="2025-12-01", num_adults=2)
+            for _ in range(100)
+        ])
+    assert len(calls) == 1
+    assert all(products[0].code == PRODUCT["code"] for products in results)
+    assert maria_client.inflight.stats()["shared"] == 99
+
+
+@pytest.mark.anyio
+async def test_shouldnt_coalesce_requests_with_different_params(make_maria_client):
+    handler, calls = make_upstream()
+    maria_client = make_maria_client(handler)
+    async with maria_client:
+        await asyncio.gather(
+            maria_client.get_park_products("park-1", for_date="2025-12-01"),
+            maria_client.get_park_products("park-1", for_date="2025-12-02"),
+        )
+    assert len(calls) == 2
+
+
+@pytest.mark.anyio
+async def test_should_propagate_errors_to_all_waiters_without_caching_them(make_maria_client):
+    handler, calls = make_upstream(status_code=503)
+    maria_client = make_maria_client(handler)
+    async with maria_client:
+        results = await asyncio.gather(*[
+            maria_client.get_park_products("park-1") for _ in range(10)
+        ], return_exceptions=True)
+        assert len(calls) == 1
+        assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+
+        # O erro não fica guardado: a próxima chamada vai de novo à Maria API
+        with pytest.raises(httpx.HTTPStatusError):
+            await maria_client.get_park_products("park-1")
+        assert len(calls) == 2
+    assert len(maria_client.inflight) == 0
@@ -0,0 +1,56 @@
+import copy
+import httpx
+import pytest
+from src.integrations.maria_api.cache import MariaResponseCache
+from tests.integration.payloads import PARK, PRODUCT
+
+TRANSLATIONS = [
+    {"language_code": language, "name": f"Ingresso ({language})", "description": "..."}
+    for language in ("pt", "en", "es")
+]
+
+
+def make_upstream(calls: list):
+    product = copy.deepcopy(PRODUCT)
+    product["translations"] = TRANSLATIONS
+    park = dict(PARK, translations=TRANSLATIONS)
+
+    async def handler(request: httpx.Request):
+        calls.append(request.url.path)
+        if request.url.path.endswith("/products"):
+            return httpx.Response(200, json=[product])
+        return httpx.Response(200, json=park)
+
+    return handler
+
+
+@pytest.mark.anyio
+async def test_should_parse_all_translations_by_default(make_maria_client):
+    async with make_maria_client(make_upstream([]), cache=MariaResponseCache()) as maria_client:
+        products = await maria_client.get_park_products("park-1")
+        park = await maria_client.get_park("park-1")
+    assert [t.language_code for t in products[0].translations] == ["pt", "en", "es"]
+    assert len(park.translations) == 3
+
+
+@pytest.mark.anyio
+async def test_should_keep_only_requested_language(make_maria_client):
+    calls = []
+    async with make_maria_client(make_upstream(calls), cache=MariaResponseCache()) as maria_client:
+        products = await maria_client.get_park_products("park-1", language="pt")
+        payload = await maria_client.get_park_products_payload("park-1", language="en")
+        park = await maria_client.get_park("park-1", language="es")
+        # O idioma é filtrado depois do cache: todos usam a mesma entrada
+        all_languages = await maria_client.get_park_products("park-1")
+        english = await maria_client.get_park_products("park-1", language="en")
+        all_payload = await maria_client.get_park_products_payload("park-1")
+
+    assert [t.language_code for t in products[0].translations] == ["pt"]
+    assert [t["language_code"] for t in payload[0]["translations"]] == ["en"]
+    assert [t.language_code for t in park.translations] == ["es"]
+    assert [t.language_code for t in english[0].translations] == ["en"]
+    # O valor em cache não é alterado pelo filtro
+    assert len(all_languages[0].translations) == 3
+    assert len(all_payload[0]["translations"]) == 3
+    # Uma chamada por requisição ao upstream (listagem: modelo e payload; parque)
+    assert len(calls) == 3
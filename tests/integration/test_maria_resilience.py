@@ -0,0 +1,225 @@
+import asyncio
+import time
+import httpx
+import pytest
+from src.integrations.maria_api.cache import CachePolicy, MariaResponseCache
+from src.integrations.maria_api.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceededError,
+    LatencyTracker,
+    deadline,
+    hedged,
+)
+from tests.integration.payloads import PARK
+
+
+class Upstream:
+    def __init__(self):
+        self.calls = 0
+        self.status_code = 200
+        self.delay = 0
+
+    async def __call__(self, request: httpx.Request):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, json={"detail": "error"})
+        if request.url.path.endswith("/products"):
+            return httpx.Response(200, json=[])
+        return httpx.Response(200, json=PARK)
+
+
+@pytest.mark.anyio
+async def test_circuit_should_open_after_consecutive_failures_and_fail_fast(make_maria_client):
+    upstream = Upstream()
+    upstream.status_code = 503
+    async with make_maria_client(upstream) as maria_client:
+        maria_client.breakers["park"] = CircuitBreaker("park", failure_threshold=3, recovery_timeout=60)
+        for _ in range(3):
+            with pytest.raises(httpx.HTTPStatusError):
+                await maria_client.get_park("park-1")
+
+        with pytest.raises(CircuitOpenError):
+            await maria_client.get_park("park-1")
+        assert upstream.calls == 3
+        assert maria_client.breaker("park").state == CircuitBreaker.OPEN
+
+        # Outras famílias não são afetadas
+        upstream.status_code = 200
+        await maria_client.get_park_products("park-1")
+
+
+@pytest.mark.anyio
+async def test_circuit_should_close_after_successful_half_open_probe(make_maria_client):
+    upstream = Upstream()
+    upstream.status_code = 503
+    async with make_maria_client(upstream) as maria_client:
+        breaker = maria_client.breakers["park"] = CircuitBreaker("park", failure_threshold=1, recovery_timeout=0.05)
+        with pytest.raises(httpx.HTTPStatusError):
+            await maria_client.get_park("park-1")
+        assert breaker.state == CircuitBreaker.OPEN
+
+        # Probe com falha reabre o circuito
+        await asyncio.sleep(0.06)
+        with pytest.raises(httpx.HTTPStatusError):
+            await maria_client.get_park("park-1")
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.opens == 2
+
+        await asyncio.sleep(0.06)
+        upstream.status_code = 200
+        park = await maria_client.get_park("park-1")
+        assert park.code == PARK["code"]
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_should_allow_limited_probes():
+    breaker = CircuitBreaker("park", failure_threshold=1, recovery_timeout=0, half_open_max_calls=1)
+    breaker.record_failure()
+    breaker.acquire()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+    breaker.release()
+    breaker.acquire()
+
+
+@pytest.mark.anyio
+async def test_client_errors_shouldnt_trip_the_circuit(make_maria_client):
+    upstream = Upstream()
+    upstream.status_code = 404
+    async with make_maria_client(upstream) as maria_client:
+        maria_client.breakers["park"] = CircuitBreaker("park", failure_threshold=2)
+        for _ in range(5):
+            with pytest.raises(httpx.HTTPStatusError):
+                await maria_client.get_park("unknown")
+        assert maria_client.breaker("park").state == CircuitBreaker.CLOSED
+    assert upstream.calls == 5
+
+
+@pytest.mark.anyio
+async def test_should_serve_last_known_good_while_upstream_is_down(make_maria_client):
+    upstream = Upstream()
+    policies = {"park": CachePolicy(ttl=0.01, stale_ttl=0.01, max_entries=10, max_size=1024 * 1024)}
+    async with make_maria_client(upstream, cache=MariaResponseCache(policies)) as maria_client:
+        maria_client.breakers["park"] = CircuitBreaker("park", failure_threshold=1, recovery_timeout=60)
+        await maria_client.get_park("park-1")
+
+        # Fora da janela stale e com o upstream fora: último valor bom
+        await asyncio.sleep(0.03)
+        upstream.status_code = 503
+        park = await maria_client.get_park("park-1")
+        assert park.code == PARK["code"]
+        assert maria_client.breaker("park").state == CircuitBreaker.OPEN
+
+        # Com o circuito aberto continua servindo sem ir ao upstream
+        calls = upstream.calls
+        await asyncio.sleep(0.03)
+        park = await maria_client.get_park("park-1")
+        assert park.code == PARK["code"]
+        assert upstream.calls == calls
+        assert maria_client.cache.fallback_hits == 2
+
+        # Sem valor conhecido o erro é propagado
+        with pytest.raises(CircuitOpenError):
+            await maria_client.get_park("park-2")
+
+
+@pytest.mark.anyio
+async def test_deadline_should_bound_the_request_without_tripping_on_a_short_remainder(make_maria_client):
+    upstream = Upstream()
+    upstream.delay = 0.5
+    async with make_maria_client(upstream, timeout_floor=0.1) as maria_client:
+        started = time.perf_counter()
+        with deadline(0.05):
+            with pytest.raises(DeadlineExceededError):
+                await maria_client.get_park("park-1")
+        assert time.perf_counter() - started < 0.3
+        # Sobrou menos que o piso: o prazo é que estava curto
+        assert maria_client.breaker("park").consecutive_failures == 0
+        assert maria_client.deadline_exceeded == 1
+
+        # Prazo já esgotado: nem chega a chamar o upstream
+        calls = upstream.calls
+        with deadline(0):
+            with pytest.raises(DeadlineExceededError):
+                await maria_client.get_park("park-2")
+        assert upstream.calls == calls
+
+
+@pytest.mark.anyio
+async def test_clipped_upstream_timeouts_should_open_the_circuit(make_maria_client):
+    upstream = Upstream()
+    upstream.delay = 0.5
+    # Prazo da requisição menor que o timeout por chamada, como em produção
+    async with make_maria_client(upstream, timeout=10, timeout_floor=0.05) as maria_client:
+        breaker = maria_client.breaker("park")
+        for i in range(breaker.failure_threshold):
+            with deadline(0.1):
+                with pytest.raises(DeadlineExceededError):
+                    await maria_client.get_park(f"park-{i}")
+        # A chamada compartilhada (single-flight) termina logo depois de quem esperava
+        await asyncio.sleep(0.05)
+        assert breaker.state == CircuitBreaker.OPEN
+
+        calls = upstream.calls
+        started = time.perf_counter()
+        with deadline(0.1):
+            with pytest.raises(CircuitOpenError):
+                await maria_client.get_park("park-x")
+        assert time.perf_counter() - started < 0.05
+        assert upstream.calls == calls
+
+
+@pytest.mark.anyio
+async def test_nested_deadlines_never_extend_the_outer_one(make_maria_client):
+    upstream = Upstream()
+    upstream.delay = 0.5
+    async with make_maria_client(upstream) as maria_client:
+        with deadline(0.05):
+            with deadline(10):
+                with pytest.raises(DeadlineExceededError):
+                    await maria_client.get_park("park-1")
+
+
+@pytest.mark.anyio
+async def test_should_hedge_slow_reads_after_p95_delay(make_maria_client):
+    calls = []
+
+    async def handler(request: httpx.Request):
+        calls.append(request.url.path)
+        # Só a primeira tentativa fica "presa"
+        if len(calls) == 1:
+            await asyncio.sleep(1)
+        return httpx.Response(200, json=PARK)
+
+    async with make_maria_client(handler, hedging=True) as maria_client:
+        maria_client.latencies["park"] = tracker = LatencyTracker()
+        for _ in range(30):
+            tracker.observe(0.01)
+
+        started = time.perf_counter()
+        park = await maria_client.get_park("park-1")
+        assert time.perf_counter() - started < 0.5
+        assert park.code == PARK["code"]
+        assert maria_client.hedges == 1
+        assert len(calls) == 2
+
+
+@pytest.mark.anyio
+async def test_hedged_should_propagate_error_when_all_attempts_fail():
+    async def fail():
+        await asyncio.sleep(0.02)
+        raise httpx.ConnectError("down")
+
+    with pytest.raises(httpx.ConnectError):
+        await hedged(fail, delay=0.01)
+
+
+@pytest.mark.anyio
+async def test_pool_limits_should_keep_explicit_zero(make_maria_client):
+    async with make_maria_client(Upstream(), max_connections=0, max_keepalive_connections=0) as maria_client:
+        assert maria_client.limits.max_connections == 0
+        assert maria_client.limits.max_keepalive_connections == 0
@@ -0,0 +1,134 @@
+import asyncio
+import random
+import time
+import httpx
+import pytest
+from scripts.maria_standin import (
+    FaultProfile,
+    StandinCatalog,
+    create_standin_app,
+    parse_latency,
+)
+from src.integrations.maria_api.cache import MariaResponseCache
+
+ENDPOINT = "http://maria.standin"
+
+
+def make_standin(faults: FaultProfile = None, **catalog):
+    catalog = StandinCatalog.synthetic(**{"parks": 2, "products_per_park": 10, **catalog})
+    return create_standin_app(catalog, faults)
+
+
+@pytest.mark.anyio
+async def test_should_serve_the_synthetic_catalog(make_maria_client):
+    app = make_standin()
+    maria_client = make_maria_client(asgi_app=app)
+    async with maria_client:
+        parks = await maria_client.get_parks()
+        assert len(parks) == 2
+
+        park = await maria_client.get_park(parks[0].code)
+        assert park.name == parks[0].name
+
+        products = await maria_client.get_park_products(park.code)
+        assert len(products) == 10
+
+        detail = await maria_client.get_park_product_detail(park.code, products[0].code)
+        assert detail.code == products[0].code
+        assert detail.starting_price.usdbrl.amount == products[0].prices.adult.usdbrl.amount
+    assert app.state.stats.requests == 4
+
+
+@pytest.mark.anyio
+async def test_should_vary_prices_by_params_deterministically(make_maria_client):
+    app = make_standin()
+    maria_client = make_maria_client(asgi_app=app)
+    async with maria_client:
+        park_code = app.state.catalog.parks[0]["code"]
+        first = await maria_client.get_park_products(park_code, for_date="2026-12-01")
+        again = await maria_client.get_park_products(park_code, for_date="2026-12-01")
+        base = await maria_client.get_park_products(park_code)
+    assert [p.prices.adult.usdbrl.amount for p in first] == [p.prices.adult.usdbrl.amount for p in again]
+    assert [p.code for p in first] == [p.code for p in base]
+
+
+@pytest.mark.anyio
+async def test_should_return_404_for_unknown_codes(make_maria_client):
+    app = make_standin()
+    maria_client = make_maria_client(asgi_app=app)
+    async with maria_client:
+        with pytest.raises(httpx.HTTPStatusError) as error:
+            await maria_client.get_park("unknown")
+    assert error.value.response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_should_inject_errors(make_maria_client):
+    app = make_standin(FaultProfile(error_rate=1.0, seed=1))
+    maria_client = make_maria_client(asgi_app=app)
+    async with maria_client:
+        with pytest.raises(httpx.HTTPStatusError) as error:
+            await maria_client.get_parks()
+    assert error.value.response.status_code in (500, 502, 503)
+    assert app.state.stats.errors == 1
+
+
+@pytest.mark.anyio
+async def test_should_inject_timeouts(make_maria_client):
+    app = make_standin(FaultProfile(timeout_rate=1.0, timeout_seconds=5, seed=1))
+    maria_client = make_maria_client(asgi_app=app)
+    async with maria_client:
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(maria_client.get_parks(), timeout=0.1)
+    assert app.state.stats.timeouts == 1
+
+
+@pytest.mark.anyio
+async def test_should_inject_latency(make_maria_client):
+    app = make_standin(FaultProfile(latency="fixed:50"))
+    maria_client = make_maria_client(asgi_app=app)
+    async with maria_client:
+        started = time.perf_counter()
+        await maria_client.get_parks()
+    assert time.perf_counter() - started >= 0.05
+
+
+@pytest.mark.anyio
+async def test_should_measure_upstream_calls_with_cache_and_coalescing(make_maria_client):
+    app = make_standin(FaultProfile(latency="fixed:20"))
+    maria_client = make_maria_client(asgi_app=app, cache=MariaResponseCache())
+    async with maria_client:
+        park_code = app.state.catalog.parks[0]["code"]
+        await asyncio.gather(*[
+            maria_client.get_park_products(park_code, for_date=f"2026-12-0{i % 3 + 1}")
+            for i in range(60)
+        ])
+        await maria_client.get_park_products(park_code, for_date="2026-12-01")
+    assert app.state.stats.requests == 3
+
+
+@pytest.mark.anyio
+async def test_should_update_faults_at_runtime():
+    app = make_standin()
+    async with httpx.AsyncClient(base_url=ENDPOINT, transport=httpx.ASGITransport(app=app)) as client:
+        r = await client.put("/_standin/faults", json={"error_rate": 1.0})
+        assert r.status_code == 200
+        assert (await client.get("/parks/")).status_code >= 500
+
+        r = await client.put("/_standin/faults", json={"latency": "bogus:1"})
+        assert r.status_code == 400
+
+        stats = (await client.get("/_standin/stats")).json()
+    assert stats["errors"] == 1
+
+
+def test_should_parse_latency_distributions():
+    rng = random.Random(1)
+    assert parse_latency("0")(rng) == 0
+    assert parse_latency("fixed:50")(rng) == 0.05
+    assert 0.02 <= parse_latency("uniform:20:200")(rng) <= 0.2
+    assert parse_latency("normal:100:20")(rng) >= 0
+    assert parse_latency("lognormal:4:0.5")(rng) > 0
+    assert parse_latency("exponential:80")(rng) >= 0
+    with pytest.raises(ValueError):
+        parse_latency("bogus:1")
@@ -0,0 +1,87 @@
+import json
+import time
+from types import SimpleNamespace
+import pytest
+from src.auth_cache import AccessTokenCache
+from src.invalidation import InvalidationBus, PostgresInvalidationBus
+
+
+def make_user(user_id=1):
+    return SimpleNamespace(id=user_id, name="Cliente")
+
+
+def test_should_return_cached_user_until_invalidated():
+    cache = AccessTokenCache(ttl=60, max_entries=100, bus=InvalidationBus())
+    user = make_user()
+    cache.put('customer', 'token-1', user, cache.snapshot())
+    assert cache.get('customer', 'token-1') is user
+    # Mesmo token em outro papel não é confundido
+    assert cache.get('seller', 'token-1') is None
+
+    cache.invalidate_local('customer', user.id)
+    assert cache.get('customer', 'token-1') is None
+
+
+def test_shouldnt_cache_result_resolved_before_a_concurrent_invalidation():
+    cache = AccessTokenCache(ttl=60, max_entries=100, bus=InvalidationBus())
+    user = make_user()
+    # Consulta ao banco começou antes do novo login
+    stamp = cache.snapshot()
+    cache.invalidate_local('customer', user.id)
+    cache.put('customer', 'old-token', user, stamp)
+    assert cache.get('customer', 'old-token') is None
+
+    cache.put('customer', 'new-token', user, cache.snapshot())
+    assert cache.get('customer', 'new-token') is user
+
+
+def test_pruning_revocations_should_invalidate_older_entries():
+    cache = AccessTokenCache(ttl=60, max_entries=2, bus=InvalidationBus())
+    user = make_user(10)
+    cache.put('seller', 'token', user, cache.snapshot())
+    for user_id in range(3):
+        cache.invalidate_local('seller', user_id)
+    assert cache.revocations.revoked == {}
+    assert cache.get('seller', 'token') is None
+
+
+@pytest.mark.anyio
+async def test_invalidate_user_should_reach_every_subscriber():
+    bus = InvalidationBus()
+    first = AccessTokenCache(ttl=60, bus=bus)
+    second = AccessTokenCache(ttl=60, bus=bus)
+    user = make_user(7)
+    for cache in (first, second):
+        cache.put('seller', 'token', user, cache.snapshot())
+
+    await first.invalidate_user('seller', user.id)
+    assert first.get('seller', 'token') is None
+    assert second.get('seller', 'token') is None
+    assert bus.stats()['published'] == 1
+
+
+def test_postgres_bus_should_apply_remote_messages_and_skip_its_own():
+    bus = PostgresInvalidationBus("postgres://unused")
+    cache = AccessTokenCache(ttl=60, bus=bus)
+    user = make_user(3)
+    cache.put('customer', 'token', user, cache.snapshot())
+
+    own = json.dumps({'origin': bus.origin, 'topic': 'auth_user', 'key': 'customer:3'})
+    bus._on_notify(None, 0, bus.channel, own)
+    assert cache.get('customer', 'token') is user
+
+    remote = json.dumps({'origin': 'other-worker', 'topic': 'auth_user', 'key': 'customer:3'})
+    bus._on_notify(None, 0, bus.channel, remote)
+    assert cache.get('customer', 'token') is None
+    assert bus.received == 1
+
+
+def test_put_should_never_outlive_the_given_ttl():
+    cache = AccessTokenCache(ttl=60, max_entries=100, bus=InvalidationBus())
+    user = make_user()
+    cache.put('customer', 'expiring', user, cache.snapshot(), ttl=0)
+    assert cache.get('customer', 'expiring') is None
+    cache.put('customer', 'long', user, cache.snapshot(), ttl=3600)
+    # Limitado pelo TTL do próprio cache
+    assert cache.cache.peek(('customer', 'long')).expires_at <= time.monotonic() + 60
+    assert cache.get('customer', 'long') is user
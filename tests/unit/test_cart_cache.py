@@ -0,0 +1,36 @@
+import pytest
+from src.cart_cache import CartCache, CartSnapshot
+from src.invalidation import InvalidationBus
+
+KEY = (1, 2)
+
+
+def test_shouldnt_replace_snapshot_with_an_older_version():
+    cache = CartCache(ttl=60, bus=InvalidationBus())
+    cache.put(KEY, CartSnapshot(10, 3, [{'product_id': 1}]), cache.snapshot())
+    cache.put(KEY, CartSnapshot(10, 2, []), cache.snapshot())
+    assert cache.get(KEY).version == 3
+    # Carrinho novo (id maior) substitui o anterior
+    cache.put(KEY, CartSnapshot(11, 0, []), cache.snapshot())
+    assert cache.get(KEY).cart_id == 11
+
+
+@pytest.mark.anyio
+async def test_remote_invalidation_should_discard_reads_started_before_it():
+    bus = InvalidationBus()
+    cache = CartCache(ttl=60, bus=bus)
+    stamp = cache.snapshot()
+    bus.dispatch('cart', '1:2')
+    cache.put(KEY, CartSnapshot(10, 3), stamp)
+    assert cache.get(KEY) is None
+
+    await cache.publish(KEY, CartSnapshot(10, 4))
+    assert cache.get(KEY).etag == '"10-4"'
+
+
+def test_response_shouldnt_share_items_with_the_cache():
+    snapshot = CartSnapshot(10, 1, [{'product_id': 1, 'amount': 1}])
+    response = snapshot.to_response()
+    response['items'][0]['amount'] = 99
+    assert snapshot.items[0]['amount'] == 1
+    assert CartSnapshot().to_response() == {'cart_empty': True, 'items': []}
@@ -0,0 +1,65 @@
+import asyncio
+import pytest
+from src.passwords import PasswordHasher, is_hashed
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(n=2 ** 10, r=8, p=1, workers=2)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.anyio
+async def test_should_hash_and_verify(hasher: PasswordHasher):
+    stored = await hasher.hash("senha123")
+    assert is_hashed(stored)
+    assert stored != await hasher.hash("senha123")
+    assert await hasher.verify("senha123", stored)
+    assert not await hasher.verify("senha124", stored)
+    assert not hasher.needs_rehash(stored)
+
+
+@pytest.mark.anyio
+async def test_should_accept_legacy_plaintext_and_ask_for_rehash(hasher: PasswordHasher):
+    assert await hasher.verify("123456", "123456")
+    assert not await hasher.verify("654321", "123456")
+    assert hasher.needs_rehash("123456")
+
+
+@pytest.mark.anyio
+async def test_should_rehash_when_cost_changes(hasher: PasswordHasher):
+    stored = await hasher.hash("senha123")
+    stronger = PasswordHasher(n=2 ** 11, r=8, p=1, workers=1)
+    try:
+        assert stronger.needs_rehash(stored)
+        # O hash antigo continua válido até ser refeito
+        assert await stronger.verify("senha123", stored)
+    finally:
+        stronger.shutdown()
+
+
+@pytest.mark.anyio
+async def test_unknown_user_should_fail_without_shortcut(hasher: PasswordHasher):
+    assert not await hasher.verify("senha123", None)
+    assert not await hasher.verify("senha123", "scrypt$corrompido")
+
+
+@pytest.mark.anyio
+async def test_hashing_shouldnt_block_the_event_loop():
+    hasher = PasswordHasher(n=2 ** 15, r=8, p=1, workers=2)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.001)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    try:
+        await asyncio.gather(*[hasher.hash("senha123") for _ in range(4)])
+    finally:
+        task.cancel()
+        hasher.shutdown()
+    assert ticks > 10
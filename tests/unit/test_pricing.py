@@ -0,0 +1,100 @@
+import random
+from decimal import Decimal
+import pytest
+from src.constants import PLATFORM_COMMISSION_PERCENTAGE
+from src.pricing import CommissionPricer, format_cents, parse_amount
+
+
+def legacy_price(amount: str, seller_commission: str) -> str:
+    base_price = Decimal(amount)
+    price_with_platform = base_price * (1 + PLATFORM_COMMISSION_PERCENTAGE / 100)
+    final_price = price_with_platform * (1 + Decimal(seller_commission) / 100)
+    return str(final_price.quantize(Decimal('0.01')))
+
+
+def test_should_match_decimal_pricing():
+    rng = random.Random(42)
+    for seller_commission in ("0", "0.50", "10.00", "12.35", "33.33", "100.00"):
+        pricer = CommissionPricer(Decimal(seller_commission))
+        amounts = [f"{rng.randint(0, 500000)}.{rng.randint(0, 99):02d}" for _ in range(2000)]
+        products = [{'prices': {'adult': {'usdbrl': {'amount': amount}}}} for amount in amounts]
+        CommissionPricer(Decimal(seller_commission)).reprice_products(products)
+        for amount, product in zip(amounts, products):
+            expected = legacy_price(amount, seller_commission)
+            assert pricer.reprice_amount(amount) == expected
+            assert product['prices']['adult']['usdbrl']['amount'] == expected
+
+
+def test_should_handle_amounts_with_any_scale():
+    pricer = CommissionPricer(Decimal("0"))
+    assert pricer.reprice_amount("100") == "120.00"
+    assert pricer.reprice_amount("0.125") == legacy_price("0.125", "0")
+    assert pricer.amount_to_cents("750.98") == 90118
+
+
+def test_should_reject_invalid_amounts():
+    for amount in ("", "abc", "1.2.3", "-", "1,00"):
+        with pytest.raises(ValueError):
+            parse_amount(amount)
+
+
+def test_should_format_cents():
+    assert format_cents(0) == "0.00"
+    assert format_cents(5) == "0.05"
+    assert format_cents(75098) == "750.98"
+    assert format_cents(-5) == "-0.05"
+
+
+def test_should_reprice_negative_amounts_like_decimal_pricing():
+    amounts = ["-0.04", "-0.05", "-1.00", "-750.98"]
+    products = [{'prices': {'adult': {'usdbrl': {'amount': amount}}}} for amount in amounts]
+    CommissionPricer(Decimal("0")).reprice_products(products)
+    for amount, product in zip(amounts, products):
+        assert product['prices']['adult']['usdbrl']['amount'] == legacy_price(amount, "0")
+
+
+def test_should_reject_commission_with_more_than_4_decimal_places():
+    assert CommissionPricer(Decimal("12.3456")).reprice_amount("100.00") == legacy_price("100.00", "12.3456")
+    with pytest.raises(ValueError):
+        CommissionPricer(Decimal("12.34567"))
+
+
+def test_should_reprice_product_list_in_one_pass():
+    products = [
+        {'prices': {price_type: {'usdbrl': {'amount': '100.00'}} for price_type in ('adult', 'child', 'total')}},
+        {'prices': None},
+    ]
+    CommissionPricer(Decimal("10.00")).reprice_products(products)
+    assert products[0]['prices']['adult']['usdbrl']['amount'] == "132.00"
+    assert products[0]['prices']['total']['usdbrl']['amount'] == "132.00"
+    assert products[0]['platform_commission'] == str(PLATFORM_COMMISSION_PERCENTAGE)
+    assert products[0]['seller_commission'] == "10.00"
+    assert 'seller_commission' not in products[1]
+
+
+def test_should_build_product_by_date_price_matrix():
+    pricer = CommissionPricer(Decimal('10.00'))
+
+    def listing(*items):
+        return [
+            {'code': code, 'ticket_name': code.upper(), 'extensions': {'number_days': 1},
+             'prices': {price_type: {'usdbrl': {'amount': amount}} for price_type in ('adult', 'child', 'total')}}
+            for code, amount in items
+        ]
+
+    dates = ['2026-12-01', '2026-12-02', '2026-12-03']
+    calendar = pricer.price_calendar(dates, {
+        '2026-12-01': listing(('a', '100.00'), ('b', '200.00')),
+        # 2026-12-02 ausente (falhou); 'c' só existe no dia 3
+        '2026-12-03': listing(('b', '210.00'), ('c', '50.00')),
+    })
+
+    assert calendar['dates'] == dates
+    assert [product['code'] for product in calendar['products']] == ['a', 'b', 'c']
+    assert calendar['prices']['adult'] == [
+        [pricer.reprice_amount('100.00'), None, None],
+        [pricer.reprice_amount('200.00'), None, pricer.reprice_amount('210.00')],
+        [None, None, pricer.reprice_amount('50.00')],
+    ]
+    assert calendar['prices']['child'] == calendar['prices']['adult']
+    assert calendar['seller_commission'] == '10.00'
@@ -0,0 +1,30 @@
+import pytest
+from src.tokens import TokenSigner, is_signed_token
+
+
+def test_should_roundtrip_claims():
+    signer = TokenSigner("segredo", expiration=60)
+    token = signer.issue('customer', 7, 3, epoch=2, now=1000)
+    assert is_signed_token(token)
+    claims = signer.verify(token, 'customer', now=1010)
+    assert claims == {'sub': 7, 'role': 'customer', 'sid': 3, 'exp': 1060, 'ep': 2}
+
+
+def test_should_reject_tampered_expired_or_foreign_tokens():
+    signer = TokenSigner("segredo", expiration=60)
+    token = signer.issue('customer', 7, 3, epoch=2, now=1000)
+    payload, signature = token[len('v1.'):].split('.')
+
+    forged = TokenSigner("outro-segredo").issue('customer', 7, 3, epoch=2, now=1000)
+    assert signer.verify(forged, 'customer', now=1010) is None
+    assert signer.verify(f"v1.{payload}x.{signature}", 'customer', now=1010) is None
+    assert signer.verify(token, 'customer', now=1060) is None
+    # Token de cliente não serve como token de vendedor
+    assert signer.verify(token, 'seller', now=1010) is None
+    assert signer.verify("550e8400-e29b-41d4-a716-446655440000", 'customer') is None
+    assert signer.verify("v1.sem-assinatura", 'customer') is None
+
+
+def test_should_require_a_secret():
+    with pytest.raises(ValueError):
+        TokenSigner("")